@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for skyscanner_travel
+"""
\ No newline at end of file
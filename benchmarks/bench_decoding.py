@@ -0,0 +1,88 @@
+"""Compare response decoding backends and transfer compression.
+
+For each payload size the current path (requests' ``Response.json()``,
+which decodes the body to text and parses it with the standard library) is
+timed against every installed decoder reading the bytes directly, both
+alone and followed by model construction. The transfer section shows what
+gzip and brotli save on the wire and cost to decompress.
+
+Usage:
+    python -m benchmarks.bench_decoding [--sizes 100 1000 10000] [--repeat 5]
+"""
+import argparse
+import gzip
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import requests
+from skyscanner_travel.models.flight import Flight
+from skyscanner_travel.models.location_response import LocationResponse
+from skyscanner_travel.services.decoding import DECODERS, brotli
+from .bench_parsing import best_of
+from .payloads import encode, synthetic_location_response, synthetic_search_response
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def backends() -> List[Tuple[str, Callable[[bytes], Any]]]:
+    """The current path first, then every installed decoder."""
+    current = ("Response.json()", lambda body: _response(body).json())
+    return [current] + [(name, loads) for name, loads in DECODERS.items() if loads is not None]
+
+
+def _flights(decoded: Dict[str, Any]) -> List[Flight]:
+    return Flight.parse_many(decoded)
+
+
+def _locations(decoded: Dict[str, Any]) -> LocationResponse:
+    return LocationResponse.from_search_airport(decoded)
+
+
+def compare(label: str, body: bytes, build: Callable[[Dict[str, Any]], Any], repeat: int, items: int) -> None:
+    baseline = None
+    for name, loads in backends():
+        decode = best_of(lambda _: loads(body), None, repeat)
+        total = best_of(lambda _: build(loads(body)), None, repeat)
+        baseline = baseline or total
+        print(f"{label:<16} {name:<16} {decode * 1000:>10.2f} {total * 1000:>12.2f} {items / total:>11,.0f} {baseline / total:>7.2f}x")
+
+
+def codecs() -> List[Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    available = [
+        ("gzip", lambda data: gzip.compress(data, 6), gzip.decompress),
+        ("deflate", lambda data: zlib.compress(data, 6), zlib.decompress),
+    ]
+    if brotli is not None:
+        available.append(("br", lambda data: brotli.compress(data, quality=5), brotli.decompress))
+    return available
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'payload':<16} {'decoder':<16} {'decode ms':>10} {'+models ms':>12} {'items/s':>11} {'speedup':>8}")
+    for size in args.sizes:
+        compare(f"search@{size}", encode(synthetic_search_response(size)), _flights, args.repeat, size)
+    compare("locations@50", encode(synthetic_location_response(50)), _locations, args.repeat * 10, 50)
+
+    print(f"\n{'payload':<16} {'encoding':<9} {'bytes':>12} {'ratio':>7} {'decompress ms':>14}")
+    for size in args.sizes:
+        body = encode(synthetic_search_response(size))
+        print(f"{f'search@{size}':<16} {'identity':<9} {len(body):>12,} {1:>7.1f} {0:>14.2f}")
+        for name, compress, decompress in codecs():
+            compressed = compress(body)
+            seconds = best_of(lambda _: decompress(compressed), None, args.repeat)
+            print(f"{'':<16} {name:<9} {len(compressed):>12,} {len(body) / len(compressed):>7.1f} {seconds * 1000:>14.2f}")
+    if brotli is None:
+        print("\n(brotli not installed: install brotli to negotiate and compare br)")
+
+
+if __name__ == "__main__":
+    main()
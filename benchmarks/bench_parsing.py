@@ -0,0 +1,68 @@
+"""Compare itinerary parsing paths on large searchFlights payloads.
+
+Usage:
+    python -m benchmarks.bench_parsing [--sizes 100 1000 10000] [--repeat 5]
+"""
+import argparse
+import gc
+import time
+from skyscanner_travel.models.flight import Flight
+from .payloads import synthetic_search_response
+
+
+def per_itinerary(response):
+    return [
+        Flight.from_api_response({"sessionId": response["sessionId"], "data": {"itineraries": [itinerary]}})
+        for itinerary in response["data"]["itineraries"]
+    ]
+
+
+def bulk(response):
+    return Flight.parse_many(response)
+
+
+def bulk_trusted(response):
+    return Flight.parse_many(response, trusted=True)
+
+
+PATHS = [
+    ("from_api_response", per_itinerary),
+    ("parse_many", bulk),
+    ("parse_many(trusted)", bulk_trusted),
+]
+
+
+def best_of(fn, response, repeat):
+    # Like timeit, keep the cyclic GC out of the measurement
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn(response)
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'itineraries':>11}  {'path':<20} {'seconds':>9} {'flights/s':>11} {'speedup':>8}")
+    for size in args.sizes:
+        response = synthetic_search_response(size)
+        assert bulk_trusted(response) == per_itinerary(response)
+        baseline = None
+        for name, fn in PATHS:
+            seconds = best_of(fn, response, args.repeat)
+            baseline = baseline or seconds
+            print(f"{size:>11}  {name:<20} {seconds:>9.4f} {size / seconds:>11,.0f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
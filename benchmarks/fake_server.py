@@ -0,0 +1,251 @@
+"""Local stand-in for the sky-scrapper API, for load and latency testing without spending quota.
+
+Serves v1/flights/searchAirport, v2/flights/searchFlights,
+v2/flights/searchIncomplete and v1/flights/getFlightDetails with payloads
+generated from the recorded stubs. Latency follows a configurable
+distribution, errors and 429s can be injected at random, and every
+response carries RapidAPI-style rate-limit headers backed by a real quota
+window. Successful responses are gzip-compressed when the client accepts it.
+
+Usage:
+    python -m benchmarks.fake_server [--port 8080] [--latency lognormal:0.08,0.5]
+                                     [--error-rate 0.01] [--throttle-rate 0.01]
+                                     [--quota 1000] [--window 60] [--itineraries 100]
+
+Point a client at it with ``SkyscannerClient(api_key, base_url="http://127.0.0.1:8080/api")``.
+"""
+import argparse
+import gzip
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from .payloads import encode, load_stub, synthetic_location_response, synthetic_search_response
+
+LatencyModel = Callable[[random.Random], float]
+
+
+def parse_latency(spec: str) -> LatencyModel:
+    """Parse a latency distribution.
+
+    Args:
+        spec (str): ``none``, ``fixed:SECONDS``, ``uniform:LOW,HIGH`` or
+            ``lognormal:MEDIAN,SIGMA`` (long-tailed, like real upstream latency)
+
+    Returns:
+        LatencyModel: Function drawing a delay in seconds from a Random
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+    if kind == "none":
+        return lambda rng: 0.0
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+class FakeSkyScrapper:
+    """In-process fake API server.
+
+    Example:
+        with FakeSkyScrapper(latency="fixed:0.02", error_rate=0.05) as server:
+            client = SkyscannerClient("key", base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "none",
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        quota: Optional[int] = None,
+        window: float = 60.0,
+        itineraries: int = 100,
+        places: int = 10,
+        seed: int = 0,
+        gzip_responses: bool = True
+    ):
+        """Configure the server; call start() or use it as a context manager.
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port)
+            latency (str): Latency distribution, see parse_latency()
+            error_rate (float): Fraction of requests answered with a 5xx
+            throttle_rate (float): Fraction of requests answered with a 429
+            quota (Optional[int]): Requests allowed per window before every
+                request gets a 429 (None for unlimited)
+            window (float): Quota window length in seconds
+            itineraries (int): Itineraries per searchFlights response
+            places (int): Places per searchAirport response
+            seed (int): Seed for latency, error and payload generation
+            gzip_responses (bool): Compress 200 responses when the client
+                sends ``Accept-Encoding: gzip``, like the real API
+        """
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.quota = quota
+        self.window = window
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._used = 0
+        self.requests: Dict[int, int] = {}
+
+        search = synthetic_search_response(itineraries, seed=seed)
+        complete = json.loads(json.dumps(search))
+        complete["data"]["context"]["status"] = "complete"
+        self.routes = {
+            "/api/v1/flights/searchAirport": encode(synthetic_location_response(places, seed=seed)),
+            "/api/v2/flights/searchFlights": encode(search),
+            "/api/v2/flights/searchIncomplete": encode(complete),
+            "/api/v1/flights/getFlightDetails": encode(load_stub("skyscanner_flight_details.json")),
+        }
+        self.gzipped = {path: gzip.compress(body, 6) for path, body in self.routes.items()} if gzip_responses else {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to the clients as ``base_url``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "FakeSkyScrapper":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-sky-scrapper", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeSkyScrapper":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def respond(self, path: str, api_key: Optional[str]) -> Tuple[int, Dict[str, str], bytes, float]:
+        """Decide the status, headers, body and delay for one request."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._used = 0
+            self._used += 1
+            used = self._used
+            reset = max(0, math.ceil(self._window_start + self.window - now))
+            roll = self._rng.random()
+            delay = self.latency(self._rng)
+
+        headers = {"Content-Type": "application/json"}
+        if self.quota is not None:
+            headers.update({
+                "x-ratelimit-requests-limit": str(self.quota),
+                "x-ratelimit-requests-remaining": str(max(0, self.quota - used)),
+                "x-ratelimit-requests-reset": str(reset),
+            })
+
+        if not api_key:
+            status, body = 403, b'{"message": "You are not subscribed to this API."}'
+        elif path not in self.routes:
+            status, body = 404, b'{"message": "Endpoint does not exist"}'
+        elif self.quota is not None and used > self.quota:
+            status, body = 429, b'{"message": "You have exceeded the rate limit per second for your plan."}'
+            headers["Retry-After"] = str(reset)
+        elif roll < self.throttle_rate:
+            status, body = 429, b'{"message": "Too many requests"}'
+            headers["Retry-After"] = "1"
+        elif roll < self.throttle_rate + self.error_rate:
+            status, body = 503, b'{"message": "Upstream unavailable"}'
+        else:
+            status, body = 200, self.routes[path]
+
+        with self._lock:
+            self.requests[status] = self.requests.get(status, 0) + 1
+        return status, headers, body, delay
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                status, headers, body, delay = server.respond(path, self.headers.get("x-rapidapi-key"))
+                if status == 200 and path in server.gzipped and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    headers["Content-Encoding"] = "gzip"
+                    body = server.gzipped[path]
+                if delay > 0:
+                    time.sleep(delay)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", default="lognormal:0.08,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--quota", type=int, default=None)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--itineraries", type=int, default=100)
+    parser.add_argument("--places", type=int, default=10)
+    parser.add_argument("--no-gzip", action="store_true", help="Never compress responses")
+    args = parser.parse_args(argv)
+
+    server = FakeSkyScrapper(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        quota=args.quota,
+        window=args.window,
+        itineraries=args.itineraries,
+        places=args.places,
+        gzip_responses=not args.no_gzip
+    )
+    print(f"Serving fake sky-scrapper API at {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure the cold import cost of the package's entry points.
+
+Each statement runs in a fresh interpreter with ``-X importtime``. The
+reported time is the sum of its top-level imports (interpreter startup
+excluded), taken as the median over several runs. The heavy third-party
+dependencies each statement loads are listed alongside it.
+
+Usage:
+    python -m benchmarks.import_time [--repeat 7] [--top 10]
+                                     [--statement "from skyscanner_travel import Location" ...]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+STATEMENTS = [
+    "import skyscanner_travel",
+    "from skyscanner_travel import Location",
+    "from skyscanner_travel import Flight",
+    "from skyscanner_travel.services import MemoryCache",
+    "from skyscanner_travel import LocationSearch",
+    "from skyscanner_travel import FlightSearch",
+    "from skyscanner_travel import AsyncFlightSearch, AsyncSkyscannerClient",
+]
+HEAVY_MODULES = ("pydantic", "requests", "httpx", "numpy", "dotenv", "asyncio")
+
+# Prints the heavy modules present after the statement ran
+_PROBE = "import sys, json; print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+
+
+class ImportResult(NamedTuple):
+    statement: str
+    seconds: float
+    loaded: List[str]
+    slowest: List[Tuple[str, float]]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse ``-X importtime`` output into ``(name, self_us, cumulative_us)`` rows.
+
+    Nested imports keep their indentation in ``name``.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if self_us.strip().isdigit():  # Skip the header line
+            rows.append((name[1:], int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _importtime(code: str) -> Tuple[str, str]:
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               capture_output=True, text=True, check=True)
+    return completed.stdout, completed.stderr
+
+
+def startup_modules() -> Set[str]:
+    """Modules the interpreter imports before running any code."""
+    return {name.strip() for name, _, _ in parse_importtime(_importtime("pass")[1])}
+
+
+def measure(statement: str, repeat: int, startup: Set[str]) -> ImportResult:
+    """Import ``statement`` cold ``repeat`` times and keep the median run."""
+    runs = []
+    for _ in range(repeat):
+        stdout, stderr = _importtime(f"{statement}; {_PROBE.format(modules=HEAVY_MODULES)}")
+        rows = [row for row in parse_importtime(stderr) if row[0].strip() not in startup]
+        # Top-level rows are unindented; their cumulative times cover everything
+        seconds = sum(cumulative for name, _, cumulative in rows if not name.startswith(" ")) / 1e6
+        slowest = sorted(((name.strip(), self_us / 1e6) for name, self_us, _ in rows), key=lambda m: m[1], reverse=True)
+        runs.append(ImportResult(statement, seconds, json.loads(stdout), slowest))
+    runs.sort(key=lambda run: run.seconds)
+    return runs[len(runs) // 2]
+
+
+def report(results: List[ImportResult], top: int) -> None:
+    width = max(len(r.statement) for r in results)
+    print(f"{'statement':<{width}} {'ms':>8}  heavy modules loaded")
+    for result in results:
+        print(f"{result.statement:<{width}} {result.seconds * 1000:>8.1f}  {', '.join(result.loaded) or '-'}")
+    if top:
+        slowest = results[-1]
+        print(f"\nSlowest modules (self time) for: {slowest.statement}")
+        for name, seconds in slowest.slowest[:top]:
+            print(f"  {seconds * 1000:>7.2f} ms  {name}")
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, float]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10, help="Show the slowest modules of the last statement")
+    parser.add_argument("--statement", action="append", help="Statement to time (repeatable; default: the package entry points)")
+    args = parser.parse_args(argv)
+
+    startup = startup_modules()
+    results = [measure(statement, args.repeat, startup) for statement in (args.statement or STATEMENTS)]
+    report(results, args.top)
+    return {result.statement: result.seconds for result in results}
+
+
+if __name__ == "__main__":
+    main()
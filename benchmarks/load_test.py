@@ -0,0 +1,186 @@
+"""Load-test the clients against the fake sky-scrapper server (or any compatible URL).
+
+Each mode sends the same number of requests through the full service stack
+(client, retries, JSON decoding, model building) and reports latency
+percentiles and throughput:
+
+    sync     one SkyscannerClient, one request at a time
+    threads  one shared SkyscannerClient driven by a thread pool
+    async    AsyncSkyscannerClient with bounded concurrency (requires httpx)
+
+Usage:
+    python -m benchmarks.load_test [--modes sync threads async] [--requests 200]
+                                   [--concurrency 16] [--endpoint search]
+                                   [--latency lognormal:0.05,0.5] [--error-rate 0.01]
+                                   [--url http://127.0.0.1:8080/api]
+
+Without --url an in-process FakeSkyScrapper is started with the given
+latency, error and throttling options.
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from skyscanner_travel.services.flight_search import FlightSearch, AsyncFlightSearch
+from skyscanner_travel.services.location_search import LocationSearch, AsyncLocationSearch
+from skyscanner_travel.services.retry import RetryPolicy
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from .fake_server import FakeSkyScrapper
+
+ROUTE = dict(origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="95673969", destination_entity_id="95673753")
+ENDPOINTS = ("search", "locations", "details")
+
+
+class LoadResult(NamedTuple):
+    mode: str
+    latencies: List[float]
+    errors: int
+    elapsed: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _search_date(i: int) -> str:
+    # Distinct dates keep identical in-flight requests from being coalesced
+    return (date(2025, 3, 1) + timedelta(days=i % 300)).isoformat()
+
+
+def _sync_calls(client: SkyscannerClient, endpoint: str) -> Callable[[int], Any]:
+    flights = FlightSearch(client)
+    if endpoint == "search":
+        return lambda i: flights.search(date=_search_date(i), **ROUTE)
+    if endpoint == "locations":
+        locations = LocationSearch(client=client)
+        return lambda i: locations.search(f"Las Vegas {i}")
+    flight = flights.search(date=_search_date(0), **ROUTE).flights[0]
+    return lambda i: flights.get_flight_details(flight)
+
+
+def _timed(call: Callable[[int], Any], i: int, latencies: List[float]) -> bool:
+    started = time.perf_counter()
+    try:
+        call(i)
+        return True
+    except Exception:
+        return False
+    finally:
+        latencies.append(time.perf_counter() - started)
+
+
+def run_sync(url: str, endpoint: str, requests: int, concurrency: int, retry_policy: RetryPolicy) -> LoadResult:
+    with SkyscannerClient("load-test", base_url=url, coalesce=False, retry_policy=retry_policy) as client:
+        call = _sync_calls(client, endpoint)
+        latencies: List[float] = []
+        started = time.perf_counter()
+        errors = sum(not _timed(call, i, latencies) for i in range(requests))
+        return LoadResult("sync", latencies, errors, time.perf_counter() - started)
+
+
+def run_threads(url: str, endpoint: str, requests: int, concurrency: int, retry_policy: RetryPolicy) -> LoadResult:
+    with SkyscannerClient("load-test", base_url=url, pool_maxsize=concurrency, coalesce=False, retry_policy=retry_policy) as client:
+        call = _sync_calls(client, endpoint)
+        latencies: List[float] = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(lambda i: _timed(call, i, latencies), range(requests)))
+        return LoadResult("threads", latencies, outcomes.count(False), time.perf_counter() - started)
+
+
+def run_async(url: str, endpoint: str, requests: int, concurrency: int, retry_policy: RetryPolicy) -> LoadResult:
+    from skyscanner_travel.services.async_client import AsyncSkyscannerClient
+
+    async def main() -> LoadResult:
+        async with AsyncSkyscannerClient("load-test", base_url=url, max_concurrency=concurrency,
+                                         coalesce=False, retry_policy=retry_policy) as client:
+            flights = AsyncFlightSearch(client)
+            if endpoint == "search":
+                call = lambda i: flights.search(date=_search_date(i), **ROUTE)
+            elif endpoint == "locations":
+                locations = AsyncLocationSearch(client=client)
+                call = lambda i: locations.search(f"Las Vegas {i}")
+            else:
+                flight = (await flights.search(date=_search_date(0), **ROUTE)).flights[0]
+                call = lambda i: flights.get_flight_details(flight)
+
+            latencies: List[float] = []
+            # Like the thread pool, time requests only once a worker slot is free
+            slots = asyncio.Semaphore(concurrency)
+
+            async def timed(i: int) -> bool:
+                async with slots:
+                    started = time.perf_counter()
+                    try:
+                        await call(i)
+                        return True
+                    except Exception:
+                        return False
+                    finally:
+                        latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            outcomes = await asyncio.gather(*(timed(i) for i in range(requests)))
+            return LoadResult("async", latencies, outcomes.count(False), time.perf_counter() - started)
+
+    return asyncio.run(main())
+
+
+MODES: Dict[str, Callable[..., LoadResult]] = {"sync": run_sync, "threads": run_threads, "async": run_async}
+
+
+def report(results: List[LoadResult]) -> None:
+    print(f"{'mode':<8} {'requests':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        print(f"{result.mode:<8} {len(result.latencies):>8} {result.errors:>7} {result.requests_per_second:>9.1f} "
+              + " ".join(f"{percentile(result.latencies, p) * 1000:>8.1f}" for p in (50, 95, 99)))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--endpoint", choices=ENDPOINTS, default="search")
+    parser.add_argument("--retries", type=int, default=1, help="Attempts per request (1 reports raw errors)")
+    parser.add_argument("--url", help="Use a running server instead of starting one")
+    parser.add_argument("--latency", default="lognormal:0.05,0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--itineraries", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    retry_policy = RetryPolicy(max_attempts=args.retries)
+    server = None
+    url = args.url
+    if url is None:
+        server = FakeSkyScrapper(
+            latency=args.latency,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            itineraries=args.itineraries
+        ).start()
+        url = server.url
+    try:
+        print(f"{args.requests} {args.endpoint} requests against {url} (concurrency {args.concurrency})\n")
+        report([MODES[mode](url, args.endpoint, args.requests, args.concurrency, retry_policy) for mode in args.modes])
+        if server is not None:
+            print(f"\nServer responses by status: {dict(sorted(server.requests.items()))}")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Synthetic API payloads for benchmarks, built from the recorded test stubs."""
+import copy
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+STUBS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "stubs")
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def load_stub(name: str) -> Dict[str, Any]:
+    """Load a recorded response from tests/stubs."""
+    with open(os.path.join(STUBS_DIR, name), "r") as f:
+        return json.load(f)
+
+
+def _shift(value: str, minutes: int) -> str:
+    return (datetime.strptime(value, TIME_FORMAT) + timedelta(minutes=minutes)).strftime(TIME_FORMAT)
+
+
+def _shift_leg(leg: Dict[str, Any], minutes: int) -> None:
+    leg["departure"] = _shift(leg["departure"], minutes)
+    leg["arrival"] = _shift(leg["arrival"], minutes)
+    for segment in leg["segments"]:
+        segment["departure"] = _shift(segment["departure"], minutes)
+        segment["arrival"] = _shift(segment["arrival"], minutes)
+
+
+def synthetic_search_response(itineraries: int, seed: int = 0) -> Dict[str, Any]:
+    """Build a searchFlights response with ``itineraries`` distinct itineraries.
+
+    Recorded itineraries are cycled as templates; each copy gets a unique id,
+    a random price and departure times shifted by up to a day, so timestamp
+    and price values are as varied as in real large result sets.
+    """
+    rng = random.Random(seed)
+    recorded = load_stub("skyscanner_flight_search.json")
+    templates = recorded["data"]["itineraries"]
+    generated = []
+    for i in range(itineraries):
+        itinerary = copy.deepcopy(templates[i % len(templates)])
+        itinerary["id"] = f"{itinerary['id']}-{i}"
+        itinerary["price"]["raw"] = round(rng.uniform(80, 1500), 2)
+        itinerary["price"]["formatted"] = f"${int(itinerary['price']['raw'])}"
+        shift = rng.randrange(0, 24 * 60, 5)
+        for leg in itinerary["legs"]:
+            _shift_leg(leg, shift)
+        generated.append(itinerary)
+    response = copy.deepcopy(recorded)
+    response["data"]["itineraries"] = generated
+    response["data"]["context"]["totalResults"] = itineraries
+    return response
+
+
+def synthetic_location_response(places: int, seed: int = 0) -> Dict[str, Any]:
+    """Build a searchAirport response with ``places`` distinct results.
+
+    Recorded results are cycled as templates with unique IDs and codes.
+    """
+    rng = random.Random(seed)
+    recorded = load_stub("skyscanner_location_search.json")
+    templates = recorded["data"]
+    generated = []
+    for i in range(places):
+        place = copy.deepcopy(templates[i % len(templates)])
+        entity_id = str(rng.randrange(10_000_000, 99_999_999))
+        place["entityId"] = place["navigation"]["entityId"] = entity_id
+        place["skyId"] = f"{place['skyId']}{i}"
+        generated.append(place)
+    response = copy.deepcopy(recorded)
+    response["data"] = generated
+    return response
+
+
+def encode(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload the way the API sends it."""
+    return json.dumps(payload).encode("utf-8")
@@ -0,0 +1,241 @@
+"""Benchmark the parsing and search paths and compare them with a stored baseline.
+
+Every case runs on synthetic payloads built from the recorded stubs in
+tests/stubs, at each requested size. Searches go through the full client
+stack (session, retries, JSON decoding, model building) against an
+in-process stub transport, so no network is involved.
+
+Usage:
+    python -m benchmarks.suite [--sizes 10 100 1000 10000] [--repeat 5]
+                               [--cases search ...] [--baseline PATH]
+                               [--save-baseline] [--tolerance 0.25]
+
+The exit status is 1 when a case is slower, or peaks higher in memory, than
+the baseline by more than the tolerance. Baselines are machine specific;
+record one with --save-baseline on the machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from skyscanner_travel.models.flight import Flight
+from skyscanner_travel.models.location_response import LocationResponse
+from skyscanner_travel.services.flight_search import FlightSearch
+from skyscanner_travel.services.location_search import LocationSearch
+from skyscanner_travel.services.airport_index import AirportIndex, build_index
+from skyscanner_travel.services.autocomplete import LocationAutocomplete
+from skyscanner_travel.services.skyscanner_client import normalize_locations
+from .bench_parsing import best_of, per_itinerary
+from .payloads import encode, load_stub, synthetic_location_response, synthetic_search_response
+from .transport import stub_client
+
+# Slowdowns smaller than this many seconds are treated as timer noise
+NOISE_FLOOR = 0.001
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+ROUTE = dict(
+    origin_sky_id="SDF",
+    destination_sky_id="LAS",
+    origin_entity_id="95673969",
+    destination_entity_id="95673753",
+    date="2025-03-30"
+)
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    sized: bool = True
+
+
+def _from_api_response(size: int) -> Callable[[], Any]:
+    response = synthetic_search_response(size)
+    return lambda: per_itinerary(response)
+
+
+def _parse_many(size: int) -> Callable[[], Any]:
+    response = synthetic_search_response(size)
+    return lambda: Flight.parse_many(response)
+
+
+def _search(size: int) -> Callable[[], Any]:
+    client = stub_client({"searchFlights": encode(synthetic_search_response(size))})
+    service = FlightSearch(client)
+    return lambda: service.search(**ROUTE)
+
+
+def _iter_search(size: int) -> Callable[[], Any]:
+    client = stub_client({"searchFlights": encode(synthetic_search_response(size))})
+    service = FlightSearch(client)
+    return lambda: list(service.iter_search(**ROUTE))
+
+
+def _search_locations(size: int) -> Callable[[], Any]:
+    client = stub_client({"searchAirport": encode(synthetic_location_response(size))})
+    return lambda: client.search_locations("Las Vegas")
+
+
+def _location_response(size: int) -> Callable[[], Any]:
+    normalized = normalize_locations(synthetic_location_response(size))
+    return lambda: LocationResponse.from_api_response(normalized)
+
+
+def _from_search_airport(size: int) -> Callable[[], Any]:
+    response = synthetic_location_response(size)
+    return lambda: LocationResponse.from_search_airport(response)
+
+
+def _location_search(size: int) -> Callable[[], Any]:
+    service = LocationSearch(client=stub_client({"searchAirport": encode(synthetic_location_response(size))}))
+    return lambda: service.search("Las Vegas")
+
+
+def _airport_index(size: int) -> Callable[[], Any]:
+    locations = LocationResponse.from_search_airport(synthetic_location_response(size)).locations
+    path = os.path.join(tempfile.mkdtemp(prefix="skyscanner-bench-"), "airports.idx")
+    build_index(locations, path)
+    index = AirportIndex(path)
+    codes = [location.code for location in locations]
+    return lambda: [index.get(code) for code in codes]
+
+
+def _autocomplete(size: int) -> Callable[[], Any]:
+    completer = LocationAutocomplete(LocationResponse.from_search_airport(synthetic_location_response(size)).locations)
+    # One keystroke per indexed location, typing "las vegas h" and a miss over and over
+    keystrokes = ["l", "la", "las", "las v", "las ve", "las veg", "las vega", "las vegas", "las vegas h", "zz"]
+    queries = [keystrokes[i % len(keystrokes)] for i in range(size)]
+    return lambda: [completer.complete(query) for query in queries]
+
+
+def _save_to_json(size: int) -> Callable[[], Any]:
+    response = FlightSearch(stub_client({"searchFlights": encode(synthetic_search_response(size))})).search(**ROUTE)
+    path = os.path.join(tempfile.mkdtemp(prefix="skyscanner-bench-"), "flights.json")
+    return lambda: response.save_to_json(path)
+
+
+def _flight_details(size: int) -> Callable[[], Any]:
+    client = stub_client({
+        "searchFlights": encode(synthetic_search_response(10)),
+        "getFlightDetails": encode(load_stub("skyscanner_flight_details.json")),
+    })
+    service = FlightSearch(client)
+    flight = service.search(**ROUTE).flights[0]
+    return lambda: service.get_flight_details(flight)
+
+
+CASES = [
+    Case("Flight.from_api_response", _from_api_response),
+    Case("Flight.parse_many", _parse_many),
+    Case("FlightSearch.search", _search),
+    Case("FlightSearch.iter_search", _iter_search),
+    Case("search_locations", _search_locations),
+    Case("LocationResponse.from_api_response", _location_response),
+    Case("LocationResponse.from_search_airport", _from_search_airport),
+    Case("LocationSearch.search", _location_search),
+    Case("AirportIndex.get", _airport_index),
+    Case("LocationAutocomplete.complete", _autocomplete),
+    Case("FlightSearchResponse.save_to_json", _save_to_json),
+    Case("FlightSearch.get_flight_details", _flight_details, sized=False),
+]
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    """Peak bytes allocated by Python while running ``fn`` once."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases: List[Case], sizes: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run every case at every size and return ``{"case@size": {...}}``."""
+    results = {}
+    for case in cases:
+        for size in (sizes if case.sized else [1]):
+            fn = case.setup(size)
+            fn()  # Warm up caches and lazy imports
+            seconds = best_of(lambda _: fn(), None, repeat)
+            results[f"{case.name}@{size}"] = {
+                "size": size,
+                "seconds": seconds,
+                "per_second": size / seconds if seconds else float("inf"),
+                "peak_bytes": peak_memory(fn),
+            }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Return the keys of results that regressed against the baseline."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        slower = (result["seconds"] > previous["seconds"] * (1 + tolerance)
+                  and result["seconds"] - previous["seconds"] > NOISE_FLOOR)
+        if slower or result["peak_bytes"] > previous["peak_bytes"] * (1 + tolerance):
+            regressions.append(key)
+    return regressions
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], regressions: List[str]) -> None:
+    print(f"{'case':<36} {'size':>6} {'seconds':>9} {'items/s':>11} {'peak MiB':>9} {'vs base':>8}")
+    for key, result in results.items():
+        name = key.rsplit("@", 1)[0]
+        previous = baseline.get(key)
+        ratio = f"{result['seconds'] / previous['seconds']:>7.2f}x" if previous else f"{'-':>8}"
+        flag = "  REGRESSION" if key in regressions else ""
+        print(f"{name:<36} {result['size']:>6} {result['seconds']:>9.4f} {result['per_second']:>11,.0f} "
+              f"{result['peak_bytes'] / 2 ** 20:>9.2f} {ratio}{flag}")
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    with open(path, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cases", nargs="+", help="Only run cases whose name contains one of these strings")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in CASES if not args.cases or any(part in c.name for part in args.cases)]
+    results = run(cases, args.sizes, args.repeat)
+    baseline = load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.tolerance)
+    report(results, baseline, regressions)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
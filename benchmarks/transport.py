@@ -0,0 +1,43 @@
+"""In-process stand-in for the HTTP transport, so benchmarks exercise the full client stack."""
+from typing import Dict
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class StubAdapter(BaseAdapter):
+    """Answer requests with canned bodies chosen by URL substring."""
+
+    def __init__(self, routes: Dict[str, bytes]):
+        super().__init__()
+        self.routes = routes
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        for fragment, body in self.routes.items():
+            if fragment in request.url:
+                break
+        else:
+            body = b'{"status": false, "message": "not found"}'
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Content-Length": str(len(body))})
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response._content = body
+        # Lets iter_content() serve the canned body for streamed requests
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+def stub_client(routes: Dict[str, bytes], **kwargs):
+    """Create a SkyscannerClient whose session answers from ``routes``."""
+    from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+    client = SkyscannerClient(api_key="benchmark", **kwargs)
+    adapter = StubAdapter(routes)
+    client.session.mount("https://", adapter)
+    client.session.mount("http://", adapter)
+    return client
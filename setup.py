@@ -6,8 +6,14 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.31.0",
-        "pydantic>=2.5.0",
+        "pydantic>=2.5.0,<2.15",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "table": ["numpy>=1.22"],
+        "otel": ["opentelemetry-api>=1.20"],
+        "fast": ["orjson>=3.9", "brotli>=1.0"],
+    },
     author="Your Name",
     author_email="your.email@example.com",
     description="A Python library for interacting with the Skyscanner API via RapidAPI",
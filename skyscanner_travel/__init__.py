@@ -1,16 +1,74 @@
-from .services.flight_search import FlightSearch
-from .services.location_search import LocationSearch
-from .models.location import Location
-from .models.location_response import LocationResponse
-from .models.flight import Flight
-from .models.flight_search_response import FlightSearchResponse
+"""Skyscanner travel API client.
+
+Public names are imported on first access (PEP 562), so ``import
+skyscanner_travel`` stays cheap: ``from skyscanner_travel import Location``
+loads only the models, and requests, httpx and numpy are imported when a
+service that needs them is first used.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .services.flight_search import FlightSearch, AsyncFlightSearch
+    from .services.location_search import LocationSearch, AsyncLocationSearch
+    from .services.async_client import AsyncSkyscannerClient
+    from .models.location import Location
+    from .models.location_response import LocationResponse
+    from .models.flight import Flight
+    from .models.flight_search_response import FlightSearchResponse
+    from .models.flight_query import FlightQuery, SearchResult, SearchUpdate
 
 __version__ = "0.1.0"
+
+# Public name -> module that defines it
+_LAZY = {
+    "FlightSearch": ".services.flight_search",
+    "AsyncFlightSearch": ".services.flight_search",
+    "LocationSearch": ".services.location_search",
+    "AsyncLocationSearch": ".services.location_search",
+    "AsyncSkyscannerClient": ".services.async_client",
+    "Location": ".models.location",
+    "LocationResponse": ".models.location_response",
+    "Flight": ".models.flight",
+    "FlightSearchResponse": ".models.flight_search_response",
+    "FlightQuery": ".models.flight_query",
+    "SearchResult": ".models.flight_query",
+    "SearchUpdate": ".models.flight_query",
+}
+_SUBMODULES = {"models", "services", "config"}
+
 __all__ = [
     "FlightSearch",
     "LocationSearch",
+    "AsyncFlightSearch",
+    "AsyncLocationSearch",
+    "AsyncSkyscannerClient",
     "Location",
     "LocationResponse",
     "Flight",
-    "FlightSearchResponse"
-]
\ No newline at end of file
+    "FlightSearchResponse",
+    "FlightQuery",
+    "SearchResult",
+    "SearchUpdate"
+]
+
+
+def _load(name: str, lazy: dict, package: str, namespace: dict) -> object:
+    """Import ``name`` from its module in ``lazy`` and cache it in ``namespace``."""
+    try:
+        module = lazy[name]
+    except KeyError:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, package), name)
+    namespace[name] = value
+    return value
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    return _load(name, _LAZY, __name__, globals())
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
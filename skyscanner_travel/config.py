@@ -1,5 +1,4 @@
 import os
-from dotenv import load_dotenv
 
 def get_api_key() -> str:
     """Get the Skyscanner API key from environment variables.
@@ -7,7 +6,9 @@ def get_api_key() -> str:
     Returns:
         str: The API key if found, empty string otherwise
     """
-    # Load environment variables from .env file
+    # Load environment variables from .env file (imported here to keep
+    # python-dotenv off the package import path)
+    from dotenv import load_dotenv
     load_dotenv()
 
     # Get API key from environment
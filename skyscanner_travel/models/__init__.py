@@ -1,6 +1,33 @@
-from .flight import Flight
-from .location import Location
-from .flight_search_response import FlightSearchResponse
-from .location_response import LocationResponse
+from typing import TYPE_CHECKING
+from .. import _load
 
-__all__ = ['Flight', 'Location', 'FlightSearchResponse', 'LocationResponse']
\ No newline at end of file
+if TYPE_CHECKING:
+    from .flight import Flight
+    from .location import Location
+    from .flight_search_response import FlightSearchResponse
+    from .location_response import LocationResponse
+    from .flight_query import FlightQuery, SearchResult, SearchUpdate, DetailsResult
+    from .flight_table import FlightTable
+
+# Models are imported on first access; FlightTable in particular pulls in numpy
+_LAZY = {
+    "Flight": ".flight",
+    "Location": ".location",
+    "FlightSearchResponse": ".flight_search_response",
+    "LocationResponse": ".location_response",
+    "FlightQuery": ".flight_query",
+    "SearchResult": ".flight_query",
+    "SearchUpdate": ".flight_query",
+    "DetailsResult": ".flight_query",
+    "FlightTable": ".flight_table",
+}
+
+__all__ = ['Flight', 'Location', 'FlightSearchResponse', 'LocationResponse', 'FlightQuery', 'SearchResult', 'SearchUpdate', 'DetailsResult', 'FlightTable']
+
+
+def __getattr__(name: str) -> object:
+    return _load(name, _LAZY, __name__, globals())
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,8 @@
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Iterable, Iterator
 from datetime import datetime
 from urllib.parse import quote
-from .location import Location
+from .location import Location, _construct
 
 class Price(BaseModel):
     amount: float
@@ -16,6 +16,139 @@ class Stop(BaseModel):
     airport: str
     duration: str
 
+def _format_duration(minutes: int) -> str:
+    hours = minutes // 60
+    minutes = minutes % 60
+    return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+
+
+_LOCATION_FIELDS_SET = {"entity_id", "code", "name", "type", "city_name", "region_name", "country_name"}
+
+
+class _ItineraryParser:
+    """Parses many itineraries from one searchFlights response.
+
+    Timestamps, their display formats, durations and airport Location objects
+    repeat heavily across itineraries, so each is built once and shared. In
+    trusted mode models are built with ``model_construct``, skipping pydantic
+    validation; every value is already converted to the field's type, so the
+    result is identical to a validated parse.
+    """
+
+    def __init__(self, session_id: str, trusted: bool = False):
+        self.session_id = session_id
+        self.trusted = trusted
+        self._times: Dict[str, Any] = {}
+        self._display: Dict[str, Dict[str, str]] = {}
+        self._durations: Dict[int, str] = {}
+        self._locations: Dict[str, Location] = {}
+
+    def time(self, value: str) -> datetime:
+        parsed = self._times.get(value)
+        if parsed is None:
+            # fromisoformat reads the API's "%Y-%m-%dT%H:%M:%S" timestamps much faster than strptime
+            parsed = self._times[value] = datetime.fromisoformat(value)
+        return parsed
+
+    def display(self, value: str) -> Dict[str, str]:
+        formatted = self._display.get(value)
+        if formatted is None:
+            parsed = self.time(value)
+            formatted = self._display[value] = {
+                "date": parsed.strftime("%A, %B %d"),
+                "time": parsed.strftime("%I:%M%p").lower(),
+                "iso": parsed.isoformat()
+            }
+        return formatted
+
+    def duration(self, minutes: int) -> str:
+        formatted = self._durations.get(minutes)
+        if formatted is None:
+            formatted = self._durations[minutes] = _format_duration(minutes)
+        return formatted
+
+    def location(self, place: Dict[str, Any]) -> Location:
+        key = place["entityId"]
+        location = self._locations.get(key)
+        if location is None:
+            values = dict(
+                entity_id=place["entityId"],
+                code=place["displayCode"],
+                name=place["name"],
+                type="AIRPORT",
+                city_name=place["city"],
+                region_name="",
+                country_name=place["country"]
+            )
+            if self.trusted:
+                values.update(distance_to_city_value=None, distance_to_city_unit=None)
+                location = _construct(Location, values, set(_LOCATION_FIELDS_SET))
+            else:
+                location = Location(**values)
+            self._locations[key] = location
+        return location
+
+    def stops(self, leg: Dict[str, Any]) -> List["Stop"]:
+        build = (lambda **values: _construct(Stop, values)) if self.trusted else Stop
+        stops = []
+        if leg["stopCount"] > 0:
+            segments = leg["segments"]
+            for current_segment, next_segment in zip(segments, segments[1:]):
+                layover = self.time(next_segment["departure"]) - self.time(current_segment["arrival"])
+                seconds = layover.total_seconds()
+                stop_hours = int(seconds // 3600)
+                stop_minutes = int((seconds % 3600) // 60)
+                stops.append(build(
+                    airport=current_segment["destination"]["displayCode"],
+                    city=current_segment["destination"]["parent"]["name"],
+                    duration=f"{stop_hours}h {stop_minutes}m" if stop_hours > 0 else f"{stop_minutes}m"
+                ))
+        return stops
+
+    def flight(self, cls: type, itinerary: Dict[str, Any]) -> "Flight":
+        first_leg = itinerary["legs"][0]
+        if not self.trusted:
+            return cls(**self.fields(itinerary, first_leg, Price))
+        _check_trusted_itinerary(itinerary, first_leg)
+        fields = self.fields(itinerary, first_leg, lambda **values: _construct(Price, values))
+        # Validation would copy these dicts; do the same so flights never share them
+        fields["departure"] = dict(fields["departure"])
+        fields["arrival"] = dict(fields["arrival"])
+        return _construct(cls, fields)
+
+    def fields(self, itinerary: Dict[str, Any], first_leg: Dict[str, Any], price: Any) -> Dict[str, Any]:
+        return dict(
+            id=itinerary["id"],
+            session_id=self.session_id,
+            airline=first_leg["carriers"]["marketing"][0]["name"],
+            flight_number=first_leg["segments"][0]["flightNumber"],
+            origin=self.location(first_leg["origin"]),
+            destination=self.location(first_leg["destination"]),
+            origin_city=first_leg["origin"]["city"],
+            destination_city=first_leg["destination"]["city"],
+            departure=self.display(first_leg["departure"]),
+            arrival=self.display(first_leg["arrival"]),
+            total_duration=self.duration(first_leg["durationInMinutes"]),
+            cabin_class="ECONOMY",
+            price=price(amount=float(itinerary["price"]["raw"]), currency="USD"),
+            stops=self.stops(first_leg),
+            booking_url=None
+        )
+
+
+def _check_trusted_itinerary(itinerary: Dict[str, Any], first_leg: Dict[str, Any]) -> None:
+    """Cheap structural check standing in for validation in trusted mode."""
+    segment = first_leg["segments"][0]
+    if not (
+        isinstance(itinerary["id"], str)
+        and isinstance(segment["flightNumber"], str)
+        and isinstance(first_leg["carriers"]["marketing"][0]["name"], str)
+        and isinstance(first_leg["origin"]["entityId"], str)
+        and isinstance(first_leg["destination"]["entityId"], str)
+    ):
+        raise ValueError(f"Unexpected itinerary structure for trusted parsing: {itinerary.get('id')!r}")
+
+
 class Flight(BaseModel):
     """Model representing a flight from Skyscanner."""
 
@@ -138,6 +271,46 @@ class Flight(BaseModel):
             booking_url=None  # No booking URL available in this response
         )
 
+    @classmethod
+    def parse_many(cls, response: Dict[str, Any], trusted: bool = False) -> List["Flight"]:
+        """Create Flight objects for every itinerary in a searchFlights response.
+
+        Produces the same flights as calling from_api_response once per
+        itinerary, but in a single pass: repeated timestamps, durations and
+        airports are parsed once and shared between flights.
+
+        Args:
+            response (Dict[str, Any]): Full searchFlights response with
+                ``sessionId`` and ``data.itineraries``
+            trusted (bool): Skip pydantic validation for payloads known to come
+                from the API, after a cheap structural check
+
+        Returns:
+            List[Flight]: One flight per itinerary, in response order
+        """
+        return list(cls.iter_parse(response["sessionId"], response["data"]["itineraries"], trusted=trusted))
+
+    @classmethod
+    def iter_parse(cls, session_id: str, itineraries: Iterable[Dict[str, Any]], trusted: bool = False) -> Iterator["Flight"]:
+        """Lazily create Flight objects from a stream of raw itineraries.
+
+        Like parse_many, but consumes ``itineraries`` one at a time, so it can
+        be fed straight from an incremental JSON parser.
+
+        Args:
+            session_id (str): The response's root ``sessionId``
+            itineraries (Iterable[Dict[str, Any]]): Raw ``data.itineraries`` entries
+            trusted (bool): Skip pydantic validation after a cheap structural check
+
+        Returns:
+            Iterator[Flight]: One flight per itinerary, in input order
+        """
+        if trusted and not isinstance(session_id, str):
+            raise ValueError("Unexpected response structure for trusted parsing: sessionId")
+        parser = _ItineraryParser(session_id, trusted=trusted)
+        for itinerary in itineraries:
+            yield parser.flight(cls, itinerary)
+
     @classmethod
     def from_api_detail_response(cls, response: Dict[str, Any]) -> "Flight":
         """Create a Flight object from the detailed API response.
@@ -0,0 +1,113 @@
+from typing import Iterable, List, Optional, Union
+from datetime import date as date_type, timedelta
+from pydantic import BaseModel, ConfigDict
+from .flight import Flight
+from .flight_response import FlightSearchResponse
+
+class FlightQuery(BaseModel):
+    """Parameters for a single flight search, used by batch searches."""
+
+    origin_sky_id: str
+    destination_sky_id: str
+    # Resolved from the sky IDs when not given
+    origin_entity_id: Optional[str] = None
+    destination_entity_id: Optional[str] = None
+    date: str
+    return_date: Optional[str] = None
+    adults: int = 1
+    children: int = 0
+    infants: int = 0
+    cabin_class: str = "economy"
+    currency: str = "USD"
+    market: str = "en-US"
+    country_code: str = "US"
+
+    @classmethod
+    def date_range(cls, start_date: Union[str, date_type], days: int, **route) -> List["FlightQuery"]:
+        """Build one query per departure date for the same route.
+
+        Args:
+            start_date (Union[str, date]): First departure date (YYYY-MM-DD)
+            days (int): Number of consecutive dates to search
+            **route: Remaining FlightQuery fields (sky IDs, entity IDs, passengers...)
+
+        Returns:
+            List[FlightQuery]: One query per date
+        """
+        if isinstance(start_date, str):
+            start_date = date_type.fromisoformat(start_date)
+        return [
+            cls(date=(start_date + timedelta(days=offset)).isoformat(), **route)
+            for offset in range(days)
+        ]
+
+    @classmethod
+    def route_matrix(cls, origins: Iterable[str], destinations: Iterable[str], date: str, **params) -> List["FlightQuery"]:
+        """Build one query per origin/destination pair, skipping same-airport pairs.
+
+        Entity IDs are left unset; FlightSearch.search_many resolves every
+        distinct sky ID of the matrix in one concurrent batch.
+
+        Args:
+            origins (Iterable[str]): Origin sky IDs
+            destinations (Iterable[str]): Destination sky IDs
+            date (str): Departure date (YYYY-MM-DD)
+            **params: Remaining FlightQuery fields (passengers, currency...)
+
+        Returns:
+            List[FlightQuery]: One query per route, origins in the outer loop
+        """
+        destinations = list(destinations)
+        return [
+            cls(origin_sky_id=origin, destination_sky_id=destination, date=date, **params)
+            for origin in origins
+            for destination in destinations
+            if origin.upper() != destination.upper()
+        ]
+
+
+class SearchResult(BaseModel):
+    """Outcome of one query in a batch search: either a response or an error."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    query: FlightQuery
+    response: Optional[FlightSearchResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class SearchUpdate(BaseModel):
+    """Itineraries that appeared or changed price in one poll of a search.
+
+    ``poll`` is 0 for the initial search response. ``total_results`` counts
+    distinct itineraries seen so far across all polls.
+    """
+
+    poll: int
+    new: List[Flight] = []
+    repriced: List[Flight] = []
+    complete: bool
+    total_results: int
+
+    @property
+    def flights(self) -> List[Flight]:
+        """New and re-priced flights together."""
+        return self.new + self.repriced
+
+
+class DetailsResult(BaseModel):
+    """Outcome of one flight details lookup: either the details or an error."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    flight: Flight
+    details: Optional[Flight] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -1,5 +1,5 @@
-from typing import List, Dict, Optional
-from pydantic import BaseModel
+from typing import Any, List, Dict, Optional, Union
+from pydantic import BaseModel, PrivateAttr
 import json
 from .flight import Flight
 
@@ -10,10 +10,24 @@ class FlightSearchResponse(BaseModel):
     market: str
     locale: str
     country_code: str
+    _details_prefetch: Any = PrivateAttr(default=None)
+
+    @property
+    def prefetched_details(self) -> Optional[Union["DetailsPrefetch", "AsyncDetailsPrefetch"]]:
+        """Details lookups started by ``search(prefetch_details=N)``, if any.
+
+        An AsyncDetailsPrefetch when the search ran on AsyncFlightSearch.
+        """
+        return self._details_prefetch
 
     def __str__(self) -> str:
         return f"Found {self.total_results} flights"
 
+    def to_table(self) -> "FlightTable":
+        """Return a columnar FlightTable over these flights (requires numpy)."""
+        from .flight_table import FlightTable
+        return FlightTable.from_flights(self.flights)
+
     def print_results(self) -> None:
         print(f"\nFound {self.total_results} flights:")
         for i, flight in enumerate(self.flights, 1):
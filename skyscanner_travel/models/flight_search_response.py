@@ -13,6 +13,11 @@ class FlightSearchResponse(BaseModel):
     def __str__(self) -> str:
         return f"{len(self.flights)} flights found"
 
+    def to_table(self) -> "FlightTable":
+        """Return a columnar FlightTable over these flights (requires numpy)."""
+        from .flight_table import FlightTable
+        return FlightTable.from_flights(self.flights)
+
     def print_results(self) -> None:
         print("\nAvailable Flights:")
         print("=" * 50 + "\n")
@@ -0,0 +1,243 @@
+import re
+from datetime import datetime, time as time_type
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from .flight import Flight
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+_DURATION = re.compile(r"(?:(\d+)h\s*)?(\d+)m")
+
+# Dictionary-encoded string columns and where their values come from
+_CATEGORIES = {
+    "airline": lambda flight: flight.airline,
+    "origin": lambda flight: flight.origin.code,
+    "destination": lambda flight: flight.destination.code,
+}
+_SORTABLE = ("price", "departure", "arrival", "duration", "stops") + tuple(_CATEGORIES)
+
+
+def _duration_minutes(value: str) -> int:
+    match = _DURATION.search(value or "")
+    if not match:
+        return -1
+    return int(match.group(1) or 0) * 60 + int(match.group(2))
+
+
+def _encode(values: List[str]) -> "tuple":
+    """Dictionary-encode strings into (codes, categories)."""
+    categories: Dict[str, int] = {}
+    codes = np.fromiter((categories.setdefault(v, len(categories)) for v in values), dtype=np.int32, count=len(values))
+    return codes, list(categories)
+
+
+class FlightTable:
+    """Columnar, NumPy-backed view over a list of flights.
+
+    Columns:
+        price (float64), departure / arrival (datetime64[s] of the local
+        timestamps), duration (int32 minutes), stops (int16), and the
+        dictionary-encoded string columns airline, origin and destination
+        (int32 codes into a shared category list).
+
+    Filtering, sorting, group-by-min and top-k are vectorized and return new
+    tables sharing the same source flights; Flight objects are only handed
+    back when rows are materialized (iteration, ``row()``, ``to_flights()``).
+    """
+
+    def __init__(self, flights: Sequence[Flight], columns: Dict[str, Any], categories: Dict[str, List[str]], rows: Any):
+        self._flights = flights
+        self._columns = columns
+        self._categories = categories
+        self._rows = rows
+
+    @classmethod
+    def from_flights(cls, flights: Sequence[Flight]) -> "FlightTable":
+        """Build a table from Flight objects.
+
+        Args:
+            flights (Sequence[Flight]): Flights to index
+
+        Returns:
+            FlightTable: Table with one row per flight
+        """
+        if np is None:
+            raise ImportError("FlightTable requires numpy. Install it with: pip install skyscanner-travel[table]")
+        flights = list(flights)
+        count = len(flights)
+        columns = {
+            "price": np.fromiter((f.price.amount for f in flights), dtype=np.float64, count=count),
+            "departure": np.array([f.departure.get("iso", "NaT") for f in flights], dtype="datetime64[s]"),
+            "arrival": np.array([f.arrival.get("iso", "NaT") for f in flights], dtype="datetime64[s]"),
+            "duration": np.fromiter((_duration_minutes(f.total_duration) for f in flights), dtype=np.int32, count=count),
+            "stops": np.fromiter((len(f.stops) for f in flights), dtype=np.int16, count=count),
+        }
+        categories = {}
+        for name, value in _CATEGORIES.items():
+            columns[name], categories[name] = _encode([value(f) for f in flights])
+        return cls(flights, columns, categories, np.arange(count))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Flight]:
+        return (self._flights[i] for i in self._rows)
+
+    def __repr__(self) -> str:
+        return f"FlightTable({len(self)} flights)"
+
+    def __getitem__(self, column: str) -> Any:
+        """Return a column for the rows in this table.
+
+        String columns are returned decoded as an object array; use
+        ``codes(column)`` for the raw dictionary codes.
+        """
+        values = self._columns[column][self._rows]
+        if column in self._categories:
+            return np.asarray(self._categories[column], dtype=object)[values]
+        return values
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def codes(self, column: str) -> Any:
+        """Return the dictionary codes of a string column."""
+        return self._columns[column][self._rows]
+
+    def categories(self, column: str) -> List[str]:
+        """Return the category list that a string column's codes index into."""
+        return list(self._categories[column])
+
+    def row(self, index: int) -> Flight:
+        """Materialize the Flight at ``index`` in this table's order."""
+        return self._flights[self._rows[index]]
+
+    def to_flights(self) -> List[Flight]:
+        """Materialize every row as a Flight, in table order."""
+        return [self._flights[i] for i in self._rows]
+
+    def _take(self, positions: Any) -> "FlightTable":
+        return FlightTable(self._flights, self._columns, self._categories, self._rows[positions])
+
+    def filter(self, mask: Any) -> "FlightTable":
+        """Keep the rows where a boolean mask (aligned with this table) is true."""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != self._rows.shape:
+            raise ValueError("Mask length does not match table length")
+        return self._take(np.flatnonzero(mask))
+
+    def where(
+        self,
+        max_price: Optional[float] = None,
+        max_stops: Optional[int] = None,
+        max_duration: Optional[int] = None,
+        departs_after: Optional[Union[datetime, time_type]] = None,
+        departs_before: Optional[Union[datetime, time_type]] = None,
+        airline: Optional[str] = None,
+        origin: Optional[str] = None,
+        destination: Optional[str] = None
+    ) -> "FlightTable":
+        """Filter on common criteria; all given conditions must hold.
+
+        Args:
+            max_price (Optional[float]): Maximum price (inclusive)
+            max_stops (Optional[int]): Maximum number of stops (inclusive)
+            max_duration (Optional[int]): Maximum duration in minutes (inclusive)
+            departs_after (Optional[Union[datetime, time]]): Earliest departure
+                (inclusive); a ``time`` compares against the time of day
+            departs_before (Optional[Union[datetime, time]]): Latest departure
+                (inclusive); a ``time`` compares against the time of day
+            airline (Optional[str]): Airline name
+            origin (Optional[str]): Origin airport code
+            destination (Optional[str]): Destination airport code
+
+        Returns:
+            FlightTable: Matching rows, in the current order
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if max_price is not None:
+            mask &= self["price"] <= max_price
+        if max_stops is not None:
+            mask &= self["stops"] <= max_stops
+        if max_duration is not None:
+            mask &= self["duration"] <= max_duration
+        if departs_after is not None:
+            mask &= self._departure_key(departs_after) >= _time_key(departs_after)
+        if departs_before is not None:
+            mask &= self._departure_key(departs_before) <= _time_key(departs_before)
+        for column, value in (("airline", airline), ("origin", origin), ("destination", destination)):
+            if value is not None:
+                try:
+                    code = self._categories[column].index(value)
+                except ValueError:
+                    return self._take(np.array([], dtype=np.intp))
+                mask &= self.codes(column) == code
+        return self.filter(mask)
+
+    def _departure_key(self, bound: Union[datetime, time_type]) -> Any:
+        departure = self["departure"]
+        if isinstance(bound, time_type):
+            # Seconds since local midnight
+            return (departure - departure.astype("datetime64[D]")).astype(np.int64)
+        return departure.astype(np.int64)
+
+    def _sort_key(self, by: str) -> Any:
+        """Numeric ordering key for a column; strings rank by decoded value."""
+        if by not in _SORTABLE:
+            raise ValueError(f"Cannot sort by {by!r}")
+        values = self.codes(by)
+        if by in self._categories:
+            order = np.argsort(np.asarray(self._categories[by], dtype=object), kind="stable")
+            ranks = np.empty(len(order), dtype=np.int64)
+            ranks[order] = np.arange(len(order))
+            return ranks[values]
+        if values.dtype.kind == "M":
+            return values.astype(np.int64)
+        return values
+
+    def sort(self, by: str = "price", descending: bool = False) -> "FlightTable":
+        """Return the rows sorted by a column (stable in both directions)."""
+        values = self._sort_key(by)
+        return self._take(np.argsort(-values if descending else values, kind="stable"))
+
+    def top_k(self, k: int, by: str = "price", largest: bool = False) -> "FlightTable":
+        """Return the ``k`` rows with the smallest (or largest) values, sorted.
+
+        Ties are broken by the table's current order.
+        """
+        values = self._sort_key(by)
+        if largest:
+            values = -values
+        k = min(k, len(self))
+        if k <= 0:
+            return self._take(np.array([], dtype=np.intp))
+        # Everything below the k-th value, then ties at the k-th value in table order
+        kth = np.partition(values, k - 1)[k - 1]
+        below = np.flatnonzero(values < kth)
+        ties = np.flatnonzero(values == kth)[:k - len(below)]
+        candidates = np.concatenate((below, ties))
+        return self._take(candidates[np.argsort(values[candidates], kind="stable")])
+
+    def group_min(self, by: str = "airline", value: str = "price") -> "FlightTable":
+        """Return the row with the minimum ``value`` for each distinct ``by``.
+
+        For example ``group_min("airline", "price")`` gives the cheapest
+        flight per airline. Rows come back ordered by ``value``.
+        """
+        groups = self.codes(by)
+        values = self._sort_key(value)
+        if not len(self):
+            return self
+        order = np.lexsort((values, groups))
+        _, first = np.unique(groups[order], return_index=True)
+        winners = order[first]
+        return self._take(winners[np.argsort(values[winners], kind="stable")])
+
+
+def _time_key(bound: Union[datetime, time_type]) -> int:
+    if isinstance(bound, time_type):
+        return bound.hour * 3600 + bound.minute * 60 + bound.second
+    return int(np.datetime64(bound.replace(tzinfo=None), "s").astype(np.int64))
@@ -1,6 +1,24 @@
 from typing import Dict, Optional, Any
 from pydantic import BaseModel, Field, ConfigDict
 
+
+def _construct(cls: type, values: Dict[str, Any], fields_set: Optional[set] = None) -> Any:
+    """Build a model from already-typed values, like ``model_construct``.
+
+    ``values`` must hold every field of ``cls`` (defaults included). Skips the
+    per-field alias and default handling that makes ``model_construct``
+    slower than validation for small models. It fills pydantic's instance
+    slots directly, which is why setup.py caps the pydantic minor version;
+    test_construct_fills_every_pydantic_slot guards the layout.
+    """
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values) if fields_set is None else fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
 class Location(BaseModel):
     """Model representing a location (airport, city) from the API."""
     model_config = ConfigDict(populate_by_name=True)
@@ -16,8 +34,12 @@ class Location(BaseModel):
     distance_to_city_unit: Optional[str] = None
 
     @classmethod
-    def from_api_response(cls, data: Dict[str, Any]) -> Optional["Location"]:
-        """Create a Location instance from API response data."""
+    def from_api_response(cls, data: Dict[str, Any], trusted: bool = False) -> Optional["Location"]:
+        """Create a Location instance from API response data.
+
+        With ``trusted`` the instance is built without pydantic validation,
+        for data that has just been normalized from a known API response.
+        """
         try:
             # Extract entity ID and code
             entity_id = data.get("entityId", "") or data.get("id", "")
@@ -57,12 +79,41 @@ class Location(BaseModel):
                 "distance_to_city_value": distance_to_city_value,
                 "distance_to_city_unit": distance_to_city_unit
             }
+        except Exception as e:
+            print(f"Error creating Location from API response: {e}")
+            return None
+        return cls._build(location_data, trusted)
 
+    @classmethod
+    def _build(cls, location_data: Dict[str, Any], trusted: bool = False) -> Optional["Location"]:
+        """Build a Location from alias-keyed data, or None if it is invalid."""
+        try:
+            if trusted:
+                return cls._construct_trusted(location_data)
             return cls(**location_data)
         except Exception as e:
             print(f"Error creating Location from API response: {e}")
             return None
 
+    @classmethod
+    def _construct_trusted(cls, location_data: Dict[str, Any]) -> "Location":
+        """Build a Location from alias-keyed data without validation."""
+        distance = location_data["distance_to_city_value"]
+        for key in ("entityId", "skyId", "name", "type"):
+            if not isinstance(location_data[key], str):
+                raise ValueError(f"Unexpected location structure for trusted parsing: {key}")
+        return _construct(cls, {
+            "entity_id": location_data["entityId"],
+            "code": location_data["skyId"],
+            "name": location_data["name"],
+            "type": location_data["type"],
+            "city_name": location_data["city_name"],
+            "region_name": location_data["region_name"],
+            "country_name": location_data["country_name"],
+            "distance_to_city_value": float(distance) if distance is not None else None,
+            "distance_to_city_unit": location_data["distance_to_city_unit"]
+        })
+
     def __str__(self) -> str:
         """String representation of the location."""
         parts = [self.name]
@@ -1,9 +1,52 @@
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from pydantic import BaseModel
 from .location import Location
 import sys
 from io import StringIO
 
+
+# Single-pass normalizers, one per searchAirport response shape. Each maps a
+# raw result straight to Location's alias-keyed fields, giving the same values
+# as normalize_locations followed by Location.from_api_response.
+
+def _v1_location_data(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of one entry of a v1 ``data`` list."""
+    presentation = item.get("presentation", {})
+    entity_id = item.get("entityId", "")
+    code = item.get("skyId", "")
+    if not code and entity_id:
+        code = entity_id.split(".")[0]
+    title = presentation.get("title", "")
+    return {
+        "entityId": entity_id,
+        "skyId": code,
+        "name": title,
+        "type": item.get("navigation", {}).get("entityType", ""),
+        "city_name": title,
+        "region_name": "",  # Not available in v1 responses
+        "country_name": presentation.get("subtitle", ""),
+        "distance_to_city_value": None,
+        "distance_to_city_unit": None
+    }
+
+
+def _place_location_data(place: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of one entry of a ``places`` list, or of a bare place object."""
+    entity_id = place.get("entityId", "")
+    name = place.get("name", "")
+    distance = place.get("distanceToCity", {}) or {}
+    return {
+        "entityId": entity_id,
+        "skyId": entity_id.split(".")[0],
+        "name": name,
+        "type": place.get("type", ""),
+        "city_name": place.get("city", {}).get("name", "") or name,
+        "region_name": place.get("region", {}).get("name", ""),
+        "country_name": place.get("country", {}).get("name", ""),
+        "distance_to_city_value": distance.get("value"),
+        "distance_to_city_unit": distance.get("unit")
+    }
+
 class LocationResponse(BaseModel):
     locations: List[Location]
     total_results: int = 0
@@ -40,11 +83,12 @@ class LocationResponse(BaseModel):
         print("-" * 50)
 
     @classmethod
-    def from_api_response(cls, response: Dict[str, Any]) -> 'LocationResponse':
+    def from_api_response(cls, response: Dict[str, Any], trusted: bool = False) -> 'LocationResponse':
         """Create a LocationResponse from an API response.
 
         Args:
             response (Dict[str, Any]): API response containing location data
+            trusted (bool): Skip pydantic validation for data known to come from the API
 
         Returns:
             LocationResponse: Response containing list of locations
@@ -65,8 +109,49 @@ class LocationResponse(BaseModel):
             items = [response]
 
         for item in items:
-            location = Location.from_api_response(item)
+            location = Location.from_api_response(item, trusted=trusted)
+            if location:
+                locations.append(location)
+
+        if trusted:
+            return cls.model_construct(locations=locations, total_results=len(locations))
+        return cls(locations=locations, total_results=len(locations))
+
+    @classmethod
+    def from_search_airport(cls, response: Dict[str, Any], trusted: bool = False) -> 'LocationResponse':
+        """Create a LocationResponse straight from a raw searchAirport response.
+
+        Equivalent to normalizing the response and calling from_api_response,
+        but each result is read once and turned directly into a Location.
+
+        Args:
+            response (Dict[str, Any]): Decoded searchAirport response, in the
+                v1 ``data`` format, the ``places`` format or a single place
+            trusted (bool): Skip pydantic validation for data known to come from the API
+
+        Returns:
+            LocationResponse: Response containing list of locations
+
+        Raises:
+            ValueError: If the response is not a JSON object
+        """
+        if not isinstance(response, dict):
+            raise ValueError("Invalid API response format")
+        normalize: Callable[[Dict[str, Any]], Dict[str, Any]]
+        if 'data' in response:
+            items, normalize = response['data'], _v1_location_data
+        elif 'places' in response:
+            items, normalize = response['places'], _place_location_data
+        else:
+            items, normalize = [response], _place_location_data
+
+        build = Location._build
+        locations = []
+        for item in items:
+            location = build(normalize(item), trusted)
             if location:
                 locations.append(location)
 
-        return cls(locations=locations, total_results=len(locations))
\ No newline at end of file
+        if trusted:
+            return cls.model_construct(locations=locations, total_results=len(locations))
+        return cls(locations=locations, total_results=len(locations))
@@ -1,3 +1,90 @@
-from .flight_search import FlightSearch
+from typing import TYPE_CHECKING
+from .. import _load
 
-__all__ = ["FlightSearch"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .flight_search import FlightSearch, AsyncFlightSearch
+    from .async_client import AsyncSkyscannerClient
+    from .cache import ResponseCache, MemoryCache, CacheStats
+    from .sqlite_cache import SQLiteCache
+    from .details_cache import DetailsCache
+    from .ratelimit import RateLimiter, QuotaSnapshot
+    from .retry import RetryPolicy
+    from .polling import PollPolicy
+    from .deadline import Deadline
+    from .airport_index import AirportIndex, LocationResolver, build_index
+    from .autocomplete import LocationAutocomplete
+    from .entity_resolver import EntityResolver, AsyncEntityResolver, EntityNotFoundError
+    from .instrumentation import (
+        ClientHooks,
+        MetricsCollector,
+        OpenTelemetryHooks,
+        RequestStart,
+        RequestEnd,
+        RetryEvent,
+        CacheHit,
+        ParseEvent
+    )
+    from .exceptions import (
+        SkyscannerAPIError,
+        AuthenticationError,
+        ClientError,
+        RateLimitError,
+        ServerError,
+        APITimeoutError,
+        APIConnectionError,
+        DeadlineExceededError
+    )
+
+# Services are imported on first access, so using one cache or policy class
+# does not load requests, httpx and every model
+_LAZY = {
+    "FlightSearch": ".flight_search",
+    "AsyncFlightSearch": ".flight_search",
+    "AsyncSkyscannerClient": ".async_client",
+    "ResponseCache": ".cache",
+    "MemoryCache": ".cache",
+    "CacheStats": ".cache",
+    "SQLiteCache": ".sqlite_cache",
+    "DetailsCache": ".details_cache",
+    "RateLimiter": ".ratelimit",
+    "QuotaSnapshot": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "PollPolicy": ".polling",
+    "Deadline": ".deadline",
+    "AirportIndex": ".airport_index",
+    "LocationResolver": ".airport_index",
+    "build_index": ".airport_index",
+    "LocationAutocomplete": ".autocomplete",
+    "EntityResolver": ".entity_resolver",
+    "AsyncEntityResolver": ".entity_resolver",
+    "EntityNotFoundError": ".entity_resolver",
+    "ClientHooks": ".instrumentation",
+    "MetricsCollector": ".instrumentation",
+    "OpenTelemetryHooks": ".instrumentation",
+    "RequestStart": ".instrumentation",
+    "RequestEnd": ".instrumentation",
+    "RetryEvent": ".instrumentation",
+    "CacheHit": ".instrumentation",
+    "ParseEvent": ".instrumentation",
+    "SkyscannerAPIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ClientError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "ServerError": ".exceptions",
+    "APITimeoutError": ".exceptions",
+    "APIConnectionError": ".exceptions",
+    "DeadlineExceededError": ".exceptions",
+}
+
+__all__ = ["FlightSearch", "AsyncFlightSearch", "AsyncSkyscannerClient", "ResponseCache", "MemoryCache", "CacheStats", "SQLiteCache", "DetailsCache", "RateLimiter", "QuotaSnapshot",
+           "RetryPolicy", "PollPolicy", "Deadline", "AirportIndex", "LocationResolver", "build_index", "LocationAutocomplete", "EntityResolver", "AsyncEntityResolver", "EntityNotFoundError", "ClientHooks", "MetricsCollector", "OpenTelemetryHooks", "RequestStart",
+           "RequestEnd", "RetryEvent", "CacheHit", "ParseEvent", "SkyscannerAPIError", "AuthenticationError", "ClientError", "RateLimitError",
+           "ServerError", "APITimeoutError", "APIConnectionError", "DeadlineExceededError"]
+
+
+def __getattr__(name: str) -> object:
+    return _load(name, _LAZY, __name__, globals())
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,310 @@
+"""Offline index of airports and cities keyed by sky ID.
+
+The index is a single read-only file that is memory-mapped on open, so
+opening it costs one header read and every process using the same file
+shares its pages through the OS page cache. Layout (little-endian)::
+
+    header   magic (8 bytes), key width (uint16), entry count (uint32)
+    rows     count x (sky ID, NUL-padded to key width; record offset uint32),
+             sorted by sky ID
+    records  per entry, one UTF-8 string of seven fields separated by
+             U+001F (NUL for None): entity ID, sky ID, name, type, city,
+             region and country; each ends where the next one starts
+
+Lookups binary-search the fixed-width rows in place and decode only the
+matching record. The package ships no data: build an index from locations
+you have already fetched, from recorded searchAirport responses or from a
+SQLite location cache::
+
+    python -m skyscanner_travel.services.airport_index build airports.idx --query LAS SDF JFK
+    python -m skyscanner_travel.services.airport_index build airports.idx --from-json responses.json
+    python -m skyscanner_travel.services.airport_index build airports.idx --from-cache locations.db
+    python -m skyscanner_travel.services.airport_index lookup airports.idx LAS
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from ..models.location import Location, _construct
+from ..models.location_response import LocationResponse
+
+MAGIC = b"SKYAIDX1"
+_HEADER = struct.Struct("<8sHI")
+_OFFSET = struct.Struct("<I")
+_SEPARATOR = "\x1f"
+_NONE = "\x00"
+# Location fields stored per entry, in record order. Distances to the city
+# centre depend on the query and are not stored.
+_FIELDS = ("entity_id", "code", "name", "type", "city_name", "region_name", "country_name")
+
+
+def _key(code: str) -> bytes:
+    return code.strip().upper().encode("utf-8")
+
+
+def _encode_record(location: Location) -> bytes:
+    parts = []
+    for field in _FIELDS:
+        value = getattr(location, field)
+        if value is None:
+            value = _NONE
+        elif _SEPARATOR in value or _NONE in value:
+            raise ValueError(f"Location {field} contains a control character: {value!r}")
+        parts.append(value)
+    return _SEPARATOR.join(parts).encode("utf-8")
+
+
+def build_index(locations: Iterable[Location], path: str) -> int:
+    """Write an index of ``locations`` to ``path``, replacing it atomically.
+
+    When several locations share a sky ID the first one wins, so pass the
+    preferred sources first (for example an existing index after new data
+    to keep old entries, or before it to refresh them).
+
+    Args:
+        locations (Iterable[Location]): Locations to index; ones without a
+            code are skipped
+        path (str): Destination file
+
+    Returns:
+        int: Number of entries written
+    """
+    records: Dict[bytes, bytes] = {}
+    for location in locations:
+        key = _key(location.code or "")
+        if key and key not in records:
+            records[key] = _encode_record(location)
+
+    keys = sorted(records)
+    width = max((len(key) for key in keys), default=0)
+    rows = []
+    offset = _HEADER.size + len(keys) * (width + _OFFSET.size)
+    for key in keys:
+        rows.append(key.ljust(width, b"\0") + _OFFSET.pack(offset))
+        offset += len(records[key])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".airport-index-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, width, len(keys)))
+            f.writelines(rows)
+            f.writelines(records[key] for key in keys)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return len(keys)
+
+
+class AirportIndex:
+    """Read-only, memory-mapped sky ID -> Location index.
+
+    Safe to share between threads; each process maps the file once.
+    """
+
+    def __init__(self, path: str):
+        """Map an index file built by build_index.
+
+        Args:
+            path (str): Path to the index file
+
+        Raises:
+            ValueError: If the file is not an airport index
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.key_width, self._count = _HEADER.unpack_from(self._mm) if len(self._mm) >= _HEADER.size else (b"", 0, 0)
+        self._stride = self.key_width + _OFFSET.size
+        if magic != MAGIC or len(self._mm) < _HEADER.size + self._count * self._stride:
+            self._mm.close()
+            raise ValueError(f"Not an airport index: {path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and self._find(code) is not None
+
+    def __iter__(self) -> Iterator[Location]:
+        """Every indexed location, in sky ID order."""
+        for i in range(self._count):
+            yield self._record(i)
+
+    def __enter__(self) -> "AirportIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
+
+    def _find(self, code: str) -> Optional[int]:
+        key = _key(code)
+        if not key or len(key) > self.key_width:
+            return None
+        padded = key.ljust(self.key_width, b"\0")
+        # Binary search over the key column, comparing slices of the mapping in place
+        mm, width, stride = self._mm, self.key_width, self._stride
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = _HEADER.size + mid * stride
+            probe = mm[start:start + width]
+            if probe < padded:
+                lo = mid + 1
+            elif probe > padded:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _record(self, i: int) -> Location:
+        mm = self._mm
+        row = _HEADER.size + i * self._stride + self.key_width
+        (start,) = _OFFSET.unpack_from(mm, row)
+        end = _OFFSET.unpack_from(mm, row + self._stride)[0] if i + 1 < self._count else len(mm)
+        fields = mm[start:end].decode("utf-8").split(_SEPARATOR)
+        values: Dict[str, Any] = {field: None if value == _NONE else value for field, value in zip(_FIELDS, fields)}
+        values.update(distance_to_city_value=None, distance_to_city_unit=None)
+        return _construct(Location, values)
+
+    def get(self, code: str) -> Optional[Location]:
+        """Look up a location by sky ID (case-insensitive).
+
+        Args:
+            code (str): Sky ID, e.g. ``LAS`` or ``LASA``
+
+        Returns:
+            Optional[Location]: The indexed location, or None if absent
+        """
+        i = self._find(code)
+        return self._record(i) if i is not None else None
+
+    def entity_id(self, code: str) -> Optional[str]:
+        """The entity ID for a sky ID, or None if it is not indexed."""
+        location = self.get(code)
+        return location.entity_id if location is not None else None
+
+
+class LocationResolver:
+    """Answers location searches for sky IDs from an offline AirportIndex.
+
+    LocationSearch consults it before calling the API. Queries that are not
+    an indexed sky ID (such as city names) resolve to None and go to the
+    network as before.
+    """
+
+    def __init__(self, index: Union[AirportIndex, str]):
+        """Initialize the resolver.
+
+        Args:
+            index (Union[AirportIndex, str]): An open index or the path of one
+        """
+        self.index = index if isinstance(index, AirportIndex) else AirportIndex(index)
+
+    def resolve(self, query: str) -> Optional[LocationResponse]:
+        """Resolve ``query`` offline.
+
+        Args:
+            query (str): Location search query
+
+        Returns:
+            Optional[LocationResponse]: The matching location, or None if
+                the query is not an indexed sky ID
+        """
+        location = self.index.get(query)
+        if location is None:
+            return None
+        return LocationResponse.model_construct(locations=[location], total_results=1)
+
+
+def harvest(client: Any, queries: Iterable[str], locale: str = "en-US") -> Iterator[Location]:
+    """Fetch the locations matching each query from the API, for build_index.
+
+    Args:
+        client (SkyscannerClient): Client used for the searches
+        queries (Iterable[str]): Search queries, e.g. IATA codes or city names
+        locale (str): Locale of the stored names
+
+    Returns:
+        Iterator[Location]: Every location returned, in response order
+    """
+    for query in queries:
+        yield from client.search_location_models(query, locale=locale).locations
+
+
+def _recorded_locations(paths: List[str]) -> Iterator[Location]:
+    """Locations in saved searchAirport responses (one response or a list per file)."""
+    for path in paths:
+        with open(path, "r") as f:
+            recorded = json.load(f)
+        for response in recorded if isinstance(recorded, list) else [recorded]:
+            yield from LocationResponse.from_search_airport(response).locations
+
+
+def _cached_locations(path: str) -> Iterator[Location]:
+    """Locations in a SQLite location cache filled by a client."""
+    from .sqlite_cache import SQLiteCache
+    from .skyscanner_client import LOCATION_CACHE_PREFIX
+    cache = SQLiteCache(path)
+    try:
+        for value in cache.values(prefix=LOCATION_CACHE_PREFIX):
+            yield from LocationResponse.from_search_airport(value).locations
+    finally:
+        cache.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build or query an offline skyscanner_travel airport index")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Build an index")
+    build.add_argument("path", help="Index file to write")
+    build.add_argument("--query", nargs="+", default=[], help="Search queries to fetch from the API")
+    build.add_argument("--from-json", nargs="+", default=[], help="Saved searchAirport responses")
+    build.add_argument("--from-cache", help="SQLite location cache to import")
+    build.add_argument("--merge", action="store_true", help="Keep the entries of an existing index at path")
+    build.add_argument("--locale", default="en-US")
+    lookup = commands.add_parser("lookup", help="Look up sky IDs")
+    lookup.add_argument("path", help="Index file")
+    lookup.add_argument("codes", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "lookup":
+        with AirportIndex(args.path) as index:
+            for code in args.codes:
+                location = index.get(code)
+                print(f"{code}: {location.entity_id} {location}" if location else f"{code}: not found")
+        return
+
+    sources: List[Iterable[Location]] = [_recorded_locations(args.from_json)]
+    if args.from_cache:
+        sources.append(_cached_locations(args.from_cache))
+    if args.query:
+        from ..config import get_api_key
+        from .skyscanner_client import SkyscannerClient
+        sources.append(harvest(SkyscannerClient(get_api_key()), args.query, args.locale))
+    existing = AirportIndex(args.path) if args.merge and os.path.exists(args.path) else None
+    if existing is not None:
+        sources.append(existing)
+
+    def locations() -> Iterator[Location]:
+        for source in sources:
+            yield from source
+
+    try:
+        count = build_index(locations(), args.path)
+    finally:
+        if existing is not None:
+            existing.close()
+    print(f"Indexed {count} locations in {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Any, Union
+from ..models.flight import Flight
+from ..models.location_response import LocationResponse
+from .skyscanner_client import (
+    SEARCH_AIRPORT_ENDPOINT,
+    SEARCH_FLIGHTS_ENDPOINT,
+    SEARCH_INCOMPLETE_ENDPOINT,
+    FLIGHT_DETAILS_ENDPOINT,
+    normalize_locations,
+    cached_locations,
+    cache_locations,
+    location_models,
+    flight_search_params,
+    search_incomplete_params,
+    flight_details_params,
+    resolve_cache_ttls,
+    DEFAULT_LOCATION_CACHE_TTL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT
+)
+from .cache import ResponseCache, make_cache_key, normalize_endpoint
+from .ratelimit import RateLimiter, QuotaSnapshot
+from .retry import RetryPolicy
+from .exceptions import (
+    SkyscannerAPIError,
+    AuthenticationError,
+    APITimeoutError,
+    APIConnectionError,
+    DeadlineExceededError,
+    error_for_status
+)
+from .details_cache import DetailsCache
+from .deadline import Deadline
+from .decoding import JSONLoads, accept_encoding, get_decoder
+from .instrumentation import (
+    ClientEvent,
+    ClientHooks,
+    RequestStart,
+    RequestEnd,
+    RetryEvent,
+    CacheHit,
+    ParseEvent
+)
+from .singleflight import AsyncSingleFlight
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+
+class AsyncSkyscannerClient:
+    """Asyncio client for the Skyscanner API via RapidAPI.
+
+    Mirrors SkyscannerClient but is built on ``httpx.AsyncClient``. Every
+    request acquires a slot from a bounded semaphore, so hundreds of
+    concurrent searches on one event loop never exceed ``max_concurrency``
+    in-flight connections. Cancelling the awaiting task aborts the request
+    and frees its slot.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 10,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: bool = True,
+        transport: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        location_cache: Optional[ResponseCache] = None,
+        location_cache_ttl: float = DEFAULT_LOCATION_CACHE_TTL,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        details_cache: Optional[DetailsCache] = None,
+        base_url: Optional[str] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        json_decoder: Union[str, JSONLoads] = "auto",
+        compress: bool = True
+    ):
+        """Initialize the client with an API key.
+
+        Args:
+            api_key (str): RapidAPI key for Skyscanner API
+            max_concurrency (int): Maximum number of requests in flight at once
+            pool_maxsize (Optional[int]): Maximum pooled connections (default: max_concurrency)
+            keep_alive (bool): Keep connections open between requests
+            transport (Optional[Any]): Custom httpx transport (mainly for testing)
+            cache (Optional[ResponseCache]): Cache for GET responses (e.g. MemoryCache)
+            cache_ttls (Optional[Dict[str, float]]): Per-endpoint TTL overrides in seconds
+            location_cache (Optional[ResponseCache]): Cache for raw searchAirport responses
+            location_cache_ttl (float): Lifetime of location_cache entries in seconds
+            coalesce (bool): Share one upstream request between tasks making
+                identical GET requests at the same time
+            rate_limiter (Optional[RateLimiter]): Client-side limiter that waits
+                for capacity before each request and calibrates itself from
+                RapidAPI quota headers
+            retry_policy (Optional[RetryPolicy]): Retry policy for transient
+                failures (default: RetryPolicy(); use max_attempts=1 to disable)
+            details_cache (Optional[DetailsCache]): Session-scoped cache for
+                get_flight_details responses
+            base_url (Optional[str]): API root to send requests to instead of
+                RapidAPI (e.g. a local fake server for load testing)
+            hooks (Optional[Iterable[ClientHooks]]): Receivers of request,
+                retry, cache and parse events (e.g. a MetricsCollector)
+            connect_timeout (float): Seconds allowed to open a connection
+            read_timeout (float): Seconds allowed between bytes of a response;
+                a call's deadline additionally bounds each request as a whole
+            json_decoder (Union[str, JSONLoads]): JSON backend for response
+                bodies, see get_decoder() (default: fastest installed)
+            compress (bool): Ask for gzip (and brotli, when installed)
+                compressed responses
+        """
+        if httpx is None:
+            raise ImportError("AsyncSkyscannerClient requires httpx. Install it with: pip install skyscanner-travel[async]")
+        if not api_key:
+            raise ValueError("API key cannot be empty")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("Timeouts must be positive")
+        self.api_key = api_key
+        self.api_host = "sky-scrapper.p.rapidapi.com"
+        self.base_url = base_url.rstrip("/") if base_url else f"https://{self.api_host}/api"
+        self.headers = {
+            "x-rapidapi-key": self.api_key,
+            "x-rapidapi-host": self.api_host
+        }
+        self.max_concurrency = max_concurrency
+        pool_maxsize = pool_maxsize or max_concurrency
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0
+        )
+        self.session = httpx.AsyncClient(limits=limits, transport=transport,
+                                         headers={"Accept-Encoding": accept_encoding(compress)})
+        self.compress = compress
+        self.json_loads = get_decoder(json_decoder)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.cache = cache
+        self.cache_ttls = resolve_cache_ttls(cache_ttls)
+        self.location_cache = location_cache
+        self.location_cache_ttl = location_cache_ttl
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.details_cache = details_cache
+        self.hooks: List[ClientHooks] = list(hooks or [])
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._singleflight = AsyncSingleFlight() if coalesce else None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent requests, created on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncSkyscannerClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @property
+    def quota(self) -> Optional[QuotaSnapshot]:
+        """Snapshot of the rate limiter's quota state, if a limiter is configured."""
+        return self.rate_limiter.snapshot() if self.rate_limiter is not None else None
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls served by another task's identical in-flight request."""
+        return self._singleflight.coalesced if self._singleflight is not None else 0
+
+    def notify(self, event: ClientEvent) -> None:
+        """Pass an instrumentation event to every hook."""
+        for hook in self.hooks:
+            getattr(hook, event.hook)(event)
+
+    def _retry_callback(self, endpoint: str) -> Optional[Callable[[Exception, int, float], None]]:
+        if not self.hooks:
+            return None
+        name = normalize_endpoint(endpoint)
+        return lambda error, attempt, delay: self.notify(
+            RetryEvent(endpoint=name, attempt=attempt, delay=delay, error=type(error).__name__)
+        )
+
+    async def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+                            deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Make a request to the Skyscanner API.
+
+        Cacheable GETs are served from the cache, and identical GETs already
+        in flight on the event loop are coalesced into a single request.
+        Coalesced callers share the first caller's request, including its
+        deadline, but never wait past their own.
+        """
+        if method != "GET":
+            return await self._fetch(endpoint, method=method, params=params, data=data, deadline=deadline)
+
+        key = make_cache_key(endpoint, params)
+        ttl = self.cache_ttls.get(normalize_endpoint(endpoint), 0) if self.cache is not None else 0
+        if ttl > 0:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.hooks:
+                    self.notify(CacheHit(endpoint=normalize_endpoint(endpoint), cache="response"))
+                return cached
+
+        fetch = lambda: self._fetch(endpoint, method=method, params=params, data=data, cache_key=key, ttl=ttl, deadline=deadline)
+        if self._singleflight is None:
+            return await fetch()
+        if deadline is None:
+            return await self._singleflight.do(key, fetch)
+        try:
+            return await self._singleflight.do(key, fetch, timeout=deadline.check(normalize_endpoint(endpoint)))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s exceeded waiting for {normalize_endpoint(endpoint)}")
+
+    async def _fetch(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+                     cache_key: Optional[str] = None, ttl: float = 0, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Send a request, decode it and store cacheable results."""
+        response = await self.retry_policy.call_async(
+            lambda: self._send(endpoint, method=method, params=params, data=data, deadline=deadline),
+            method=method,
+            on_retry=self._retry_callback(endpoint),
+            deadline=deadline
+        )
+        if self.hooks:
+            started = time.perf_counter()
+            result = self._decode(response)
+            self.notify(ParseEvent(endpoint=normalize_endpoint(endpoint), stage="decode", duration=time.perf_counter() - started))
+        else:
+            result = self._decode(response)
+
+        if ttl > 0:
+            self.cache.set(cache_key, result, ttl, size=len(response.content))
+        return result
+
+    async def _send(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+                    deadline: Optional[Deadline] = None) -> "httpx.Response":
+        """Send a request, bounded by the concurrency semaphore, and check its status.
+
+        With a deadline the whole exchange is cancelled once it expires.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.rate_limiter is not None:
+            if deadline is None:
+                await self.rate_limiter.acquire_async(endpoint)
+            else:
+                try:
+                    await self.rate_limiter.acquire_async(endpoint, max_wait=deadline.check(normalize_endpoint(endpoint)))
+                except TimeoutError as e:
+                    raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s cannot be met: {e}")
+        async with self.semaphore:
+            if deadline is None:
+                timeout = httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+            else:
+                connect, read = deadline.timeout(self.connect_timeout, self.read_timeout, normalize_endpoint(endpoint))
+                timeout = httpx.Timeout(read, connect=connect)
+            started = 0.0
+            if self.hooks:
+                self.notify(RequestStart(endpoint=normalize_endpoint(endpoint), method=method))
+                started = time.perf_counter()
+            try:
+                request = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=self.headers,
+                    params=params,
+                    json=data,
+                    timeout=timeout
+                )
+                response = await (request if deadline is None else asyncio.wait_for(request, deadline.remaining()))
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                if deadline is not None and (isinstance(e, asyncio.TimeoutError) or deadline.expired):
+                    error = DeadlineExceededError(f"Deadline of {deadline.seconds:g}s exceeded: {str(e) or endpoint}")
+                elif isinstance(e, httpx.TimeoutException):
+                    error = APITimeoutError(f"API request failed: {str(e)}")
+                elif isinstance(e, httpx.TransportError):
+                    error = APIConnectionError(f"API request failed: {str(e)}")
+                else:
+                    error = SkyscannerAPIError(f"API request failed: {str(e)}")
+                if self.hooks:
+                    self.notify(RequestEnd(endpoint=normalize_endpoint(endpoint), method=method,
+                                           latency=time.perf_counter() - started, error=type(error).__name__))
+                raise error
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response.headers)
+        error = None
+        if response.status_code == 403:
+            error = AuthenticationError("API request failed: API key is invalid or expired. Please check your RapidAPI key.", status_code=403)
+        elif response.is_error:
+            error = error_for_status(response.status_code, f"API request failed: {response.status_code} Error for url: {url}", response.headers)
+        if self.hooks:
+            self.notify(RequestEnd(endpoint=normalize_endpoint(endpoint), method=method, status=response.status_code,
+                                   bytes=len(response.content), latency=time.perf_counter() - started,
+                                   error=type(error).__name__ if error is not None else None))
+        if error is not None:
+            raise error
+        return response
+
+    def _decode(self, response: "httpx.Response") -> Dict[str, Any]:
+        """Decode a JSON response body straight from its (decompressed) bytes."""
+        try:
+            return self.json_loads(response.content)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON response: {str(e)}")
+
+    async def search_locations(self, query: str, locale: str = "en-US", deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Search for locations (airports, cities) by query string.
+
+        Args:
+            query (str): Search query (e.g. airport code or city name)
+            locale (str): Locale code (default: en-US)
+            deadline (Optional[Deadline]): End-to-end time budget
+
+        Returns:
+            Dict: API response containing location results
+        """
+        return normalize_locations(await self._location_response({"query": query, "locale": locale}, deadline))
+
+    async def search_location_models(
+        self,
+        query: str,
+        locale: str = "en-US",
+        deadline: Optional[Deadline] = None,
+        trusted: bool = False
+    ) -> LocationResponse:
+        """Search for locations and return them as models.
+
+        Builds the Location objects in a single pass over the raw response,
+        whether it comes from the API or from the location cache, instead
+        of normalizing it to dicts first.
+
+        Args:
+            query (str): Search query (e.g. airport code or city name)
+            locale (str): Locale code (default: en-US)
+            deadline (Optional[Deadline]): End-to-end time budget
+            trusted (bool): Build models without pydantic validation
+
+        Returns:
+            LocationResponse: Response containing list of locations
+
+        Raises:
+            ValueError: If the response is not a JSON object
+        """
+        return location_models(self, await self._location_response({"query": query, "locale": locale}, deadline), trusted)
+
+    async def _location_response(self, params: Dict[str, Any], deadline: Optional[Deadline]) -> Any:
+        """Fetch a raw searchAirport response, going through the location cache."""
+        cached = cached_locations(self, params)
+        if cached is not None:
+            return cached
+        response = await self._make_request(SEARCH_AIRPORT_ENDPOINT, params=params, deadline=deadline)
+        cache_locations(self, params, response)
+        return response
+
+    async def search_flights(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: str,
+        destination_entity_id: str,
+        date: str,
+        cabin_class: str = "economy",
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US",
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Search for available flights.
+
+        Takes the same arguments as SkyscannerClient.search_flights.
+
+        Returns:
+            Dict: API response containing flight results
+        """
+        params = flight_search_params(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        )
+        response = await self._make_request(SEARCH_FLIGHTS_ENDPOINT, params=params, deadline=deadline)
+        if self.details_cache is not None and isinstance(response, dict):
+            self.details_cache.observe_search(make_cache_key(SEARCH_FLIGHTS_ENDPOINT, params), response.get("sessionId"))
+        return response
+
+    async def search_incomplete(self, session_id: str, currency: str = "USD", market: str = "en-US", country_code: str = "US",
+                                deadline: Optional[Deadline] = None) -> Dict:
+        """Poll a search whose ``data.context.status`` is still ``incomplete``.
+
+        Takes the same arguments as SkyscannerClient.search_incomplete.
+
+        Returns:
+            Dict: API response in the same format as search_flights
+        """
+        params = search_incomplete_params(session_id, currency=currency, market=market, country_code=country_code)
+        return await self._make_request(SEARCH_INCOMPLETE_ENDPOINT, params=params, deadline=deadline)
+
+    async def get_flight_details(
+        self,
+        flight: Flight,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        currency: str = "USD",
+        locale: str = "en-US",
+        market: str = "en-US",
+        cabinClass: str = "economy",
+        countryCode: str = "US",
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """Get detailed information about a specific flight.
+
+        Args:
+            flight (Flight): Flight object to get details for
+            deadline (Optional[Deadline]): End-to-end time budget
+
+        Returns:
+            Dict: API response containing flight details
+        """
+        params = flight_details_params(
+            flight,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            locale=locale,
+            market=market,
+            cabinClass=cabinClass,
+            countryCode=countryCode
+        )
+        if self.details_cache is not None:
+            cached = self.details_cache.get(params)
+            if cached is not None:
+                if self.hooks:
+                    self.notify(CacheHit(endpoint=FLIGHT_DETAILS_ENDPOINT, cache="details"))
+                return cached
+
+        response = await self._make_request(FLIGHT_DETAILS_ENDPOINT, params=params, deadline=deadline)
+        if self.details_cache is not None and isinstance(response, dict) and response.get("status"):
+            self.details_cache.set(params, response)
+        return response
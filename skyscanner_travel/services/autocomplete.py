@@ -0,0 +1,165 @@
+"""Local prefix autocomplete over Location records.
+
+Every location contributes search terms: its code, name and city, plus
+each later word of the name and city, so ``veg`` finds "Las Vegas". Terms
+are case- and diacritic-folded and kept in sorted arrays, one per ranking
+tier, so a completion is a bisect per tier followed by a short scan. Within
+a place type, matches at the start of a name rank above matches on a later
+word.
+"""
+import bisect
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List, Tuple
+from ..models.location import Location
+
+# Ranking after exact code matches: airports, then cities, then anything
+# else; each type has a tier for whole terms and one for later words
+_TYPES = {"AIRPORT": 0, "CITY": 1}
+_OTHER_TYPE = 2
+_TIER_COUNT = 2 * (_OTHER_TYPE + 1)
+
+
+def fold(text: str) -> str:
+    """Fold case, strip diacritics and collapse whitespace, for matching.
+
+    >>> fold("  Zürich  Flughafen ")
+    'zurich flughafen'
+    """
+    if text.isascii():
+        return " ".join(text.lower().split())
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def _terms(location: Location) -> Dict[str, bool]:
+    """Folded search terms of a location, mapped to whether each is a later word."""
+    terms: Dict[str, bool] = {}
+    for text in {location.code, location.name, location.city_name}:
+        if not text:
+            continue
+        folded = fold(text)
+        terms[folded] = False
+        for word in folded.split(" ")[1:]:
+            terms.setdefault(word, True)
+    return terms
+
+
+class LocationAutocomplete:
+    """Ranked prefix completion over a set of locations.
+
+    Results put locations whose code equals the query first, then airports,
+    then cities, then other places; within a type, name-start matches come
+    before later-word matches, each ordered by the matching term. Locations
+    are deduplicated by entity ID, first one wins. Safe to share between
+    threads: additions and completions are serialized by a lock.
+    """
+
+    def __init__(self, locations: Iterable[Location] = ()):
+        """Initialize the engine.
+
+        Args:
+            locations (Iterable[Location]): Initial locations, e.g. an
+                AirportIndex
+        """
+        self._lock = threading.Lock()
+        self._locations: List[Location] = []
+        self._entity_ids: Dict[str, int] = {}
+        self._codes: Dict[str, List[int]] = {}
+        self._tiers: List[Tuple[List[str], List[int]]] = [([], []) for _ in range(_TIER_COUNT)]
+        self._pending: List[List[Tuple[str, int]]] = [[] for _ in range(_TIER_COUNT)]
+        self._dirty = False
+        self.add(locations)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def add(self, locations: Iterable[Location]) -> int:
+        """Add locations; ones already present (by entity ID) are skipped.
+
+        Args:
+            locations (Iterable[Location]): Locations to add
+
+        Returns:
+            int: Number of locations added
+        """
+        added = 0
+        with self._lock:
+            for location in locations:
+                key = location.entity_id or location.code
+                if not key or key in self._entity_ids:
+                    continue
+                i = self._entity_ids[key] = len(self._locations)
+                self._locations.append(location)
+                if location.code:
+                    self._codes.setdefault(fold(location.code), []).append(i)
+                tier = 2 * _TYPES.get((location.type or "").upper(), _OTHER_TYPE)
+                for term, word in _terms(location).items():
+                    self._pending[tier + word].append((term, i))
+                added += 1
+            self._dirty = self._dirty or added > 0
+        return added
+
+    def add_cached(self, cache: Any) -> int:
+        """Add the locations in a location cache, such as a SQLiteCache.
+
+        Args:
+            cache: Cache with a ``values(prefix)`` method holding
+                raw searchAirport responses
+
+        Returns:
+            int: Number of locations added
+        """
+        from ..models.location_response import LocationResponse
+        from .skyscanner_client import LOCATION_CACHE_PREFIX
+        added = 0
+        for value in cache.values(prefix=LOCATION_CACHE_PREFIX):
+            added += self.add(LocationResponse.from_search_airport(value).locations)
+        return added
+
+    def _merge_pending(self) -> None:
+        """Fold newly added terms into the sorted tier arrays; call with the lock held."""
+        tiers = []
+        for (terms, ids), pending in zip(self._tiers, self._pending):
+            if pending:
+                entries = list(zip(terms, ids))
+                entries.extend(pending)
+                entries.sort()
+                terms, ids = [term for term, _ in entries], [i for _, i in entries]
+                pending.clear()
+            tiers.append((terms, ids))
+        self._tiers = tiers
+        self._dirty = False
+
+    def complete(self, query: str, limit: int = 10) -> List[Location]:
+        """Locations with a term starting with ``query``, best first.
+
+        Args:
+            query (str): Prefix typed so far (any case, with or without accents)
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Location]: Up to ``limit`` ranked matches
+        """
+        prefix = fold(query)
+        if not prefix or limit <= 0:
+            return []
+        with self._lock:
+            if self._dirty:
+                self._merge_pending()
+            locations = self._locations
+            seen = set()
+            results = []
+            for i in self._codes.get(prefix, ()):
+                seen.add(i)
+                results.append(locations[i])
+            for terms, ids in self._tiers:
+                j = bisect.bisect_left(terms, prefix)
+                while len(results) < limit and j < len(terms) and terms[j].startswith(prefix):
+                    i = ids[j]
+                    if i not in seen:
+                        seen.add(i)
+                        results.append(locations[i])
+                    j += 1
+        return results[:limit]
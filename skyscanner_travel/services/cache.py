@@ -0,0 +1,171 @@
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+from pydantic import BaseModel
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Normalize an endpoint path so equivalent spellings share cache entries."""
+    return endpoint.strip("/")
+
+
+def make_cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a cache key from the normalized endpoint and sorted query params.
+
+    Args:
+        endpoint (str): API endpoint (e.g. "v1/flights/searchAirport")
+        params (Optional[Dict[str, Any]]): Query parameters
+
+    Returns:
+        str: Stable key such as "v1/flights/searchAirport?locale=en-US&query=LAS"
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    return f"{normalize_endpoint(endpoint)}?{urlencode(items)}"
+
+
+class CacheStats(BaseModel):
+    """Point-in-time counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(ABC):
+    """Interface for response cache backends used by SkyscannerClient.
+
+    Values are decoded API responses. They are shared between callers and
+    must be treated as read-only. A backend must implement every method;
+    an incomplete one cannot be instantiated.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float, size: int = 0) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds.
+
+        Args:
+            key (str): Cache key from make_cache_key
+            value (Any): Decoded response
+            ttl (float): Time to live in seconds
+            size (int): Approximate size in bytes, used for byte bounds
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Current hit/miss/eviction counters."""
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-process cache with per-entry TTL and an LRU bound.
+
+    Entries are evicted least-recently-used first once either ``max_entries``
+    or ``max_bytes`` would be exceeded. Expired entries are dropped lazily on
+    access.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None, clock=time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept
+            max_bytes (Optional[int]): Maximum total size of entries, if bounded
+            clock: Monotonic time source (overridable for tests)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float, size: int = 0) -> None:
+        if ttl <= 0:
+            return
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, self._clock() + ttl, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes
+            )
@@ -0,0 +1,60 @@
+import time
+from typing import Tuple
+from .exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """End-to-end time budget shared by a chain of API calls.
+
+    Create one per user-facing operation and pass it to every call of the
+    workflow (e.g. LocationSearch.search, FlightSearch.search and
+    FlightSearch.get_flight_details). Each request's connect and read
+    timeouts are capped by the time remaining, rate-limit waits and retries
+    that would overrun it are skipped, and once it has expired further calls
+    fail fast with DeadlineExceededError.
+
+    The read timeout bounds each socket read rather than the whole transfer,
+    so a server trickling a large body can overrun the deadline by up to one
+    read timeout. The async client enforces the deadline as a hard limit.
+    """
+
+    def __init__(self, seconds: float, clock=time.monotonic):
+        """Start the budget now.
+
+        Args:
+            seconds (float): Time allowed from now
+            clock: Monotonic time source
+        """
+        if seconds < 0:
+            raise ValueError("seconds must not be negative")
+        self.seconds = seconds
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, operation: str = "request") -> float:
+        """Return the remaining budget, raising if it is already spent.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Deadline of {self.seconds:g}s exceeded before {operation}")
+        return remaining
+
+    def timeout(self, connect: float, read: float, operation: str = "request") -> Tuple[float, float]:
+        """Cap a (connect, read) timeout pair by the remaining budget."""
+        remaining = self.check(operation)
+        return min(connect, remaining), min(read, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(seconds={self.seconds:g}, remaining={self.remaining():.3f})"
+
@@ -0,0 +1,69 @@
+"""Response body decoding: JSON backends and compression negotiation."""
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from pydantic_core import from_json as pydantic_from_json
+except ImportError:  # pragma: no cover - pydantic-core before 2.14
+    pydantic_from_json = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+JSONLoads = Callable[[bytes], Any]
+
+# Backends by name, fastest first; unavailable ones are None
+DECODERS: Dict[str, Optional[JSONLoads]] = {
+    "orjson": orjson.loads if orjson is not None else None,
+    "pydantic": pydantic_from_json,
+    "json": json.loads,
+}
+_PACKAGES = {"orjson": "orjson", "pydantic": "pydantic-core>=2.14"}
+
+
+def get_decoder(decoder: Union[str, JSONLoads] = "auto") -> JSONLoads:
+    """Resolve a JSON decoder that reads response bytes directly.
+
+    Args:
+        decoder (Union[str, JSONLoads]): ``auto`` (the fastest installed
+            backend), ``orjson``, ``pydantic`` (pydantic-core's Rust parser),
+            ``json`` (the standard library), or any callable taking bytes
+
+    Returns:
+        JSONLoads: Function decoding a JSON document from bytes
+
+    Raises:
+        ValueError: If the decoder name is unknown
+        ImportError: If the named backend is not installed
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        return next(loads for loads in DECODERS.values() if loads is not None)
+    if decoder not in DECODERS:
+        raise ValueError(f"Unknown JSON decoder {decoder!r}; expected auto, {', '.join(DECODERS)} or a callable")
+    loads = DECODERS[decoder]
+    if loads is None:
+        raise ImportError(f"The {decoder} JSON decoder requires {_PACKAGES[decoder]}. Install it with: pip install skyscanner-travel[fast]")
+    return loads
+
+
+def accept_encoding(compress: bool = True) -> str:
+    """Accept-Encoding header value for the codecs this environment can decode.
+
+    Brotli is only offered when a brotli package is installed, because
+    requests/urllib3 and httpx can only decode it then.
+    """
+    if not compress:
+        return "identity"
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+from .cache import CacheStats, MemoryCache, ResponseCache, make_cache_key
+
+# How long a search session stays usable upstream, in seconds
+DEFAULT_SESSION_TTL = 15 * 60
+
+
+class DetailsCache:
+    """Cache for getFlightDetails responses scoped to the search session.
+
+    Entries are keyed by itinerary ID, session ID and the passenger, cabin
+    and market parameters of the lookup. Each entry expires with its search
+    session: ``session_ttl`` seconds after the client first saw the session.
+    When a repeat of the same search comes back with a new session, every
+    entry of the old session is dropped, since its itineraries can no longer
+    be booked.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None, session_ttl: float = DEFAULT_SESSION_TTL, clock=time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            cache (Optional[ResponseCache]): Backend storing the responses
+                (default: MemoryCache(max_entries=1024))
+            session_ttl (float): Lifetime of a search session in seconds
+            clock: Monotonic time source
+        """
+        if session_ttl <= 0:
+            raise ValueError("session_ttl must be positive")
+        self.cache = cache if cache is not None else MemoryCache(max_entries=1024)
+        self.session_ttl = session_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # session ID -> (search key, expiry); search key -> current session ID
+        self._sessions: Dict[str, Tuple[Optional[str], float]] = {}
+        self._searches: Dict[str, str] = {}
+        self._keys: Dict[str, Set[str]] = {}
+        self._retired: Dict[str, float] = {}
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Build the cache key for getFlightDetails query parameters."""
+        return make_cache_key("flight-details", params)
+
+    def observe_search(self, search_key: str, session_id: Any) -> None:
+        """Record the session a search returned, retiring the search's previous session.
+
+        Args:
+            search_key (str): Cache key of the searchFlights request
+            session_id (Any): Root ``sessionId`` of the response
+        """
+        if not isinstance(session_id, str) or not session_id:
+            return
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            previous = self._searches.get(search_key)
+            self._searches[search_key] = session_id
+            if session_id not in self._sessions:
+                self._sessions[session_id] = (search_key, now + self.session_ttl)
+            if previous is not None and previous != session_id:
+                self._retire(previous, now)
+
+    def invalidate_session(self, session_id: str) -> int:
+        """Drop every entry of a session and refuse new ones.
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            return self._retire(session_id, self._clock())
+
+    def get(self, params: Dict[str, Any]) -> Optional[Any]:
+        """Return the cached details response for a lookup, or None."""
+        session_id = params.get("sessionId")
+        with self._lock:
+            if session_id in self._retired:
+                return None
+        return self.cache.get(self.make_key(params))
+
+    def set(self, params: Dict[str, Any], value: Any, size: int = 0) -> None:
+        """Store a details response until its session expires."""
+        session_id = params.get("sessionId")
+        key = self.make_key(params)
+        with self._lock:
+            now = self._clock()
+            if session_id in self._retired:
+                return
+            # Sessions not seen in a search (e.g. flights restored from disk) get a full lifetime
+            _, expires_at = self._sessions.setdefault(session_id, (None, now + self.session_ttl))
+            ttl = expires_at - now
+            if ttl <= 0:
+                return
+            self._keys.setdefault(session_id, set()).add(key)
+        self.cache.set(key, value, ttl, size=size)
+
+    def clear(self) -> None:
+        """Drop every entry and forget all sessions."""
+        with self._lock:
+            self._sessions.clear()
+            self._searches.clear()
+            self._keys.clear()
+            self._retired.clear()
+        self.cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the backend's counters."""
+        return self.cache.stats
+
+    def _retire(self, session_id: str, now: float) -> int:
+        search_key, expires_at = self._sessions.pop(session_id, (None, now + self.session_ttl))
+        if search_key is not None and self._searches.get(search_key) == session_id:
+            del self._searches[search_key]
+        # Remember the session until it would have expired anyway
+        self._retired[session_id] = expires_at
+        keys = self._keys.pop(session_id, set())
+        for key in keys:
+            self.cache.delete(key)
+        return len(keys)
+
+    def _prune(self, now: float) -> None:
+        for session_id, (search_key, expires_at) in list(self._sessions.items()):
+            if expires_at <= now:
+                del self._sessions[session_id]
+                self._keys.pop(session_id, None)
+                if search_key is not None and self._searches.get(search_key) == session_id:
+                    del self._searches[search_key]
+        for session_id, expires_at in list(self._retired.items()):
+            if expires_at <= now:
+                del self._retired[session_id]
@@ -0,0 +1,167 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, List, Optional, Sequence, Union
+from ..models.flight import Flight
+from ..models.flight_query import DetailsResult
+
+
+class DetailsPrefetch:
+    """Flight details being fetched on background threads.
+
+    Requests start immediately, at most ``max_concurrency`` at a time, over
+    the client's shared session and rate limiter. Results are collected in
+    the order the flights were given; a failed lookup is reported in its
+    DetailsResult instead of raising.
+    """
+
+    def __init__(self, fetch: Callable[[Flight], Flight], flights: Sequence[Flight], max_concurrency: int = 8):
+        """Start fetching details.
+
+        Args:
+            fetch (Callable[[Flight], Flight]): Fetches details for one flight
+            flights (Sequence[Flight]): Flights to look up
+            max_concurrency (int): Maximum number of concurrent requests
+        """
+        self.flights = list(flights)
+        self._index = {flight.id: index for index, flight in reversed(list(enumerate(self.flights)))}
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrency, len(self.flights))),
+            thread_name_prefix="flight-details"
+        )
+        self._futures = [executor.submit(fetch, flight) for flight in self.flights]
+        # Worker threads exit once the queued lookups have run
+        executor.shutdown(wait=False)
+
+    def __len__(self) -> int:
+        return len(self.flights)
+
+    def done(self) -> bool:
+        """Whether every lookup has finished."""
+        return all(future.done() for future in self._futures)
+
+    def cancel(self) -> None:
+        """Cancel lookups that have not started yet."""
+        for future in self._futures:
+            future.cancel()
+
+    def result(self, flight: Union[Flight, int], timeout: Optional[float] = None) -> DetailsResult:
+        """Wait for the details of one flight.
+
+        Args:
+            flight (Union[Flight, int]): A prefetched flight or its position
+            timeout (Optional[float]): Seconds to wait (None waits indefinitely)
+
+        Returns:
+            DetailsResult: The details or the error of the lookup
+
+        Raises:
+            KeyError: If the flight was not prefetched
+            concurrent.futures.TimeoutError: If the lookup is still running after timeout
+        """
+        index = flight if isinstance(flight, int) else self._index[flight.id]
+        future = self._futures[index]
+        try:
+            return DetailsResult(index=index, flight=self.flights[index], details=future.result(timeout))
+        except FutureTimeoutError as e:
+            # Before Python 3.11 this is not the builtin TimeoutError
+            if not future.done():
+                raise
+            error: Exception = e
+        except Exception as e:
+            error = e
+        return DetailsResult(index=index, flight=self.flights[index], error=error)
+
+    def results(self, timeout: Optional[float] = None) -> List[DetailsResult]:
+        """Wait for every lookup and return the results in input order.
+
+        Lookups still running after ``timeout`` are reported with a TimeoutError.
+        """
+        wait(self._futures, timeout=timeout)
+        return [
+            self.result(index) if future.done()
+            else DetailsResult(index=index, flight=self.flights[index], error=TimeoutError("Flight details lookup timed out"))
+            for index, future in enumerate(self._futures)
+        ]
+
+
+class AsyncDetailsPrefetch:
+    """Asyncio version of DetailsPrefetch.
+
+    Lookups run as tasks on the running event loop, at most
+    ``max_concurrency`` at a time on top of the client's semaphore.
+    """
+
+    def __init__(self, fetch: Callable[[Flight], Awaitable[Flight]], flights: Sequence[Flight], max_concurrency: int = 8):
+        """Start fetching details; must be called with an event loop running.
+
+        Args:
+            fetch (Callable[[Flight], Awaitable[Flight]]): Fetches details for one flight
+            flights (Sequence[Flight]): Flights to look up
+            max_concurrency (int): Maximum number of concurrent requests
+        """
+        self.flights = list(flights)
+        self._index = {flight.id: index for index, flight in reversed(list(enumerate(self.flights)))}
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(index: int, flight: Flight) -> DetailsResult:
+            async with semaphore:
+                try:
+                    return DetailsResult(index=index, flight=flight, details=await fetch(flight))
+                except Exception as e:
+                    return DetailsResult(index=index, flight=flight, error=e)
+
+        self._tasks = [asyncio.ensure_future(run(index, flight)) for index, flight in enumerate(self.flights)]
+
+    def __len__(self) -> int:
+        return len(self.flights)
+
+    def done(self) -> bool:
+        """Whether every lookup has finished."""
+        return all(task.done() for task in self._tasks)
+
+    def cancel(self) -> None:
+        """Cancel lookups that have not finished yet."""
+        for task in self._tasks:
+            task.cancel()
+
+    def _result(self, index: int) -> DetailsResult:
+        task = self._tasks[index]
+        if task.cancelled():
+            return DetailsResult(index=index, flight=self.flights[index], error=asyncio.CancelledError())
+        return task.result()
+
+    async def result(self, flight: Union[Flight, int], timeout: Optional[float] = None) -> DetailsResult:
+        """Wait for the details of one flight.
+
+        Args:
+            flight (Union[Flight, int]): A prefetched flight or its position
+            timeout (Optional[float]): Seconds to wait (None waits indefinitely)
+
+        Returns:
+            DetailsResult: The details or the error of the lookup
+
+        Raises:
+            KeyError: If the flight was not prefetched
+            asyncio.TimeoutError: If the lookup is still running after timeout
+        """
+        index = flight if isinstance(flight, int) else self._index[flight.id]
+        task = self._tasks[index]
+        if not task.done():
+            await asyncio.wait([task], timeout=timeout)
+            if not task.done():
+                raise asyncio.TimeoutError("Flight details lookup timed out")
+        return self._result(index)
+
+    async def results(self, timeout: Optional[float] = None) -> List[DetailsResult]:
+        """Wait for every lookup and return the results in input order.
+
+        Lookups still running after ``timeout`` are reported with a TimeoutError.
+        """
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=timeout)
+        return [
+            self._result(index) if task.done()
+            else DetailsResult(index=index, flight=self.flights[index], error=TimeoutError("Flight details lookup timed out"))
+            for index, task in enumerate(self._tasks)
+        ]
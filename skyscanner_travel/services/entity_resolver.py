@@ -0,0 +1,195 @@
+"""Resolve sky IDs (e.g. "LAS") to the entity IDs flight searches need.
+
+Resolved IDs are remembered for the resolver's lifetime, since entity IDs do
+not change. Lookups try, in order: that memo, an offline AirportIndex, and
+a searchAirport request, which goes through the client's location cache and
+request coalescing. Batches are deduplicated and looked up concurrently, so
+resolving every route of a search_many costs at most one round of requests.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+from ..models.location import Location
+from .deadline import Deadline
+
+if TYPE_CHECKING:
+    from .airport_index import AirportIndex
+    from .async_client import AsyncSkyscannerClient
+    from .skyscanner_client import SkyscannerClient
+
+
+class EntityNotFoundError(LookupError):
+    """Raised when no location has the requested sky ID."""
+
+
+def _key(sky_id: str) -> str:
+    return sky_id.strip().upper()
+
+
+def _match(sky_id: str, locations: List[Location]) -> str:
+    """The entity ID of the location whose code is ``sky_id``."""
+    for location in locations:
+        if location.code and _key(location.code) == sky_id and location.entity_id:
+            return location.entity_id
+    raise EntityNotFoundError(f"No location with sky ID {sky_id!r}")
+
+
+class _ResolverBase:
+    def __init__(self, index: Optional["AirportIndex"] = None):
+        self.index = index
+        self._entity_ids: Dict[str, str] = {}
+
+    def cached(self, sky_id: str) -> Optional[str]:
+        """The entity ID for ``sky_id`` if it is known without a request."""
+        key = _key(sky_id)
+        entity_id = self._entity_ids.get(key)
+        if entity_id is None and self.index is not None:
+            entity_id = self.index.entity_id(key)
+            if entity_id is not None:
+                self._entity_ids[key] = entity_id
+        return entity_id
+
+    def _pending(self, sky_ids: Iterable[str]) -> List[str]:
+        """Unique keys of ``sky_ids`` that need a request, in first-seen order."""
+        return list(dict.fromkeys(_key(sky_id) for sky_id in sky_ids if self.cached(sky_id) is None))
+
+    def _remember(self, key: str, entity_id: str) -> str:
+        self._entity_ids[key] = entity_id
+        return entity_id
+
+
+class EntityResolver(_ResolverBase):
+    """Cached, batched sky ID -> entity ID resolution for FlightSearch.
+
+    Safe to share between threads. Batches of more than one lookup run on a
+    thread pool that is created on first use and kept for the resolver's
+    lifetime; ``close()`` shuts it down.
+    """
+
+    def __init__(self, client: "SkyscannerClient", index: Optional["AirportIndex"] = None, max_workers: int = 8):
+        """Initialize the resolver.
+
+        Args:
+            client (SkyscannerClient): Client used for lookups the index cannot answer
+            index (Optional[AirportIndex]): Offline index consulted before the API
+            max_workers (int): Maximum number of concurrent lookups in a batch
+        """
+        super().__init__(index)
+        self.client = client
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "EntityResolver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the lookup threads; a later batch starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="entity-resolver")
+            return self._executor
+
+    def _lookup(self, key: str, deadline: Optional[Deadline]) -> str:
+        response = self.client.search_location_models(key, deadline=deadline, trusted=True)
+        return self._remember(key, _match(key, response.locations))
+
+    def resolve(self, sky_id: str, deadline: Optional[Deadline] = None) -> str:
+        """Resolve one sky ID.
+
+        Args:
+            sky_id (str): Sky ID, e.g. ``LAS`` (case-insensitive)
+            deadline (Optional[Deadline]): End-to-end time budget for a lookup
+
+        Returns:
+            str: The entity ID
+
+        Raises:
+            EntityNotFoundError: If the API knows no location with that sky ID
+        """
+        return self.cached(sky_id) or self._lookup(_key(sky_id), deadline)
+
+    def resolve_many(
+        self,
+        sky_ids: Iterable[str],
+        deadline: Optional[Deadline] = None,
+        return_exceptions: bool = False
+    ) -> Dict[str, Union[str, Exception]]:
+        """Resolve many sky IDs, looking up the unknown ones concurrently.
+
+        Args:
+            sky_ids (Iterable[str]): Sky IDs; duplicates are looked up once
+            deadline (Optional[Deadline]): End-to-end time budget for the batch
+            return_exceptions (bool): Map a failed sky ID to its exception
+                instead of raising it
+
+        Returns:
+            Dict[str, Union[str, Exception]]: Entity ID (or exception) per
+                sky ID, keyed as given
+
+        Raises:
+            Exception: The first lookup error, unless ``return_exceptions``
+        """
+        sky_ids = list(sky_ids)
+        pending = self._pending(sky_ids)
+        errors: Dict[str, Exception] = {}
+        if len(pending) > 1:
+            pool = self._pool()
+            futures = [pool.submit(self._lookup, key, deadline) for key in pending]
+            errors = {key: future.exception() for key, future in zip(pending, futures) if future.exception() is not None}
+        else:
+            # A single lookup runs on the calling thread
+            for key in pending:
+                try:
+                    self._lookup(key, deadline)
+                except Exception as e:
+                    errors[key] = e
+        if errors and not return_exceptions:
+            raise next(iter(errors.values()))
+        return {sky_id: errors.get(_key(sky_id)) or self._entity_ids[_key(sky_id)] for sky_id in sky_ids}
+
+
+class AsyncEntityResolver(_ResolverBase):
+    """Asyncio version of EntityResolver, for AsyncFlightSearch."""
+
+    def __init__(self, client: "AsyncSkyscannerClient", index: Optional["AirportIndex"] = None):
+        """Initialize the resolver.
+
+        Args:
+            client (AsyncSkyscannerClient): Client used for lookups the index
+                cannot answer; its semaphore bounds concurrency
+            index (Optional[AirportIndex]): Offline index consulted before the API
+        """
+        super().__init__(index)
+        self.client = client
+
+    async def _lookup(self, key: str, deadline: Optional[Deadline]) -> str:
+        response = await self.client.search_location_models(key, deadline=deadline, trusted=True)
+        return self._remember(key, _match(key, response.locations))
+
+    async def resolve(self, sky_id: str, deadline: Optional[Deadline] = None) -> str:
+        """Resolve one sky ID; see EntityResolver.resolve."""
+        return self.cached(sky_id) or await self._lookup(_key(sky_id), deadline)
+
+    async def resolve_many(
+        self,
+        sky_ids: Iterable[str],
+        deadline: Optional[Deadline] = None,
+        return_exceptions: bool = False
+    ) -> Dict[str, Union[str, Exception]]:
+        """Resolve many sky IDs concurrently; see EntityResolver.resolve_many."""
+        sky_ids = list(sky_ids)
+        pending = self._pending(sky_ids)
+        results = await asyncio.gather(*(self._lookup(key, deadline) for key in pending), return_exceptions=return_exceptions)
+        errors = {key: result for key, result in zip(pending, results) if isinstance(result, Exception)}
+        return {sky_id: errors.get(_key(sky_id)) or self._entity_ids[_key(sky_id)] for sky_id in sky_ids}
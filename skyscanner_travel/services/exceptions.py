@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+import requests
+
+
+class SkyscannerAPIError(requests.exceptions.RequestException):
+    """Base class for errors raised by the Skyscanner clients.
+
+    Subclasses ``requests.exceptions.RequestException`` so existing handlers
+    keep working. ``retryable`` tells callers whether repeating the same
+    request may succeed.
+    """
+
+    retryable = False
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AuthenticationError(SkyscannerAPIError):
+    """The API key was rejected (401/403)."""
+
+
+class ClientError(SkyscannerAPIError):
+    """The request was rejected as invalid (4xx other than auth and 429)."""
+
+
+class RateLimitError(SkyscannerAPIError):
+    """The API throttled the request (429)."""
+
+    retryable = True
+
+
+class ServerError(SkyscannerAPIError):
+    """The upstream failed to answer (5xx)."""
+
+    retryable = True
+
+
+class APITimeoutError(SkyscannerAPIError):
+    """The request timed out before a response arrived."""
+
+    retryable = True
+
+
+class DeadlineExceededError(APITimeoutError):
+    """The caller's deadline expired, or is too close for another attempt.
+
+    Not retryable: repeating the request cannot finish within the same budget.
+    """
+
+    retryable = False
+
+
+class APIConnectionError(SkyscannerAPIError):
+    """The connection to the API could not be established or was dropped."""
+
+    retryable = True
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        headers (Optional[Mapping[str, str]]): Response headers
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or malformed
+    """
+    try:
+        value = headers.get("Retry-After") if headers is not None else None
+    except AttributeError:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def error_for_status(status_code: int, message: str, headers: Optional[Mapping[str, str]] = None) -> SkyscannerAPIError:
+    """Build the typed exception matching an HTTP error status.
+
+    Args:
+        status_code (int): HTTP status code of the failed response
+        message (str): Error message
+        headers (Optional[Mapping[str, str]]): Response headers (for Retry-After)
+
+    Returns:
+        SkyscannerAPIError: Exception to raise
+    """
+    retry_after = parse_retry_after(headers)
+    if status_code in (401, 403):
+        error_class = AuthenticationError
+    elif status_code == 429:
+        error_class = RateLimitError
+    elif status_code >= 500:
+        error_class = ServerError
+    else:
+        error_class = ClientError
+    return error_class(message, status_code=status_code, retry_after=retry_after)
@@ -1,31 +1,239 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Callable, Iterable, Iterator, AsyncIterator, Tuple, Union
 from datetime import datetime
-from .skyscanner_client import SkyscannerClient
+from .skyscanner_client import SkyscannerClient, SEARCH_FLIGHTS_ENDPOINT
 from ..models.location import Location
 from ..models.flight import Flight, Price, Stop
 from ..models.flight_response import FlightSearchResponse
+from ..models.flight_query import FlightQuery, SearchResult, SearchUpdate, DetailsResult
+from .polling import PollPolicy
+from .details_prefetch import DetailsPrefetch, AsyncDetailsPrefetch
+from .entity_resolver import EntityResolver, AsyncEntityResolver
+from .instrumentation import measure_models
+from .deadline import Deadline
+
+if TYPE_CHECKING:
+    from .async_client import AsyncSkyscannerClient
 
 class FlightSearchError(Exception):
-    pass
+    """Raised when a flight search fails. The original error is kept as ``__cause__``."""
+
+    @property
+    def retryable(self) -> bool:
+        """Whether the underlying API error is transient."""
+        return getattr(self.__cause__, "retryable", False)
+
+
+def _build_search_response(response: Any, currency: str, market: str, country_code: str, trusted: bool = False) -> FlightSearchResponse:
+    """Turn a decoded searchFlights response into a FlightSearchResponse."""
+    # Validate response format
+    if not isinstance(response, dict) or 'data' not in response:
+        raise Exception("API request failed: Invalid response format")
+
+    data = response['data']
+    if not isinstance(data, dict) or 'itineraries' not in data:
+        raise Exception("API request failed: Invalid response format")
+
+    # Parse every itinerary in one pass; the session ID lives at the root
+    flights = Flight.parse_many(response, trusted=trusted)
+    return _search_response(flights, currency, market, country_code, trusted=trusted)
+
+
+def _search_response(flights: List[Flight], currency: str, market: str, country_code: str, trusted: bool = False) -> FlightSearchResponse:
+    """Wrap parsed flights in a FlightSearchResponse."""
+    build = FlightSearchResponse.model_construct if trusted else FlightSearchResponse
+    return build(
+        flights=flights,
+        total_results=len(flights),
+        currency=currency,
+        market=market,
+        locale="en-US",  # Default locale
+        country_code=country_code
+    )
+
+
+class _SearchPoller:
+    """Tracks one search across incomplete-search polls.
+
+    Itineraries are merged by id; each response is reduced to the flights
+    that are new or whose price changed since an earlier poll.
+    """
+
+    def __init__(self, policy: PollPolicy, currency: str, market: str, country_code: str, trusted: bool = False):
+        self.policy = policy
+        self.currency = currency
+        self.market = market
+        self.country_code = country_code
+        self.trusted = trusted
+        self.flights: Dict[str, Flight] = {}
+        self.session_id: Optional[str] = None
+        self.polls = 0
+        self._started = policy.clock()
+        self._delay: Optional[float] = None
+        self._complete = False
+        self._changed = False
+
+    def update(self, response: Any) -> SearchUpdate:
+        """Merge one searchFlights or searchIncomplete response."""
+        result = _build_search_response(response, self.currency, self.market, self.country_code, trusted=self.trusted)
+        new, repriced = [], []
+        for flight in result.flights:
+            previous = self.flights.get(flight.id)
+            if previous is None:
+                new.append(flight)
+            elif previous.price.amount != flight.price.amount:
+                repriced.append(flight)
+            else:
+                continue
+            self.flights[flight.id] = flight
+
+        context = response['data'].get('context') or {}
+        self.session_id = context.get('sessionId') or self.session_id
+        self._complete = context.get('status') != 'incomplete'
+        self._changed = bool(new or repriced)
+        return SearchUpdate(
+            poll=self.polls,
+            new=new,
+            repriced=repriced,
+            complete=self._complete,
+            total_results=len(self.flights)
+        )
+
+    def next_delay(self) -> Optional[float]:
+        """Return the delay before the next poll, or None once polling is over."""
+        if self._complete or not self.session_id:
+            return None
+        self._delay = self.policy.next_delay(self.polls, self._delay, self._changed, self._started)
+        if self._delay is not None:
+            self.polls += 1
+        return self._delay
+
+    def response(self) -> FlightSearchResponse:
+        """All distinct flights seen so far, at their latest prices."""
+        return _search_response(list(self.flights.values()), self.currency, self.market, self.country_code, trusted=self.trusted)
+
+
+def _stream_flights(events: Iterator[Tuple[str, Any]], trusted: bool = False) -> Iterator[Flight]:
+    """Turn streamed searchFlights events into Flights as each itinerary is decoded."""
+    events = iter(events)
+    session_id = None
+    early = []  # Itineraries seen before the root sessionId, if the API ever reorders them
+    for path, value in events:
+        if path == "sessionId":
+            session_id = value
+            break
+        if path == "data.itineraries":
+            early.append(value)
+        elif path in ("", "data"):
+            # The root or data was not an object
+            raise Exception("API request failed: Invalid response format")
+    if session_id is None:
+        raise Exception("API request failed: Invalid response format")
+
+    seen = {"itineraries": bool(early)}
+
+    def itineraries() -> Iterator[Dict[str, Any]]:
+        yield from early
+        for path, value in events:
+            if path == "data.itineraries":
+                seen["itineraries"] = True
+                yield value
+            elif path == "data":
+                raise Exception("API request failed: Invalid response format")
+
+    yield from Flight.iter_parse(session_id, itineraries(), trusted=trusted)
+    if not seen["itineraries"]:
+        raise Exception("API request failed: Invalid response format")
+
+
+def _as_queries(queries: Iterable[Union[FlightQuery, Dict[str, Any]]]) -> List[FlightQuery]:
+    """Coerce batch search input into FlightQuery objects."""
+    return [q if isinstance(q, FlightQuery) else FlightQuery(**q) for q in queries]
+
+
+def _require_date(date: Optional[str]) -> None:
+    # date follows the optional entity IDs, so it cannot be a required parameter
+    if date is None:
+        raise TypeError("missing required argument: 'date'")
+
+
+def _route_sky_ids(queries: Iterable[FlightQuery]) -> List[str]:
+    """Sky IDs whose entity IDs the queries leave unset."""
+    return [
+        sky_id
+        for query in queries
+        for sky_id, entity_id in ((query.origin_sky_id, query.origin_entity_id),
+                                  (query.destination_sky_id, query.destination_entity_id))
+        if not entity_id
+    ]
+
+
+def _with_entity_ids(query: FlightQuery, resolved: Dict[str, Union[str, Exception]]) -> FlightQuery:
+    """Fill in a query's missing entity IDs from a resolve_many result.
+
+    Raises:
+        FlightSearchError: If a needed sky ID could not be resolved
+    """
+    missing = {}
+    for side in ("origin", "destination"):
+        if not getattr(query, f"{side}_entity_id"):
+            entity_id = resolved[getattr(query, f"{side}_sky_id")]
+            if isinstance(entity_id, Exception):
+                raise FlightSearchError(f"Failed to search flights: {str(entity_id)}") from entity_id
+            missing[f"{side}_entity_id"] = entity_id
+    return query.model_copy(update=missing) if missing else query
+
+
+def _failed(error: Exception) -> Future:
+    future: Future = Future()
+    future.set_exception(error)
+    return future
+
+
+def _build_flight_details(response: Dict[str, Any]) -> Flight:
+    """Turn a decoded getFlightDetails response into a Flight."""
+    if not response.get('status'):
+        error_message = response.get('message', 'Unknown error occurred')
+        raise FlightSearchError(f"Failed to get flight details: {error_message}")
+
+    return Flight.from_api_detail_response(response)
+
 
 class FlightSearch:
     """Service for searching flights using the Skyscanner API."""
 
-    def __init__(self, client: SkyscannerClient):
+    def __init__(
+        self,
+        client: SkyscannerClient,
+        trusted: bool = False,
+        poll_policy: Optional[PollPolicy] = None,
+        resolver: Optional[EntityResolver] = None
+    ):
         """Initialize the service with a client.
 
         Args:
             client (SkyscannerClient): Initialized SkyscannerClient instance
+            trusted (bool): Build result models without pydantic validation
+                after a cheap structural check of the API response
+            poll_policy (Optional[PollPolicy]): Backoff for polling incomplete
+                searches (default: PollPolicy())
+            resolver (Optional[EntityResolver]): Resolves entity IDs that
+                searches leave out (default: one using this client, without
+                an offline index)
         """
         self.client = client
+        self.trusted = trusted
+        self.poll_policy = poll_policy or PollPolicy()
+        self.resolver = resolver or EntityResolver(client)
 
     def search(
         self,
         origin_sky_id: str,
         destination_sky_id: str,
-        origin_entity_id: str,
-        destination_entity_id: str,
-        date: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
         return_date: Optional[str] = None,
         adults: int = 1,
         children: int = 0,
@@ -33,16 +241,20 @@ class FlightSearch:
         cabin_class: str = "economy",
         currency: str = "USD",
         market: str = "en-US",
-        country_code: str = "US"
+        country_code: str = "US",
+        prefetch_details: int = 0,
+        deadline: Optional[Deadline] = None
     ) -> FlightSearchResponse:
         """Search for available flights.
 
         Args:
             origin_sky_id (str): Origin airport Sky ID (e.g. "SDF")
             destination_sky_id (str): Destination airport Sky ID (e.g. "LAS")
-            origin_entity_id (str): Origin airport entity ID
-            destination_entity_id (str): Destination airport entity ID
-            date (str): Departure date in YYYY-MM-DD format
+            origin_entity_id (Optional[str]): Origin airport entity ID; looked
+                up from the sky ID when omitted
+            destination_entity_id (Optional[str]): Destination airport entity
+                ID; looked up from the sky ID when omitted
+            date (str): Departure date in YYYY-MM-DD format (required)
             return_date (Optional[str]): Return date in YYYY-MM-DD format (not supported in v2 API)
             adults (int): Number of adult passengers
             children (int): Number of child passengers
@@ -51,11 +263,21 @@ class FlightSearch:
             currency (str): Currency code (default: USD)
             market (str): Market code (default: en-US)
             country_code (str): Country code (default: US)
+            prefetch_details (int): Start fetching details for this many of the
+                cheapest flights in the background; collect them from the
+                response's ``prefetched_details``
+            deadline (Optional[Deadline]): End-to-end time budget for the
+                search (and for prefetched details)
 
         Returns:
             FlightSearchResponse: Response containing flight results
         """
+        _require_date(date)
         try:
+            origin_entity_id, destination_entity_id = self._entity_ids(
+                origin_sky_id, destination_sky_id, origin_entity_id, destination_entity_id, deadline
+            )
+
             # Make the API request
             response = self.client.search_flights(
                 origin_sky_id=origin_sky_id,
@@ -69,46 +291,280 @@ class FlightSearch:
                 infants=infants,
                 currency=currency,
                 market=market,
-                country_code=country_code
+                country_code=country_code,
+                deadline=deadline
             )
 
-            # Validate response format
-            if not isinstance(response, dict) or 'data' not in response:
-                raise Exception("API request failed: Invalid response format")
+            result = measure_models(
+                self.client, SEARCH_FLIGHTS_ENDPOINT,
+                lambda: _build_search_response(response, currency, market, country_code, trusted=self.trusted),
+                lambda result: len(result.flights)
+            )
 
-            data = response['data']
-            if not isinstance(data, dict) or 'itineraries' not in data:
-                raise Exception("API request failed: Invalid response format")
+        except Exception as e:
+            raise FlightSearchError(f"Failed to search flights: {str(e)}") from e
+
+        if prefetch_details > 0:
+            cheapest = sorted(result.flights, key=lambda flight: flight.price.amount)[:prefetch_details]
+            result._details_prefetch = self.prefetch_flight_details(cheapest, deadline=deadline)
+        return result
+
+    def iter_search(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US"
+    ) -> Iterator[Flight]:
+        """Search for flights, yielding each one as soon as it is downloaded.
+
+        The response body is parsed incrementally, so the first flight is
+        available before the last byte arrives and neither the raw body nor
+        the full decoded response is ever held in memory. Flights are the same
+        as those returned by search(). Streamed searches are not cached.
 
-            # Process flights using Flight.from_api_response
-            flights = []
-            for itinerary in data.get('itineraries', []):
-                # Pass the full response structure to maintain the session ID at root level
-                flight = Flight.from_api_response({
-                    "sessionId": response["sessionId"],  # Get session ID from root of original response
-                    "data": {
-                        "itineraries": [itinerary]
-                    }
-                })
-                flights.append(flight)
-
-            return FlightSearchResponse(
-                flights=flights,
-                total_results=len(flights),
+        Takes the same arguments as search().
+
+        Returns:
+            Iterator[Flight]: Flights in response order
+
+        Raises:
+            FlightSearchError: If the API request fails or the body is malformed
+        """
+        _require_date(date)
+        try:
+            origin_entity_id, destination_entity_id = self._entity_ids(
+                origin_sky_id, destination_sky_id, origin_entity_id, destination_entity_id
+            )
+            events = self.client.stream_search_flights(
+                origin_sky_id=origin_sky_id,
+                destination_sky_id=destination_sky_id,
+                origin_entity_id=origin_entity_id,
+                destination_entity_id=destination_entity_id,
+                date=date,
+                cabin_class=cabin_class,
+                adults=adults,
+                children=children,
+                infants=infants,
                 currency=currency,
                 market=market,
-                locale="en-US",  # Default locale
                 country_code=country_code
             )
+            try:
+                yield from _stream_flights(events, trusted=self.trusted)
+            finally:
+                # Release the connection even if the caller stops early
+                events.close()
 
         except Exception as e:
-            raise FlightSearchError(f"Failed to search flights: {str(e)}")
+            raise FlightSearchError(f"Failed to search flights: {str(e)}") from e
+
+    def iter_updates(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US"
+    ) -> Iterator[SearchUpdate]:
+        """Search for flights and poll until the search is complete.
+
+        The first update holds every flight of the initial response. While
+        ``data.context.status`` is ``incomplete`` the searchIncomplete
+        endpoint is polled following the service's PollPolicy, and each
+        further update holds only the itineraries that are new or were
+        re-priced, so results can be shown early and refined as they arrive.
+
+        Takes the same arguments as search().
+
+        Returns:
+            Iterator[SearchUpdate]: One update per response; the last one has
+            ``complete`` set unless the poll budget ran out first
+
+        Raises:
+            FlightSearchError: If the search or a poll fails
+        """
+        _require_date(date)
+        poller = _SearchPoller(self.poll_policy, currency, market, country_code, trusted=self.trusted)
+        return self._poll(poller, dict(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        ))
 
-    def get_flight_details(self, flight: Flight) -> Flight:
+    def search_complete(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US",
+        on_update: Optional[Callable[[SearchUpdate], Any]] = None
+    ) -> FlightSearchResponse:
+        """Search for flights, polling until every agent has answered.
+
+        Takes the same arguments as search().
+
+        Args:
+            on_update (Optional[Callable[[SearchUpdate], Any]]): Called with
+                each update as it arrives (see iter_updates)
+
+        Returns:
+            FlightSearchResponse: Every distinct flight at its latest price,
+            in the order first seen
+        """
+        _require_date(date)
+        poller = _SearchPoller(self.poll_policy, currency, market, country_code, trusted=self.trusted)
+        for update in self._poll(poller, dict(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        )):
+            if on_update is not None:
+                on_update(update)
+        return poller.response()
+
+    def _poll(self, poller: _SearchPoller, search: Dict[str, Any]) -> Iterator[SearchUpdate]:
+        try:
+            search["origin_entity_id"], search["destination_entity_id"] = self._entity_ids(
+                search["origin_sky_id"], search["destination_sky_id"],
+                search["origin_entity_id"], search["destination_entity_id"]
+            )
+            response = self.client.search_flights(**search)
+            while True:
+                yield poller.update(response)
+                delay = poller.next_delay()
+                if delay is None:
+                    return
+                self.poll_policy.sleep(delay)
+                response = self.client.search_incomplete(
+                    poller.session_id,
+                    currency=poller.currency,
+                    market=poller.market,
+                    country_code=poller.country_code
+                )
+        except Exception as e:
+            raise FlightSearchError(f"Failed to search flights: {str(e)}") from e
+
+    def _entity_ids(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str],
+        destination_entity_id: Optional[str],
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[str, str]:
+        """Fill in missing entity IDs, looking both ends up concurrently.
+
+        A failed lookup raises the resolver's error unchanged, for the
+        caller to wrap in FlightSearchError.
+        """
+        if origin_entity_id and destination_entity_id:
+            return origin_entity_id, destination_entity_id
+        missing = [origin_sky_id] if not origin_entity_id else []
+        if not destination_entity_id:
+            missing.append(destination_sky_id)
+        resolved = self.resolver.resolve_many(missing, deadline=deadline)
+        return origin_entity_id or resolved[origin_sky_id], destination_entity_id or resolved[destination_sky_id]
+
+    def search_many(
+        self,
+        queries: Iterable[Union[FlightQuery, Dict[str, Any]]],
+        max_workers: int = 8,
+        ordered: bool = False
+    ) -> Iterator[SearchResult]:
+        """Run many searches concurrently and yield each result as it completes.
+
+        A failed query, whatever it raised, is reported in its SearchResult
+        and never aborts the rest of the batch, so a 60-date scan takes roughly as long as its
+        slowest call instead of the sum of all calls.
+
+        Entity IDs the queries leave out are resolved first, each distinct
+        sky ID once and all of them concurrently.
+
+        Args:
+            queries (Iterable[Union[FlightQuery, Dict]]): Searches to run; dicts
+                take the same keys as search()
+            max_workers (int): Maximum number of concurrent requests
+            ordered (bool): Yield results in input order instead of completion order
+
+        Returns:
+            Iterator[SearchResult]: One result per query
+        """
+        queries = _as_queries(queries)
+        if not queries:
+            return
+        # Every distinct sky ID missing an entity ID is looked up once, up front
+        resolved = self.resolver.resolve_many(_route_sky_ids(queries), return_exceptions=True)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(queries))))
+        futures: Dict[Future, int] = {}
+        for index, query in enumerate(queries):
+            try:
+                query = queries[index] = _with_entity_ids(query, resolved)
+            except Exception as e:
+                futures[_failed(e)] = index
+                continue
+            futures[executor.submit(self.search, **query.model_dump())] = index
+        try:
+            pending = list(futures) if ordered else as_completed(futures)
+            for future in pending:
+                index = futures[future]
+                try:
+                    yield SearchResult(index=index, query=queries[index], response=future.result())
+                except Exception as e:
+                    yield SearchResult(index=index, query=queries[index], error=e)
+        finally:
+            # Stop queued searches if the caller abandons the iterator early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def get_flight_details(self, flight: Flight, deadline: Optional[Deadline] = None) -> Flight:
         """Get detailed information about a specific flight.
 
         Args:
             flight (Flight): Flight object to get details for
+            deadline (Optional[Deadline]): End-to-end time budget
 
         Returns:
             Flight: Detailed flight information
@@ -117,11 +573,354 @@ class FlightSearch:
             FlightSearchError: If the API request fails
         """
         response = self.client.get_flight_details(
-            flight=flight
+            flight=flight,
+            deadline=deadline
+        )
+
+        return _build_flight_details(response)
+
+    def prefetch_flight_details(self, flights: Iterable[Flight], max_concurrency: int = 8,
+                                deadline: Optional[Deadline] = None) -> DetailsPrefetch:
+        """Start fetching details for several flights in the background.
+
+        Args:
+            flights (Iterable[Flight]): Flights to look up
+            max_concurrency (int): Maximum number of concurrent requests
+            deadline (Optional[Deadline]): Time budget shared by all lookups
+
+        Returns:
+            DetailsPrefetch: Handle to wait for the results
+        """
+        fetch = self.get_flight_details if deadline is None else lambda flight: self.get_flight_details(flight, deadline=deadline)
+        return DetailsPrefetch(fetch, list(flights), max_concurrency=max_concurrency)
+
+    def get_flight_details_many(self, flights: Iterable[Flight], max_concurrency: int = 8,
+                                deadline: Optional[Deadline] = None) -> List[DetailsResult]:
+        """Get details for several flights concurrently.
+
+        Requests share the client's session and rate limiter. A failed lookup
+        is reported in its DetailsResult and never aborts the others.
+
+        Args:
+            flights (Iterable[Flight]): Flights to get details for
+            max_concurrency (int): Maximum number of concurrent requests
+            deadline (Optional[Deadline]): Time budget shared by all lookups;
+                lookups still pending when it expires fail with
+                DeadlineExceededError
+
+        Returns:
+            List[DetailsResult]: One result per flight, in input order
+        """
+        return self.prefetch_flight_details(flights, max_concurrency=max_concurrency, deadline=deadline).results()
+
+class AsyncFlightSearch:
+    """Asyncio service for searching flights using the Skyscanner API."""
+
+    def __init__(
+        self,
+        client: "AsyncSkyscannerClient",
+        trusted: bool = False,
+        poll_policy: Optional[PollPolicy] = None,
+        resolver: Optional[AsyncEntityResolver] = None
+    ):
+        """Initialize the service with a client.
+
+        Args:
+            client (AsyncSkyscannerClient): Initialized AsyncSkyscannerClient instance
+            trusted (bool): Build result models without pydantic validation
+                after a cheap structural check of the API response
+            poll_policy (Optional[PollPolicy]): Backoff for polling incomplete
+                searches (default: PollPolicy())
+            resolver (Optional[AsyncEntityResolver]): Resolves entity IDs that
+                searches leave out (default: one using this client)
+        """
+        self.client = client
+        self.trusted = trusted
+        self.poll_policy = poll_policy or PollPolicy()
+        self.resolver = resolver or AsyncEntityResolver(client)
+
+    async def search(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        return_date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US",
+        prefetch_details: int = 0,
+        deadline: Optional[Deadline] = None
+    ) -> FlightSearchResponse:
+        """Search for available flights.
+
+        Takes the same arguments as FlightSearch.search; prefetched details
+        are looked up as tasks on the running event loop.
+
+        Returns:
+            FlightSearchResponse: Response containing flight results
+
+        Raises:
+            FlightSearchError: If the API request fails
+        """
+        _require_date(date)
+        try:
+            origin_entity_id, destination_entity_id = await self._entity_ids(
+                origin_sky_id, destination_sky_id, origin_entity_id, destination_entity_id, deadline
+            )
+            response = await self.client.search_flights(
+                origin_sky_id=origin_sky_id,
+                destination_sky_id=destination_sky_id,
+                origin_entity_id=origin_entity_id,
+                destination_entity_id=destination_entity_id,
+                date=date,
+                cabin_class=cabin_class,
+                adults=adults,
+                children=children,
+                infants=infants,
+                currency=currency,
+                market=market,
+                country_code=country_code,
+                deadline=deadline
+            )
+
+            result = measure_models(
+                self.client, SEARCH_FLIGHTS_ENDPOINT,
+                lambda: _build_search_response(response, currency, market, country_code, trusted=self.trusted),
+                lambda result: len(result.flights)
+            )
+
+        except Exception as e:
+            raise FlightSearchError(f"Failed to search flights: {str(e)}") from e
+
+        if prefetch_details > 0:
+            cheapest = sorted(result.flights, key=lambda flight: flight.price.amount)[:prefetch_details]
+            result._details_prefetch = self.prefetch_flight_details(cheapest, deadline=deadline)
+        return result
+
+    def iter_updates(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US"
+    ) -> AsyncIterator[SearchUpdate]:
+        """Search for flights and poll until the search is complete.
+
+        Asyncio version of FlightSearch.iter_updates; takes the same arguments.
+
+        Returns:
+            AsyncIterator[SearchUpdate]: One update per response
+
+        Raises:
+            FlightSearchError: If the search or a poll fails
+        """
+        _require_date(date)
+        poller = _SearchPoller(self.poll_policy, currency, market, country_code, trusted=self.trusted)
+        return self._poll(poller, dict(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        ))
+
+    async def search_complete(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str] = None,
+        destination_entity_id: Optional[str] = None,
+        date: Optional[str] = None,
+        adults: int = 1,
+        children: int = 0,
+        infants: int = 0,
+        cabin_class: str = "economy",
+        currency: str = "USD",
+        market: str = "en-US",
+        country_code: str = "US",
+        on_update: Optional[Callable[[SearchUpdate], Any]] = None
+    ) -> FlightSearchResponse:
+        """Search for flights, polling until every agent has answered.
+
+        Asyncio version of FlightSearch.search_complete; ``on_update`` may be
+        a plain function or a coroutine function.
+
+        Returns:
+            FlightSearchResponse: Every distinct flight at its latest price
+        """
+        _require_date(date)
+        poller = _SearchPoller(self.poll_policy, currency, market, country_code, trusted=self.trusted)
+        async for update in self._poll(poller, dict(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        )):
+            if on_update is not None:
+                result = on_update(update)
+                if asyncio.iscoroutine(result):
+                    await result
+        return poller.response()
+
+    async def _poll(self, poller: _SearchPoller, search: Dict[str, Any]) -> AsyncIterator[SearchUpdate]:
+        try:
+            search["origin_entity_id"], search["destination_entity_id"] = await self._entity_ids(
+                search["origin_sky_id"], search["destination_sky_id"],
+                search["origin_entity_id"], search["destination_entity_id"]
+            )
+            response = await self.client.search_flights(**search)
+            while True:
+                yield poller.update(response)
+                delay = poller.next_delay()
+                if delay is None:
+                    return
+                await asyncio.sleep(delay)
+                response = await self.client.search_incomplete(
+                    poller.session_id,
+                    currency=poller.currency,
+                    market=poller.market,
+                    country_code=poller.country_code
+                )
+        except Exception as e:
+            raise FlightSearchError(f"Failed to search flights: {str(e)}") from e
+
+    async def _entity_ids(
+        self,
+        origin_sky_id: str,
+        destination_sky_id: str,
+        origin_entity_id: Optional[str],
+        destination_entity_id: Optional[str],
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[str, str]:
+        """Fill in missing entity IDs, looking both ends up concurrently.
+
+        A failed lookup raises the resolver's error unchanged, for the
+        caller to wrap in FlightSearchError.
+        """
+        if origin_entity_id and destination_entity_id:
+            return origin_entity_id, destination_entity_id
+        missing = [origin_sky_id] if not origin_entity_id else []
+        if not destination_entity_id:
+            missing.append(destination_sky_id)
+        resolved = await self.resolver.resolve_many(missing, deadline=deadline)
+        return origin_entity_id or resolved[origin_sky_id], destination_entity_id or resolved[destination_sky_id]
+
+    async def search_many(
+        self,
+        queries: Iterable[Union[FlightQuery, Dict[str, Any]]],
+        ordered: bool = False
+    ) -> AsyncIterator[SearchResult]:
+        """Run many searches concurrently and yield each result as it completes.
+
+        Concurrency is bounded by the client's semaphore. A failed query,
+        whatever it raised, is reported in its SearchResult and never aborts
+        the rest of the batch.
+        Missing entity IDs are resolved first, each distinct sky ID once.
+
+        Args:
+            queries (Iterable[Union[FlightQuery, Dict]]): Searches to run
+            ordered (bool): Yield results in input order instead of completion order
+
+        Returns:
+            AsyncIterator[SearchResult]: One result per query
+        """
+        queries = _as_queries(queries)
+        resolved = await self.resolver.resolve_many(_route_sky_ids(queries), return_exceptions=True)
+
+        async def run(index: int, query: FlightQuery) -> SearchResult:
+            try:
+                query = _with_entity_ids(query, resolved)
+                return SearchResult(index=index, query=query, response=await self.search(**query.model_dump()))
+            except Exception as e:
+                return SearchResult(index=index, query=query, error=e)
+
+        tasks = [asyncio.ensure_future(run(index, query)) for index, query in enumerate(queries)]
+        try:
+            for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_flight_details(self, flight: Flight, deadline: Optional[Deadline] = None) -> Flight:
+        """Get detailed information about a specific flight.
+
+        Args:
+            flight (Flight): Flight object to get details for
+            deadline (Optional[Deadline]): End-to-end time budget
+
+        Returns:
+            Flight: Detailed flight information
+
+        Raises:
+            FlightSearchError: If the API request fails
+        """
+        response = await self.client.get_flight_details(
+            flight=flight,
+            deadline=deadline
         )
+        return _build_flight_details(response)
+
+    def prefetch_flight_details(self, flights: Iterable[Flight], max_concurrency: int = 8,
+                                deadline: Optional[Deadline] = None) -> AsyncDetailsPrefetch:
+        """Start fetching details for several flights as background tasks.
+
+        Args:
+            flights (Iterable[Flight]): Flights to look up
+            max_concurrency (int): Maximum number of concurrent requests
+            deadline (Optional[Deadline]): Time budget shared by all lookups
 
-        if not response.get('status'):
-            error_message = response.get('message', 'Unknown error occurred')
-            raise FlightSearchError(f"Failed to get flight details: {error_message}")
+        Returns:
+            AsyncDetailsPrefetch: Handle to await the results
+        """
+        return AsyncDetailsPrefetch(lambda flight: self.get_flight_details(flight, deadline=deadline),
+                                    list(flights), max_concurrency=max_concurrency)
+
+    async def get_flight_details_many(self, flights: Iterable[Flight], max_concurrency: int = 8,
+                                      deadline: Optional[Deadline] = None) -> List[DetailsResult]:
+        """Get details for several flights concurrently.
+
+        Concurrency is bounded by ``max_concurrency`` and by the client's
+        semaphore. A failed lookup is reported in its DetailsResult and never
+        aborts the others.
 
-        return Flight.from_api_detail_response(response)
\ No newline at end of file
+        Args:
+            flights (Iterable[Flight]): Flights to get details for
+            max_concurrency (int): Maximum number of concurrent requests
+            deadline (Optional[Deadline]): Time budget shared by all lookups;
+                lookups still pending when it expires fail with
+                DeadlineExceededError
+
+        Returns:
+            List[DetailsResult]: One result per flight, in input order
+        """
+        return await self.prefetch_flight_details(flights, max_concurrency=max_concurrency, deadline=deadline).results()
@@ -0,0 +1,308 @@
+import bisect
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, TypeVar
+from pydantic import BaseModel, ConfigDict
+from .cache import normalize_endpoint
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None
+
+
+class ClientEvent(BaseModel):
+    """Base class for instrumentation events; ``hook`` names the ClientHooks method."""
+    model_config = ConfigDict(frozen=True)
+
+    hook: ClassVar[str] = ""
+    endpoint: str
+
+
+class RequestStart(ClientEvent):
+    """A request is about to go on the wire (after any rate-limit wait)."""
+    hook: ClassVar[str] = "on_request_start"
+
+    method: str
+
+
+class RequestEnd(ClientEvent):
+    """A request finished; ``latency`` is the upstream time in seconds.
+
+    ``status`` is None when no response arrived (timeouts, connection
+    errors). ``error`` holds the exception class name of a failed request.
+    """
+    hook: ClassVar[str] = "on_request_end"
+
+    method: str
+    status: Optional[int] = None
+    bytes: int = 0
+    latency: float
+    error: Optional[str] = None
+
+
+class RetryEvent(ClientEvent):
+    """A failed attempt will be retried after ``delay`` seconds."""
+    hook: ClassVar[str] = "on_retry"
+
+    attempt: int
+    delay: float
+    error: str
+
+
+class CacheHit(ClientEvent):
+    """A call was answered from a cache (``response``, ``location`` or ``details``)."""
+    hook: ClassVar[str] = "on_cache_hit"
+
+    cache: str
+
+
+class ParseEvent(ClientEvent):
+    """Time spent turning a response into data.
+
+    ``stage`` is ``decode`` for JSON decoding and ``models`` for building
+    result models; ``items`` counts the models built.
+    """
+    hook: ClassVar[str] = "on_parse"
+
+    stage: str
+    duration: float
+    items: int = 0
+
+
+class ClientHooks:
+    """Receives instrumentation events from the Skyscanner clients.
+
+    Subclass and override the events you need; every method is a no-op by
+    default. Hooks run synchronously on the request path (on the calling
+    thread or event loop) and must be cheap and thread-safe.
+    """
+
+    def on_request_start(self, event: RequestStart) -> None:
+        pass
+
+    def on_request_end(self, event: RequestEnd) -> None:
+        pass
+
+    def on_retry(self, event: RetryEvent) -> None:
+        pass
+
+    def on_cache_hit(self, event: CacheHit) -> None:
+        pass
+
+    def on_parse(self, event: ParseEvent) -> None:
+        pass
+
+
+T = TypeVar("T")
+
+
+def measure_models(client: Any, endpoint: str, build: Callable[[], T], count: Callable[[T], int]) -> T:
+    """Run ``build`` and report its duration as a ``models`` ParseEvent on the client's hooks.
+
+    Args:
+        client: Client whose hooks receive the event
+        endpoint (str): Endpoint the models were built from
+        build (Callable[[], T]): Builds the result models
+        count (Callable[[T], int]): Counts the models in the result
+
+    Returns:
+        T: Whatever ``build`` returned
+    """
+    if not getattr(client, "hooks", None):
+        return build()
+    started = time.perf_counter()
+    result = build()
+    client.notify(ParseEvent(endpoint=normalize_endpoint(endpoint), stage="models",
+                             duration=time.perf_counter() - started, items=count(result)))
+    return result
+
+
+# Bucket upper bounds: seconds for durations, bytes for sizes
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000, 50_000_000)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max (not thread-safe on its own)."""
+
+    def __init__(self, buckets: Iterable[float] = DURATION_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                lower = self.buckets[index - 1] if index > 0 else self.min
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (target - seen) / count
+            seen += count
+        return self.max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsCollector(ClientHooks):
+    """In-process metrics built from client events.
+
+    Histograms (per endpoint): ``request_latency`` and ``request_bytes`` for
+    the network, ``decode_seconds`` for JSON decoding and ``model_seconds``
+    for model construction. Counters: requests by endpoint and status,
+    errors, retries and cache hits. Read them with snapshot() or export them
+    with to_prometheus().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.counters: Dict[Tuple[str, ...], int] = {}
+
+    def _observe(self, name: str, endpoint: str, value: float, buckets: Iterable[float] = DURATION_BUCKETS) -> None:
+        histogram = self.histograms.get((name, endpoint))
+        if histogram is None:
+            histogram = self.histograms[(name, endpoint)] = Histogram(buckets)
+        histogram.observe(value)
+
+    def _count(self, *key: str) -> None:
+        self.counters[key] = self.counters.get(key, 0) + 1
+
+    def on_request_end(self, event: RequestEnd) -> None:
+        with self._lock:
+            self._observe("request_latency", event.endpoint, event.latency)
+            if event.status is not None:
+                self._observe("request_bytes", event.endpoint, event.bytes, SIZE_BUCKETS)
+            self._count("requests", event.endpoint, str(event.status) if event.status is not None else "none")
+            if event.error is not None:
+                self._count("errors", event.endpoint, event.error)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        with self._lock:
+            self._count("retries", event.endpoint, event.error)
+
+    def on_cache_hit(self, event: CacheHit) -> None:
+        with self._lock:
+            self._count("cache_hits", event.endpoint, event.cache)
+
+    def on_parse(self, event: ParseEvent) -> None:
+        with self._lock:
+            self._observe(f"{event.stage}_seconds", event.endpoint, event.duration)
+
+    def histogram(self, name: str, endpoint: str) -> Optional[Histogram]:
+        return self.histograms.get((name, endpoint))
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """Return histogram summaries and counters as plain dicts.
+
+        Returns:
+            Dict: ``{"histograms": {"name endpoint": summary}, "counters": {"name labels": n}}``
+        """
+        with self._lock:
+            return {
+                "histograms": {f"{name} {endpoint}": h.summary() for (name, endpoint), h in sorted(self.histograms.items())},
+                "counters": {" ".join(key): value for key, value in sorted(self.counters.items())},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def to_prometheus(self, prefix: str = "skyscanner") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Serve the result from any HTTP endpoint for Prometheus to scrape; no
+        client library is required.
+        """
+        labels_for = {
+            "requests": ("endpoint", "status"),
+            "errors": ("endpoint", "error"),
+            "retries": ("endpoint", "error"),
+            "cache_hits": ("endpoint", "cache"),
+        }
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.histograms}):
+                metric = f"{prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (hist_name, endpoint), histogram in sorted(self.histograms.items()):
+                    if hist_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{le}"}} {cumulative}')
+                    lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {histogram.count}')
+            for name in sorted({key[0] for key in self.counters}):
+                metric = f"{prefix}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in sorted(self.counters.items()):
+                    if key[0] != name:
+                        continue
+                    labels = ",".join(f'{label}="{value_}"' for label, value_ in zip(labels_for[name], key[1:]))
+                    lines.append(f"{metric}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHooks(ClientHooks):
+    """Record client events as OpenTelemetry metrics.
+
+    Uses the globally configured MeterProvider unless a meter is given.
+    Requires the ``opentelemetry-api`` package.
+    """
+
+    def __init__(self, meter=None):
+        if otel_metrics is None:
+            raise ImportError("OpenTelemetryHooks requires opentelemetry-api. Install it with: pip install skyscanner-travel[otel]")
+        meter = meter or otel_metrics.get_meter("skyscanner_travel")
+        self._latency = meter.create_histogram("skyscanner.request.duration", unit="s", description="Upstream request latency")
+        self._bytes = meter.create_histogram("skyscanner.response.size", unit="By", description="Response body size")
+        self._parse = meter.create_histogram("skyscanner.parse.duration", unit="s", description="JSON decoding and model construction time")
+        self._requests = meter.create_counter("skyscanner.requests", description="Requests by endpoint and status")
+        self._retries = meter.create_counter("skyscanner.retries", description="Retried attempts")
+        self._cache_hits = meter.create_counter("skyscanner.cache.hits", description="Calls answered from a cache")
+
+    def on_request_end(self, event: RequestEnd) -> None:
+        attributes = {"endpoint": event.endpoint, "status": str(event.status) if event.status is not None else "none"}
+        if event.error is not None:
+            attributes["error"] = event.error
+        self._latency.record(event.latency, attributes)
+        self._bytes.record(event.bytes, {"endpoint": event.endpoint})
+        self._requests.add(1, attributes)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        self._retries.add(1, {"endpoint": event.endpoint, "error": event.error})
+
+    def on_cache_hit(self, event: CacheHit) -> None:
+        self._cache_hits.add(1, {"endpoint": event.endpoint, "cache": event.cache})
+
+    def on_parse(self, event: ParseEvent) -> None:
+        self._parse.record(event.duration, {"endpoint": event.endpoint, "stage": event.stage})
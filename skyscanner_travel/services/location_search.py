@@ -1,20 +1,68 @@
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from ..models.location import Location
 from ..models.location_response import LocationResponse
 from .skyscanner_client import SkyscannerClient
+from .autocomplete import LocationAutocomplete
+from .deadline import Deadline
+
+if TYPE_CHECKING:
+    from .async_client import AsyncSkyscannerClient
+    from .airport_index import LocationResolver
 
 class LocationSearchError(Exception):
-    pass
+    """Raised when a location search fails. The original error is kept as ``__cause__``."""
+
+    @property
+    def retryable(self) -> bool:
+        """Whether the underlying API error is transient."""
+        return getattr(self.__cause__, "retryable", False)
+
+
+def _default_completer(client, resolver: Optional["LocationResolver"]) -> LocationAutocomplete:
+    """An autocomplete engine filled from the offline index and the location cache."""
+    completer = LocationAutocomplete(resolver.index if resolver is not None else ())
+    if hasattr(client.location_cache, "values"):
+        completer.add_cached(client.location_cache)
+    return completer
+
+
+def _suggestions(locations: List[Location]) -> LocationResponse:
+    return LocationResponse.model_construct(locations=locations, total_results=len(locations))
+
 
 class LocationSearch:
-    def __init__(self, api_key: str):
-        self.client = SkyscannerClient(api_key)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[SkyscannerClient] = None,
+        trusted: bool = False,
+        resolver: Optional["LocationResolver"] = None,
+        completer: Optional[LocationAutocomplete] = None
+    ):
+        """Initialize the service with an API key or a shared client.
+
+        Args:
+            api_key (Optional[str]): RapidAPI key, used to create a client
+            client (Optional[SkyscannerClient]): Existing client to share
+                (e.g. one configured with a location_cache)
+            trusted (bool): Build result models without pydantic validation
+            resolver (Optional[LocationResolver]): Offline index consulted
+                before the API; sky ID queries it knows skip the request
+            completer (Optional[LocationAutocomplete]): Engine serving
+                autocomplete(); by default one is filled from the resolver's
+                index and the client's location cache on first use
+        """
+        self.client = client or SkyscannerClient(api_key)
+        self.trusted = trusted
+        self.resolver = resolver
+        self.completer = completer
 
-    def search(self, query: str) -> LocationResponse:
+    def search(self, query: str, deadline: Optional[Deadline] = None) -> LocationResponse:
         """Search for locations matching the query.
 
         Args:
             query (str): Search query
+            deadline (Optional[Deadline]): End-to-end time budget
 
         Returns:
             LocationResponse: Response containing list of locations
@@ -23,12 +71,43 @@ class LocationSearch:
             LocationSearchError: If the API request fails
         """
         try:
-            response = self.client.search_locations(query)
-            if not response or not isinstance(response, dict):
-                raise LocationSearchError("Invalid API response format")
-            return LocationResponse.from_api_response(response)
+            if self.resolver is not None:
+                resolved = self.resolver.resolve(query)
+                if resolved is not None:
+                    return resolved
+            return self.client.search_location_models(query, deadline=deadline, trusted=self.trusted)
         except Exception as e:
-            raise LocationSearchError(str(e))
+            raise LocationSearchError(str(e)) from e
+
+    def autocomplete(self, query: str, limit: int = 10, deadline: Optional[Deadline] = None) -> LocationResponse:
+        """Suggest locations for a partially typed query, e.g. on every keystroke.
+
+        Served from the local completer: exact code matches first, then
+        airports, then cities, ignoring case and accents. Only a query with
+        no local match is searched through the API, and its results are
+        added to the completer so that the following keystrokes stay local.
+
+        Args:
+            query (str): Text typed so far
+            limit (int): Maximum number of suggestions
+            deadline (Optional[Deadline]): End-to-end time budget for an API fallback
+
+        Returns:
+            LocationResponse: Up to ``limit`` suggestions, best first
+
+        Raises:
+            LocationSearchError: If the API fallback fails
+        """
+        if not query.strip():
+            return _suggestions([])
+        if self.completer is None:
+            self.completer = _default_completer(self.client, self.resolver)
+        locations = self.completer.complete(query, limit)
+        if not locations:
+            response = self.search(query, deadline=deadline)
+            self.completer.add(response.locations)
+            locations = response.locations[:limit]
+        return _suggestions(locations)
 
     def print_results(self, response: LocationResponse) -> None:
         """Print the search results in a formatted way."""
@@ -44,3 +123,88 @@ class LocationSearch:
             if location.distance_to_city_value is not None:
                 print(f"   Distance to city: {location.distance_to_city_value} {location.distance_to_city_unit}")
         print("\n" + "-" * 50)
+
+
+class AsyncLocationSearch:
+    """Asyncio service for searching locations using the Skyscanner API."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional["AsyncSkyscannerClient"] = None,
+        trusted: bool = False,
+        resolver: Optional["LocationResolver"] = None,
+        completer: Optional[LocationAutocomplete] = None
+    ):
+        """Initialize the service with an API key or a shared client.
+
+        Args:
+            api_key (Optional[str]): RapidAPI key, used to create a client
+            client (Optional[AsyncSkyscannerClient]): Existing client to share
+            trusted (bool): Build result models without pydantic validation
+            resolver (Optional[LocationResolver]): Offline index consulted
+                before the API; sky ID queries it knows skip the request
+            completer (Optional[LocationAutocomplete]): Engine serving
+                autocomplete(); by default one is filled from the resolver's
+                index and the client's location cache on first use
+        """
+        if client is None:
+            # Imported here so the sync services never load httpx
+            from .async_client import AsyncSkyscannerClient
+            client = AsyncSkyscannerClient(api_key)
+        self.client = client
+        self.trusted = trusted
+        self.resolver = resolver
+        self.completer = completer
+
+    async def search(self, query: str, deadline: Optional[Deadline] = None) -> LocationResponse:
+        """Search for locations matching the query.
+
+        Args:
+            query (str): Search query
+            deadline (Optional[Deadline]): End-to-end time budget
+
+        Returns:
+            LocationResponse: Response containing list of locations
+
+        Raises:
+            LocationSearchError: If the API request fails
+        """
+        try:
+            if self.resolver is not None:
+                resolved = self.resolver.resolve(query)
+                if resolved is not None:
+                    return resolved
+            return await self.client.search_location_models(query, deadline=deadline, trusted=self.trusted)
+        except Exception as e:
+            raise LocationSearchError(str(e)) from e
+
+    async def autocomplete(self, query: str, limit: int = 10, deadline: Optional[Deadline] = None) -> LocationResponse:
+        """Suggest locations for a partially typed query, e.g. on every keystroke.
+
+        Served from the local completer: exact code matches first, then
+        airports, then cities, ignoring case and accents. Only a query with
+        no local match is searched through the API, and its results are
+        added to the completer so that the following keystrokes stay local.
+
+        Args:
+            query (str): Text typed so far
+            limit (int): Maximum number of suggestions
+            deadline (Optional[Deadline]): End-to-end time budget for an API fallback
+
+        Returns:
+            LocationResponse: Up to ``limit`` suggestions, best first
+
+        Raises:
+            LocationSearchError: If the API fallback fails
+        """
+        if not query.strip():
+            return _suggestions([])
+        if self.completer is None:
+            self.completer = _default_completer(self.client, self.resolver)
+        locations = self.completer.complete(query, limit)
+        if not locations:
+            response = await self.search(query, deadline=deadline)
+            self.completer.add(response.locations)
+            locations = response.locations[:limit]
+        return _suggestions(locations)
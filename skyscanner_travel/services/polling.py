@@ -0,0 +1,66 @@
+import time
+from typing import Optional
+
+
+class PollPolicy:
+    """Adaptive backoff for polling incomplete flight searches.
+
+    The first follow-up poll waits ``initial_delay``. While polls keep
+    turning up new or re-priced itineraries the delay stays there; each poll
+    that changes nothing multiplies it by ``backoff``, up to ``max_delay``.
+    Polling stops after ``max_polls`` follow-ups or when the next poll would
+    start more than ``max_elapsed`` seconds after the search began.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        max_delay: float = 5.0,
+        backoff: float = 2.0,
+        max_polls: int = 10,
+        max_elapsed: float = 60.0,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        """Initialize the policy.
+
+        Args:
+            initial_delay (float): Delay before the first poll in seconds
+            max_delay (float): Longest delay between polls in seconds
+            backoff (float): Delay multiplier after a poll with no changes
+            max_polls (int): Maximum number of follow-up polls (0 disables polling)
+            max_elapsed (float): Total time budget for polling in seconds
+            clock: Monotonic time source
+            sleep: Blocking sleep function
+        """
+        if initial_delay < 0 or max_delay < initial_delay or backoff < 1:
+            raise ValueError("Delays must satisfy 0 <= initial_delay <= max_delay and backoff must be at least 1")
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.max_polls = max_polls
+        self.max_elapsed = max_elapsed
+        self.clock = clock
+        self.sleep = sleep
+
+    def next_delay(self, polls: int, previous_delay: Optional[float], changed: bool, started: float) -> Optional[float]:
+        """Return the delay before the next poll, or None to stop polling.
+
+        Args:
+            polls (int): Number of follow-up polls made so far
+            previous_delay (Optional[float]): Delay before the last poll (None before the first)
+            changed (bool): Whether the last response added or re-priced itineraries
+            started (float): Clock time the search started
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if polling should stop
+        """
+        if polls >= self.max_polls:
+            return None
+        if previous_delay is None or changed:
+            delay = self.initial_delay
+        else:
+            delay = min(self.max_delay, previous_delay * self.backoff)
+        if self.clock() - started + delay > self.max_elapsed:
+            return None
+        return delay
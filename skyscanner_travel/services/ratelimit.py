@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+from .cache import normalize_endpoint
+
+LIMIT_HEADER = "x-ratelimit-requests-limit"
+REMAINING_HEADER = "x-ratelimit-requests-remaining"
+RESET_HEADER = "x-ratelimit-requests-reset"
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``reserve()`` always takes a token, letting the balance go negative, and
+    returns how long the caller must wait before using it. Callers therefore
+    queue up fairly without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        """Initialize a full bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum burst size
+            clock: Monotonic time source
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the delay in seconds before it is valid."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, crediting tokens earned at the old rate."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+class QuotaSnapshot(BaseModel):
+    """Read-only view of the client-side rate limiter state."""
+    model_config = ConfigDict(frozen=True)
+
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_in: Optional[float] = None
+    rate: float
+    tokens: Dict[str, float]
+    throttled_seconds: float = 0.0
+
+
+class RateLimiter:
+    """Client-side token-bucket rate limiter calibrated from RapidAPI headers.
+
+    Every request takes a token from the global bucket and, if configured,
+    from its endpoint's own bucket. RapidAPI's ``x-ratelimit-requests-*``
+    headers are fed back after each response: once the quota is exhausted,
+    requests wait for the reset instead of being rejected with 429s. With
+    ``spread_quota`` the global rate is also lowered so the remaining quota
+    lasts until the reset.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 5,
+        endpoint_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        spread_quota: bool = False,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate (float): Requests per second across all endpoints
+            burst (int): Maximum burst across all endpoints
+            endpoint_limits (Optional[Dict[str, Tuple[float, int]]]): Extra
+                (rate, burst) limits for individual endpoints
+            spread_quota (bool): Pace requests so the remaining quota lasts
+                until it resets
+            clock: Monotonic time source
+            sleep: Blocking sleep function
+        """
+        self.configured_rate = rate
+        self.spread_quota = spread_quota
+        self._clock = clock
+        self._sleep = sleep
+        self._bucket = TokenBucket(rate, burst, clock=clock)
+        self._endpoint_buckets = {
+            normalize_endpoint(endpoint): TokenBucket(endpoint_rate, endpoint_burst, clock=clock)
+            for endpoint, (endpoint_rate, endpoint_burst) in (endpoint_limits or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._throttled = 0.0
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve capacity for one request and return how long to wait for it."""
+        with self._lock:
+            if self._reset_at is not None and self._clock() >= self._reset_at:
+                # The quota window rolled over; trust the next response's headers
+                self._remaining = None
+                self._reset_at = None
+                if self.spread_quota:
+                    self._bucket.set_rate(self.configured_rate)
+        delay = self._bucket.reserve()
+        bucket = self._endpoint_buckets.get(normalize_endpoint(endpoint))
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        with self._lock:
+            now = self._clock()
+            if self._remaining is not None:
+                if self._remaining <= 0 and self._reset_at is not None:
+                    delay = max(delay, self._reset_at - now)
+                else:
+                    self._remaining -= 1
+            self._throttled += delay
+        return delay
+
+    def acquire(self, endpoint: str, max_wait: Optional[float] = None) -> None:
+        """Block until a request to ``endpoint`` may be sent.
+
+        Raises:
+            TimeoutError: If the wait would exceed ``max_wait`` seconds (the
+                reserved slot is not given back)
+        """
+        delay = self._reserve_within(endpoint, max_wait)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def acquire_async(self, endpoint: str, max_wait: Optional[float] = None) -> None:
+        """Wait on the event loop until a request to ``endpoint`` may be sent.
+
+        Raises:
+            TimeoutError: If the wait would exceed ``max_wait`` seconds
+        """
+        delay = self._reserve_within(endpoint, max_wait)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve_within(self, endpoint: str, max_wait: Optional[float]) -> float:
+        delay = self.reserve(endpoint)
+        if max_wait is not None and delay > max_wait:
+            raise TimeoutError(f"Rate limit wait of {delay:.2f}s for {normalize_endpoint(endpoint)} exceeds {max_wait:.2f}s")
+        return delay
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Calibrate the limiter from RapidAPI rate-limit response headers."""
+        limit = _header_int(headers, LIMIT_HEADER)
+        remaining = _header_int(headers, REMAINING_HEADER)
+        reset = _header_int(headers, RESET_HEADER)
+        if remaining is None:
+            return
+        with self._lock:
+            now = self._clock()
+            self._limit = limit
+            self._remaining = remaining
+            self._reset_at = now + reset if reset is not None else None
+            # An exhausted quota already waits for the reset in reserve()
+            if self.spread_quota and reset and remaining > 0:
+                self._bucket.set_rate(max(min(self.configured_rate, remaining / reset), 1e-6))
+
+    def snapshot(self) -> QuotaSnapshot:
+        """Return the current quota and bucket state."""
+        tokens = {"*": self._bucket.tokens}
+        tokens.update({endpoint: bucket.tokens for endpoint, bucket in self._endpoint_buckets.items()})
+        with self._lock:
+            reset_in = max(0.0, self._reset_at - self._clock()) if self._reset_at is not None else None
+            return QuotaSnapshot(
+                limit=self._limit,
+                remaining=self._remaining,
+                reset_in=reset_in,
+                rate=self._bucket.rate,
+                tokens=tokens,
+                throttled_seconds=self._throttled
+            )
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        value = headers.get(name)
+        return int(float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
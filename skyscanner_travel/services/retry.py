@@ -0,0 +1,130 @@
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional
+from .exceptions import SkyscannerAPIError
+
+if TYPE_CHECKING:
+    from .deadline import Deadline
+
+RetryCallback = Callable[[Exception, int, float], None]
+
+
+class RetryPolicy:
+    """Retry transient API failures with decorrelated-jitter backoff.
+
+    Only retryable errors (timeouts, connection failures, 429 and 5xx) of
+    idempotent methods are retried. Each delay is drawn uniformly between
+    ``base_delay`` and three times the previous delay, capped at
+    ``max_delay``; a ``Retry-After`` from the server is treated as a minimum.
+    Retrying stops after ``max_attempts`` attempts, when the next attempt
+    would start after ``max_elapsed`` seconds, or when it would start after
+    the caller's deadline.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        max_elapsed: float = 30.0,
+        methods: Iterable[str] = ("GET",),
+        clock=time.monotonic,
+        sleep=time.sleep,
+        uniform=random.uniform
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts (int): Maximum attempts including the first (1 disables retries)
+            base_delay (float): Minimum delay between attempts in seconds
+            max_delay (float): Maximum jittered delay in seconds
+            max_elapsed (float): Total time budget for all attempts in seconds
+            methods (Iterable[str]): HTTP methods considered idempotent
+            clock: Monotonic time source
+            sleep: Blocking sleep function
+            uniform: Random number source, uniform(a, b)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.methods = {m.upper() for m in methods}
+        self._clock = clock
+        self._sleep = sleep
+        self._uniform = uniform
+
+    def next_delay(self, error: Exception, method: str, attempt: int, started: float, previous_delay: float,
+                   deadline: Optional["Deadline"] = None) -> Optional[float]:
+        """Return the delay before the next attempt, or None to give up.
+
+        Args:
+            error (Exception): Error raised by the last attempt
+            method (str): HTTP method of the request
+            attempt (int): Number of attempts made so far
+            started (float): Clock time of the first attempt
+            previous_delay (float): Previous delay (base_delay before the first retry)
+            deadline (Optional[Deadline]): Caller's end-to-end deadline
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the error should be raised
+        """
+        if not getattr(error, "retryable", False) or method.upper() not in self.methods:
+            return None
+        if attempt >= self.max_attempts:
+            return None
+        delay = min(self.max_delay, self._uniform(self.base_delay, max(self.base_delay, previous_delay * 3)))
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if self._clock() - started + delay > self.max_elapsed:
+            return None
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        return delay
+
+    def call(self, fn: Callable[[], Any], method: str = "GET", on_retry: Optional[RetryCallback] = None,
+             deadline: Optional["Deadline"] = None) -> Any:
+        """Call ``fn`` until it succeeds or the policy gives up.
+
+        ``on_retry(error, attempt, delay)`` is called before each wait. With a
+        ``deadline``, no retry is scheduled that would start after it.
+        """
+        started = self._clock()
+        attempt = 1
+        delay = self.base_delay
+        while True:
+            try:
+                return fn()
+            except SkyscannerAPIError as e:
+                delay = self.next_delay(e, method, attempt, started, delay, deadline)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(e, attempt, delay)
+            self._sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]], method: str = "GET", on_retry: Optional[RetryCallback] = None,
+                         deadline: Optional["Deadline"] = None) -> Any:
+        """Await ``fn()`` until it succeeds or the policy gives up.
+
+        ``on_retry(error, attempt, delay)`` is called before each wait. With a
+        ``deadline``, no retry is scheduled that would start after it.
+        """
+        started = self._clock()
+        attempt = 1
+        delay = self.base_delay
+        while True:
+            try:
+                return await fn()
+            except SkyscannerAPIError as e:
+                delay = self.next_delay(e, method, attempt, started, delay, deadline)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(e, attempt, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls from multiple threads.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive with the same key while it is running wait for it and receive the
+    same result or exception. Once the call finishes the key is forgotten, so
+    later callers trigger a fresh call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's request."""
+        return self._coalesced
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key (Hashable): Identity of the call (e.g. endpoint and params)
+            fn (Callable[[], Any]): Function to run if no identical call is in flight
+            timeout (Optional[float]): Longest a follower waits for the
+                shared call (the leader's own call is not interrupted)
+
+        Returns:
+            Any: The result of the (shared) call
+
+        Raises:
+            TimeoutError: If a follower's wait exceeds ``timeout``
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out after {timeout:.2f}s waiting for a shared call")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutine calls on one event loop.
+
+    The shared call runs in its own task, so cancelling one waiting caller
+    does not cancel the request for the others. The request itself is only
+    cancelled once every waiter has been cancelled.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's request."""
+        return self._coalesced
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """Await ``fn()`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key (Hashable): Identity of the call (e.g. endpoint and params)
+            fn (Callable[[], Awaitable[Any]]): Coroutine factory to run if no
+                identical call is in flight
+            timeout (Optional[float]): Longest this caller waits; giving up
+                counts as cancelling its wait
+
+        Returns:
+            Any: The result of the (shared) call
+
+        Raises:
+            TimeoutError: If the wait exceeds ``timeout``
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._coalesced += 1
+        self._waiters[key] += 1
+        try:
+            if timeout is None:
+                return await asyncio.shield(task)
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if not task.done():
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0:
+                    task.cancel()
+            raise
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        self._calls.pop(key, None)
+        self._waiters.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled
+            task.exception()
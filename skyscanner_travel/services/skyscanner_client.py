@@ -1,126 +1,594 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Iterator, Tuple, Union
 from ..models.flight import Flight
 from ..models.flight_response import FlightSearchResponse
 from ..models.location import Location
 from ..models.location_response import LocationResponse
+from .cache import ResponseCache, make_cache_key, normalize_endpoint
+from .ratelimit import RateLimiter, QuotaSnapshot
+from .retry import RetryPolicy
+from .exceptions import (
+    SkyscannerAPIError,
+    AuthenticationError,
+    APITimeoutError,
+    APIConnectionError,
+    DeadlineExceededError,
+    error_for_status
+)
+from .details_cache import DetailsCache
+from .deadline import Deadline
+from .decoding import JSONLoads, accept_encoding, get_decoder
+from .instrumentation import (
+    ClientEvent,
+    ClientHooks,
+    RequestStart,
+    RequestEnd,
+    RetryEvent,
+    CacheHit,
+    ParseEvent,
+    measure_models
+)
+from .singleflight import SingleFlight
+from .streaming import iter_json_events
+
+SEARCH_AIRPORT_ENDPOINT = "v1/flights/searchAirport"
+SEARCH_FLIGHTS_ENDPOINT = "v2/flights/searchFlights"
+SEARCH_INCOMPLETE_ENDPOINT = "v2/flights/searchIncomplete"
+FLIGHT_DETAILS_ENDPOINT = "v1/flights/getFlightDetails"
+
+# Default cache lifetimes in seconds. Airport data is effectively static while
+# flight prices go stale within minutes; details and incomplete-search polls
+# are tied to a search session.
+DEFAULT_CACHE_TTLS = {
+    SEARCH_AIRPORT_ENDPOINT: 24 * 60 * 60,
+    SEARCH_FLIGHTS_ENDPOINT: 5 * 60,
+    SEARCH_INCOMPLETE_ENDPOINT: 0,
+    FLIGHT_DETAILS_ENDPOINT: 0,
+}
+DEFAULT_LOCATION_CACHE_TTL = 30 * 24 * 60 * 60
+STREAM_CHUNK_SIZE = 64 * 1024
+# Seconds to establish a connection and to wait between bytes of a response.
+# The connect timeout sits just above a multiple of 3s, the TCP retransmit window.
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+def resolve_cache_ttls(overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """Merge per-endpoint cache TTL overrides into the defaults."""
+    ttls = dict(DEFAULT_CACHE_TTLS)
+    for endpoint, ttl in (overrides or {}).items():
+        ttls[normalize_endpoint(endpoint)] = ttl
+    return ttls
+
+
+def normalize_locations(response: Any) -> Any:
+    """Convert a searchAirport response into the standard ``{'data': [...]}`` format.
+
+    Shared by the sync and async clients.
+
+    Args:
+        response (Any): Decoded searchAirport response
+
+    Returns:
+        Any: Normalized response, or the input unchanged if it is not a dict
+    """
+    if isinstance(response, dict):
+        if 'data' in response:
+            # Convert the new format to our standard format
+            locations = []
+            for item in response['data']:
+                location = {
+                    'id': item.get('entityId', ''),
+                    'code': item.get('skyId', ''),
+                    'name': item.get('presentation', {}).get('title', ''),
+                    'type': item.get('navigation', {}).get('entityType', ''),
+                    'city_name': item.get('presentation', {}).get('title', ''),
+                    'region_name': '',  # Not available in v1 response
+                    'country_name': item.get('presentation', {}).get('subtitle', ''),
+                    'distance_to_city_value': None,  # Not available in v1 response
+                    'distance_to_city_unit': None   # Not available in v1 response
+                }
+                locations.append(location)
+            return {'data': locations}
+        elif 'places' in response:
+            # Convert places format to locations format
+            locations = []
+            for place in response['places']:
+                distance = place.get('distanceToCity', {}) or {}
+                location = {
+                    'id': place.get('entityId', ''),
+                    'code': place.get('entityId', '').split('.')[0] if '.' in place.get('entityId', '') else place.get('entityId', ''),
+                    'name': place.get('name', ''),
+                    'type': place.get('type', ''),
+                    'city_name': place.get('city', {}).get('name', '') or place.get('name', ''),
+                    'region_name': place.get('region', {}).get('name', ''),
+                    'country_name': place.get('country', {}).get('name', ''),
+                    'distance_to_city_value': distance.get('value'),
+                    'distance_to_city_unit': distance.get('unit')
+                }
+                locations.append(location)
+            return {'data': locations}
+        else:
+            # Create a standard format if neither exists
+            distance = response.get('distanceToCity', {}) or {}
+            return {
+                'data': [
+                    {
+                        'id': response.get('entityId', ''),
+                        'code': response.get('entityId', '').split('.')[0] if '.' in response.get('entityId', '') else response.get('entityId', ''),
+                        'name': response.get('name', ''),
+                        'type': response.get('type', ''),
+                        'city_name': response.get('city', {}).get('name', '') or response.get('name', ''),
+                        'region_name': response.get('region', {}).get('name', ''),
+                        'country_name': response.get('country', {}).get('name', ''),
+                        'distance_to_city_value': distance.get('value'),
+                        'distance_to_city_unit': distance.get('unit')
+                    }
+                ]
+            }
+    return response
+
+
+# Location cache entries hold raw searchAirport responses. The format tag keeps
+# them apart from the normalized records earlier versions stored under the
+# bare endpoint key, which would otherwise parse as empty locations.
+_LOCATION_CACHE_FORMAT = "raw1"
+LOCATION_CACHE_PREFIX = f"{_LOCATION_CACHE_FORMAT}:{SEARCH_AIRPORT_ENDPOINT}?"
+
+
+def location_cache_key(params: Dict[str, Any]) -> str:
+    """Location cache key for a searchAirport query; starts with LOCATION_CACHE_PREFIX."""
+    return f"{_LOCATION_CACHE_FORMAT}:{make_cache_key(SEARCH_AIRPORT_ENDPOINT, params)}"
+
+
+def cached_locations(client: Any, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Look up a raw searchAirport response in a client's location cache.
+
+    Shared by the sync and async clients.
+    """
+    if client.location_cache is None:
+        return None
+    cached = client.location_cache.get(location_cache_key(params))
+    if cached is not None and client.hooks:
+        client.notify(CacheHit(endpoint=SEARCH_AIRPORT_ENDPOINT, cache="location"))
+    return cached
+
+
+def cache_locations(client: Any, params: Dict[str, Any], response: Any) -> None:
+    """Store a raw searchAirport response in a client's location cache."""
+    if client.location_cache is not None and isinstance(response, dict):
+        client.location_cache.set(location_cache_key(params), response, client.location_cache_ttl)
+
+
+def location_models(client: Any, response: Any, trusted: bool = False) -> LocationResponse:
+    """Build models from a raw searchAirport response in a single pass.
+
+    Model building time is reported to the client's hooks. Shared by the
+    sync and async clients.
+
+    Raises:
+        ValueError: If the response is not a JSON object
+    """
+    return measure_models(client, SEARCH_AIRPORT_ENDPOINT,
+                          lambda: LocationResponse.from_search_airport(response, trusted=trusted),
+                          lambda result: len(result.locations))
+
+
+def flight_search_params(
+    origin_sky_id: str,
+    destination_sky_id: str,
+    origin_entity_id: str,
+    destination_entity_id: str,
+    date: str,
+    cabin_class: str = "economy",
+    adults: int = 1,
+    children: int = 0,
+    infants: int = 0,
+    currency: str = "USD",
+    market: str = "en-US",
+    country_code: str = "US"
+) -> Dict[str, str]:
+    """Build the query parameters for a searchFlights request."""
+    return {
+        "originSkyId": origin_sky_id,
+        "destinationSkyId": destination_sky_id,
+        "originEntityId": origin_entity_id,
+        "destinationEntityId": destination_entity_id,
+        "date": date,
+        "cabinClass": cabin_class,
+        "adults": str(adults),
+        "childrens": str(children),
+        "infants": str(infants),
+        "currency": currency,
+        "market": market,
+        "countryCode": country_code
+    }
+
+
+def search_incomplete_params(
+    session_id: str,
+    currency: str = "USD",
+    market: str = "en-US",
+    country_code: str = "US"
+) -> Dict[str, str]:
+    """Build the query parameters for a searchIncomplete poll."""
+    return {
+        "sessionId": session_id,
+        "currency": currency,
+        "market": market,
+        "countryCode": country_code
+    }
+
+
+def flight_details_params(
+    flight: Flight,
+    adults: int = 1,
+    children: int = 0,
+    infants: int = 0,
+    currency: str = "USD",
+    locale: str = "en-US",
+    market: str = "en-US",
+    cabinClass: str = "economy",
+    countryCode: str = "US"
+) -> Dict[str, str]:
+    """Build the query parameters for a getFlightDetails request."""
+    fl_date = datetime.fromisoformat(flight.departure['iso']).strftime("%Y-%m-%d")
+    legs = [{"destination": flight.destination.code, "origin": flight.origin.code, "date": fl_date}]
+    return {
+        "itineraryId": flight.itinerary_id,
+        "legs": json.dumps(legs),
+        "sessionId": flight.session_id,
+        "adults": str(adults),
+        "children": str(children),
+        "infants": str(infants),
+        "currency": currency,
+        "locale": locale,
+        "market": market,
+        "cabinClass": cabinClass,
+        "countryCode": countryCode
+    }
+
+
+def _within_deadline(chunks: Iterable[bytes], deadline: Deadline, endpoint: str) -> Iterator[bytes]:
+    """Pass chunks through, failing once the deadline has expired."""
+    for chunk in chunks:
+        deadline.check(f"{endpoint} finished downloading")
+        yield chunk
+
 
 class SkyscannerClient:
     """Client for interacting with the Skyscanner API via RapidAPI."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        location_cache: Optional[ResponseCache] = None,
+        location_cache_ttl: float = DEFAULT_LOCATION_CACHE_TTL,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        details_cache: Optional[DetailsCache] = None,
+        base_url: Optional[str] = None,
+        hooks: Optional[Iterable[ClientHooks]] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        json_decoder: Union[str, JSONLoads] = "auto",
+        compress: bool = True
+    ):
         """Initialize the client with an API key.
 
+        The client owns a pooled ``requests.Session`` so repeated calls reuse
+        open TCP/TLS connections instead of handshaking on every request. The
+        session is safe to share across threads; connections are checked out
+        of the pool per request.
+
         Args:
             api_key (str): RapidAPI key for Skyscanner API
+            pool_connections (int): Number of per-host connection pools to cache
+            pool_maxsize (int): Maximum connections kept open per host
+            pool_block (bool): Block when the per-host pool is exhausted instead
+                of opening extra, non-pooled connections
+            keep_alive (bool): Keep connections open between requests
+            cache (Optional[ResponseCache]): Cache for GET responses (e.g. MemoryCache)
+            cache_ttls (Optional[Dict[str, float]]): Per-endpoint TTL overrides in
+                seconds; a TTL of 0 disables caching for that endpoint
+            location_cache (Optional[ResponseCache]): Cache for raw
+                searchAirport responses, shared by search_locations and
+                search_location_models (e.g. a shared SQLiteCache)
+            location_cache_ttl (float): Lifetime of location_cache entries in seconds
+            coalesce (bool): Share one upstream request between threads making
+                identical GET requests at the same time
+            rate_limiter (Optional[RateLimiter]): Client-side limiter that waits
+                for capacity before each request and calibrates itself from
+                RapidAPI quota headers
+            retry_policy (Optional[RetryPolicy]): Retry policy for transient
+                failures (default: RetryPolicy(); use max_attempts=1 to disable)
+            details_cache (Optional[DetailsCache]): Session-scoped cache for
+                get_flight_details responses
+            base_url (Optional[str]): API root to send requests to instead of
+                RapidAPI (e.g. a local fake server for load testing)
+            hooks (Optional[Iterable[ClientHooks]]): Receivers of request,
+                retry, cache and parse events (e.g. a MetricsCollector)
+            connect_timeout (float): Seconds allowed to open a connection
+            read_timeout (float): Seconds allowed between bytes of a response;
+                both are capped by the remaining time of a call's deadline
+            json_decoder (Union[str, JSONLoads]): JSON backend for response
+                bodies, see get_decoder() (default: fastest installed)
+            compress (bool): Ask for gzip (and brotli, when installed)
+                compressed responses
         """
         if not api_key:
             raise ValueError("API key cannot be empty")
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Connection pool sizes must be at least 1")
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("Timeouts must be positive")
         self.api_key = api_key
         self.api_host = "sky-scrapper.p.rapidapi.com"
-        self.base_url = f"https://{self.api_host}/api"
+        self.base_url = base_url.rstrip("/") if base_url else f"https://{self.api_host}/api"
         self.headers = {
             "x-rapidapi-key": self.api_key,
             "x-rapidapi-host": self.api_host
         }
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.compress = compress
+        self.json_loads = get_decoder(json_decoder)
+        self.session = self._create_session()
+        self.cache = cache
+        self.cache_ttls = resolve_cache_ttls(cache_ttls)
+        self.location_cache = location_cache
+        self.location_cache_ttl = location_cache_ttl
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.details_cache = details_cache
+        self.hooks: List[ClientHooks] = list(hooks or [])
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._singleflight = SingleFlight() if coalesce else None
+
+    def _create_session(self) -> requests.Session:
+        """Create the pooled HTTP session shared by all requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        session.headers["Accept-Encoding"] = accept_encoding(self.compress)
+        return session
+
+    def close(self) -> None:
+        """Close the session and release all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "SkyscannerClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def quota(self) -> Optional[QuotaSnapshot]:
+        """Snapshot of the rate limiter's quota state, if a limiter is configured."""
+        return self.rate_limiter.snapshot() if self.rate_limiter is not None else None
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls served by another thread's identical in-flight request."""
+        return self._singleflight.coalesced if self._singleflight is not None else 0
+
+    def notify(self, event: ClientEvent) -> None:
+        """Pass an instrumentation event to every hook."""
+        for hook in self.hooks:
+            getattr(hook, event.hook)(event)
+
+    def _retry_callback(self, endpoint: str) -> Optional[Callable[[Exception, int, float], None]]:
+        if not self.hooks:
+            return None
+        name = normalize_endpoint(endpoint)
+        return lambda error, attempt, delay: self.notify(
+            RetryEvent(endpoint=name, attempt=attempt, delay=delay, error=type(error).__name__)
+        )
+
+    def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+                      deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Make a request to the Skyscanner API.
+
+        Cacheable GETs are served from the cache, and identical GETs already
+        in flight on another thread are coalesced into a single request.
+        Coalesced callers share the first caller's request, including its
+        deadline, but never wait past their own.
+        """
+        if method != "GET":
+            return self._fetch(endpoint, method=method, params=params, data=data, deadline=deadline)
+
+        key = make_cache_key(endpoint, params)
+        ttl = self.cache_ttls.get(normalize_endpoint(endpoint), 0) if self.cache is not None else 0
+        if ttl > 0:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.hooks:
+                    self.notify(CacheHit(endpoint=normalize_endpoint(endpoint), cache="response"))
+                return cached
+
+        fetch = lambda: self._fetch(endpoint, method=method, params=params, data=data, cache_key=key, ttl=ttl, deadline=deadline)
+        if self._singleflight is None:
+            return fetch()
+        if deadline is None:
+            return self._singleflight.do(key, fetch)
+        try:
+            return self._singleflight.do(key, fetch, timeout=deadline.check(normalize_endpoint(endpoint)))
+        except TimeoutError:
+            raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s exceeded waiting for {normalize_endpoint(endpoint)}")
+
+    def _fetch(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+               cache_key: Optional[str] = None, ttl: float = 0, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Send a request, decode it and store cacheable results."""
+        response = self.retry_policy.call(
+            lambda: self._send(endpoint, method=method, params=params, data=data, deadline=deadline),
+            method=method,
+            on_retry=self._retry_callback(endpoint),
+            deadline=deadline
+        )
+        if self.hooks:
+            started = time.perf_counter()
+            result = self._decode(response)
+            self.notify(ParseEvent(endpoint=normalize_endpoint(endpoint), stage="decode", duration=time.perf_counter() - started))
+        else:
+            result = self._decode(response)
+
+        if ttl > 0:
+            self.cache.set(cache_key, result, ttl, size=len(response.content))
+        return result
+
+    def _send(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None,
+              stream: bool = False, deadline: Optional[Deadline] = None) -> requests.Response:
+        """Send a request over the pooled session and check its status.
 
-    def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make a request to the Skyscanner API."""
+        With ``stream`` the body is left unread; the caller must close the response.
+        """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.rate_limiter is not None:
+            self._acquire(endpoint, deadline)
+        timeout = self._timeout(endpoint, deadline)
+        if not self.hooks:
+            return self._transmit(url, endpoint, method, params, data, stream, timeout, deadline)
+
+        name = normalize_endpoint(endpoint)
+        self.notify(RequestStart(endpoint=name, method=method))
+        started = time.perf_counter()
         try:
-            response = requests.request(
+            response = self._transmit(url, endpoint, method, params, data, stream, timeout, deadline)
+        except SkyscannerAPIError as e:
+            self.notify(RequestEnd(endpoint=name, method=method, status=e.status_code,
+                                   latency=time.perf_counter() - started, error=type(e).__name__))
+            raise
+        # Streamed bodies are still unread, so rely on Content-Length
+        size = int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+        self.notify(RequestEnd(endpoint=name, method=method, status=response.status_code, bytes=size,
+                               latency=time.perf_counter() - started))
+        return response
+
+    def _acquire(self, endpoint: str, deadline: Optional[Deadline]) -> None:
+        """Wait for rate-limit capacity, unless the wait would overrun the deadline."""
+        if deadline is None:
+            self.rate_limiter.acquire(endpoint)
+            return
+        try:
+            self.rate_limiter.acquire(endpoint, max_wait=deadline.check(normalize_endpoint(endpoint)))
+        except TimeoutError as e:
+            raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s cannot be met: {e}")
+
+    def _timeout(self, endpoint: str, deadline: Optional[Deadline]) -> Tuple[float, float]:
+        """(connect, read) timeouts for one request, capped by the deadline."""
+        if deadline is None:
+            return self.connect_timeout, self.read_timeout
+        return deadline.timeout(self.connect_timeout, self.read_timeout, normalize_endpoint(endpoint))
+
+    def _transmit(self, url: str, endpoint: str, method: str, params: Optional[Dict], data: Optional[Dict],
+                  stream: bool, timeout: Tuple[float, float], deadline: Optional[Deadline] = None) -> requests.Response:
+        """Perform the HTTP exchange and map failures to typed API errors."""
+        try:
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
                 params=params,
-                json=data
+                json=data,
+                stream=stream,
+                timeout=timeout
             )
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
             if response.status_code == 403:
-                print(f"Request details:")
-                print(f"URL: {url}")
-                print(f"Headers: {self.headers}")
-                print(f"Params: {params}")
-                raise requests.exceptions.RequestException("API key is invalid or expired. Please check your RapidAPI key.")
+                raise AuthenticationError("API request failed: API key is invalid or expired. Please check your RapidAPI key.", status_code=403)
             response.raise_for_status()
-            return response.json()
-        except (requests.exceptions.HTTPError, requests.exceptions.RequestException) as e:
-            raise requests.exceptions.RequestException(f"API request failed: {str(e)}")
-        except (json.JSONDecodeError, ValueError) as e:
+            return response
+        except SkyscannerAPIError:
+            raise
+        except requests.exceptions.HTTPError as e:
+            raise error_for_status(e.response.status_code, f"API request failed: {str(e)}", e.response.headers)
+        except requests.exceptions.Timeout as e:
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s exceeded: {str(e)}")
+            raise APITimeoutError(f"API request failed: {str(e)}")
+        except requests.exceptions.ConnectionError as e:
+            raise APIConnectionError(f"API request failed: {str(e)}")
+        except requests.exceptions.RequestException as e:
+            raise SkyscannerAPIError(f"API request failed: {str(e)}")
+
+    def _decode(self, response: requests.Response) -> Dict[str, Any]:
+        """Decode a JSON response body straight from its (decompressed) bytes."""
+        try:
+            return self.json_loads(response.content)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON response: {str(e)}")
 
-    def search_locations(self, query: str, locale: str = "en-US") -> Dict[str, Any]:
+    def search_locations(self, query: str, locale: str = "en-US", deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Search for locations (airports, cities) by query string.
 
         Args:
             query (str): Search query (e.g. airport code or city name)
             locale (str): Locale code (default: en-US)
+            deadline (Optional[Deadline]): End-to-end time budget
 
         Returns:
             Dict: API response containing location results
         """
-        endpoint = "v1/flights/searchAirport"
-        params = {"query": query, "locale": locale}
-        try:
-            response = self._make_request(endpoint, params=params)
-            if isinstance(response, dict):
-                if 'data' in response:
-                    # Convert the new format to our standard format
-                    locations = []
-                    for item in response['data']:
-                        location = {
-                            'id': item.get('entityId', ''),
-                            'code': item.get('skyId', ''),
-                            'name': item.get('presentation', {}).get('title', ''),
-                            'type': item.get('navigation', {}).get('entityType', ''),
-                            'city_name': item.get('presentation', {}).get('title', ''),
-                            'region_name': '',  # Not available in v1 response
-                            'country_name': item.get('presentation', {}).get('subtitle', ''),
-                            'distance_to_city_value': None,  # Not available in v1 response
-                            'distance_to_city_unit': None   # Not available in v1 response
-                        }
-                        locations.append(location)
-                    return {'data': locations}
-                elif 'places' in response:
-                    # Convert places format to locations format
-                    locations = []
-                    for place in response['places']:
-                        distance = place.get('distanceToCity', {}) or {}
-                        location = {
-                            'id': place.get('entityId', ''),
-                            'code': place.get('entityId', '').split('.')[0] if '.' in place.get('entityId', '') else place.get('entityId', ''),
-                            'name': place.get('name', ''),
-                            'type': place.get('type', ''),
-                            'city_name': place.get('city', {}).get('name', '') or place.get('name', ''),
-                            'region_name': place.get('region', {}).get('name', ''),
-                            'country_name': place.get('country', {}).get('name', ''),
-                            'distance_to_city_value': distance.get('value'),
-                            'distance_to_city_unit': distance.get('unit')
-                        }
-                        locations.append(location)
-                    return {'data': locations}
-                else:
-                    # Create a standard format if neither exists
-                    distance = response.get('distanceToCity', {}) or {}
-                    return {
-                        'data': [
-                            {
-                                'id': response.get('entityId', ''),
-                                'code': response.get('entityId', '').split('.')[0] if '.' in response.get('entityId', '') else response.get('entityId', ''),
-                                'name': response.get('name', ''),
-                                'type': response.get('type', ''),
-                                'city_name': response.get('city', {}).get('name', '') or response.get('name', ''),
-                                'region_name': response.get('region', {}).get('name', ''),
-                                'country_name': response.get('country', {}).get('name', ''),
-                                'distance_to_city_value': distance.get('value'),
-                                'distance_to_city_unit': distance.get('unit')
-                            }
-                        ]
-                    }
-            return response
-        except requests.exceptions.RequestException as e:
-            raise
+        return normalize_locations(self._location_response({"query": query, "locale": locale}, deadline))
+
+    def search_location_models(
+        self,
+        query: str,
+        locale: str = "en-US",
+        deadline: Optional[Deadline] = None,
+        trusted: bool = False
+    ) -> LocationResponse:
+        """Search for locations and return them as models.
+
+        Builds the Location objects in a single pass over the raw response,
+        whether it comes from the API or from the location cache, instead
+        of normalizing it to dicts first.
+
+        Args:
+            query (str): Search query (e.g. airport code or city name)
+            locale (str): Locale code (default: en-US)
+            deadline (Optional[Deadline]): End-to-end time budget
+            trusted (bool): Build models without pydantic validation
+
+        Returns:
+            LocationResponse: Response containing list of locations
+
+        Raises:
+            ValueError: If the response is not a JSON object
+        """
+        return location_models(self, self._location_response({"query": query, "locale": locale}, deadline), trusted)
+
+    def _location_response(self, params: Dict[str, Any], deadline: Optional[Deadline]) -> Any:
+        """Fetch a raw searchAirport response, going through the location cache."""
+        cached = cached_locations(self, params)
+        if cached is not None:
+            return cached
+        response = self._make_request(SEARCH_AIRPORT_ENDPOINT, params=params, deadline=deadline)
+        cache_locations(self, params, response)
+        return response
 
     def search_flights(
         self,
@@ -135,7 +603,8 @@ class SkyscannerClient:
         infants: int = 0,
         currency: str = "USD",
         market: str = "en-US",
-        country_code: str = "US"
+        country_code: str = "US",
+        deadline: Optional[Deadline] = None
     ) -> Dict:
         """Search for available flights.
 
@@ -152,25 +621,81 @@ class SkyscannerClient:
             currency (str): Currency code (default: USD)
             market (str): Market code (default: en-US)
             country_code (str): Country code (default: US)
+            deadline (Optional[Deadline]): End-to-end time budget
 
         Returns:
             Dict: API response containing flight results
         """
-        params = {
-            "originSkyId": origin_sky_id,
-            "destinationSkyId": destination_sky_id,
-            "originEntityId": origin_entity_id,
-            "destinationEntityId": destination_entity_id,
-            "date": date,
-            "cabinClass": cabin_class,
-            "adults": str(adults),
-            "childrens": str(children),
-            "infants": str(infants),
-            "currency": currency,
-            "market": market,
-            "countryCode": country_code
-        }
-        return self._make_request("v2/flights/searchFlights", params=params)
+        params = flight_search_params(
+            origin_sky_id=origin_sky_id,
+            destination_sky_id=destination_sky_id,
+            origin_entity_id=origin_entity_id,
+            destination_entity_id=destination_entity_id,
+            date=date,
+            cabin_class=cabin_class,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            market=market,
+            country_code=country_code
+        )
+        response = self._make_request(SEARCH_FLIGHTS_ENDPOINT, params=params, deadline=deadline)
+        if self.details_cache is not None and isinstance(response, dict):
+            self.details_cache.observe_search(make_cache_key(SEARCH_FLIGHTS_ENDPOINT, params), response.get("sessionId"))
+        return response
+
+    def search_incomplete(self, session_id: str, currency: str = "USD", market: str = "en-US", country_code: str = "US",
+                          deadline: Optional[Deadline] = None) -> Dict:
+        """Poll a search whose ``data.context.status`` is still ``incomplete``.
+
+        Args:
+            session_id (str): The ``data.context.sessionId`` of the search
+            currency (str): Currency code (default: USD)
+            market (str): Market code (default: en-US)
+            country_code (str): Country code (default: US)
+            deadline (Optional[Deadline]): End-to-end time budget
+
+        Returns:
+            Dict: API response in the same format as search_flights
+        """
+        params = search_incomplete_params(session_id, currency=currency, market=market, country_code=country_code)
+        return self._make_request(SEARCH_INCOMPLETE_ENDPOINT, params=params, deadline=deadline)
+
+    def stream_search_flights(self, chunk_size: int = STREAM_CHUNK_SIZE, deadline: Optional[Deadline] = None,
+                              **search) -> Iterator[Tuple[str, Any]]:
+        """Search for flights, parsing the response body as it downloads.
+
+        Streamed searches bypass the response cache and request coalescing;
+        rate limiting and retries still apply until the response headers
+        arrive. The request is sent when iteration starts.
+
+        Args:
+            chunk_size (int): Bytes read from the socket at a time
+            deadline (Optional[Deadline]): End-to-end time budget, also
+                checked between chunks of the body
+            **search: The same arguments as search_flights()
+
+        Returns:
+            Iterator[Tuple[str, Any]]: ``(path, value)`` events from
+            iter_json_events(); each ``data.itineraries`` entry is its own event
+        """
+        params = flight_search_params(**search)
+        response = self.retry_policy.call(
+            lambda: self._send(SEARCH_FLIGHTS_ENDPOINT, params=params, stream=True, deadline=deadline),
+            on_retry=self._retry_callback(SEARCH_FLIGHTS_ENDPOINT),
+            deadline=deadline
+        )
+        chunks = response.iter_content(chunk_size)
+        if deadline is not None:
+            chunks = _within_deadline(chunks, deadline, SEARCH_FLIGHTS_ENDPOINT)
+        try:
+            for path, value in iter_json_events(chunks, ["data.itineraries"]):
+                if path == "sessionId" and self.details_cache is not None:
+                    self.details_cache.observe_search(make_cache_key(SEARCH_FLIGHTS_ENDPOINT, params), value)
+                yield path, value
+        finally:
+            response.close()
 
 
     def get_flight_details(
@@ -183,30 +708,37 @@ class SkyscannerClient:
         locale: str = "en-US",
         market: str = "en-US",
         cabinClass: str = "economy",
-        countryCode: str = "US"
+        countryCode: str = "US",
+        deadline: Optional[Deadline] = None
     ) -> Dict:
         """Get detailed information about a specific flight.
 
         Args:
             flight (Flight): Flight object to get details for
+            deadline (Optional[Deadline]): End-to-end time budget
 
         Returns:
             Dict: API response containing flight details
         """
-        endpoint = f"v1/flights/getFlightDetails"
-        fl_date = datetime.fromisoformat(flight.departure['iso']).strftime("%Y-%m-%d")
-        legs = [{"destination": flight.destination.code, "origin": flight.origin.code, "date": fl_date}]
-        params = {
-            "itineraryId": flight.itinerary_id,
-            "legs": json.dumps(legs),
-            "sessionId": flight.session_id,
-            "adults": str(adults),
-            "children": str(children),
-            "infants": str(infants),
-            "currency": currency,
-            "locale": locale,
-            "market": market,
-            "cabinClass": cabinClass,
-            "countryCode": countryCode
-        }
-        return self._make_request(endpoint, params=params)
\ No newline at end of file
+        params = flight_details_params(
+            flight,
+            adults=adults,
+            children=children,
+            infants=infants,
+            currency=currency,
+            locale=locale,
+            market=market,
+            cabinClass=cabinClass,
+            countryCode=countryCode
+        )
+        if self.details_cache is not None:
+            cached = self.details_cache.get(params)
+            if cached is not None:
+                if self.hooks:
+                    self.notify(CacheHit(endpoint=FLIGHT_DETAILS_ENDPOINT, cache="details"))
+                return cached
+
+        response = self._make_request(FLIGHT_DETAILS_ENDPOINT, params=params, deadline=deadline)
+        if self.details_cache is not None and isinstance(response, dict) and response.get("status"):
+            self.details_cache.set(params, response)
+        return response
@@ -0,0 +1,159 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Iterator, Optional
+from .cache import ResponseCache, CacheStats
+
+
+class SQLiteCache(ResponseCache):
+    """Persistent cache backend stored in a SQLite database.
+
+    Intended as a client's ``location_cache``, holding raw searchAirport
+    responses, so that worker processes can share airport lookups across
+    restarts. The database runs in WAL mode, which lets
+    any number of processes read while one writes. Each thread gets its own
+    connection. Expired rows are skipped on read and removed by ``compact()``.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0, clock=time.time):
+        """Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite database file
+            busy_timeout (float): Seconds to wait for a competing writer's lock
+            clock: Wall-clock time source; must agree across processes
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " size INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            if row[1] <= self._clock():
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float, size: int = 0) -> None:
+        if ttl <= 0:
+            return
+        payload = json.dumps(value, separators=(",", ":"))
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+                (key, payload, self._clock() + ttl, len(payload))
+            )
+
+    def values(self, prefix: str = "") -> Iterator[Any]:
+        """Iterate over the unexpired values whose key starts with ``prefix``.
+
+        Does not count towards the hit and miss statistics.
+        """
+        rows = self._connection().execute(
+            "SELECT value FROM cache WHERE expires_at > ? AND substr(key, 1, ?) = ? ORDER BY key",
+            (self._clock(), len(prefix), prefix)
+        )
+        for (value,) in rows:
+            yield json.loads(value)
+
+    def delete(self, key: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache")
+
+    def compact(self) -> int:
+        """Delete expired rows and reclaim their disk space.
+
+        Returns:
+            int: Number of rows removed
+        """
+        conn = self._connection()
+        with conn:
+            removed = conn.execute("DELETE FROM cache WHERE expires_at <= ?", (self._clock(),)).rowcount
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    @property
+    def stats(self) -> CacheStats:
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache WHERE expires_at > ?", (self._clock(),)
+        ).fetchone()
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expirations=self._expirations,
+                entries=entries,
+                bytes=size
+            )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain a skyscanner_travel SQLite cache")
+    parser.add_argument("command", choices=["compact", "stats", "clear"])
+    parser.add_argument("path", help="Path to the cache database")
+    args = parser.parse_args(argv)
+
+    cache = SQLiteCache(args.path)
+    if args.command == "compact":
+        print(f"Removed {cache.compact()} expired entries")
+    elif args.command == "clear":
+        cache.clear()
+        print("Cache cleared")
+    else:
+        stats = cache.stats
+        print(f"Entries: {stats.entries}")
+        print(f"Bytes: {stats.bytes}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Set, Tuple, Union
+
+# Drop consumed text from the buffer once this many characters have been read
+_COMPACT_AFTER = 1 << 16
+
+
+class _Scanner:
+    """Pull-based reader over a JSON document arriving in chunks.
+
+    Whole values are decoded with the stdlib's C-accelerated ``raw_decode``
+    as soon as their last character is buffered; containers the caller wants
+    to stream are stepped through one token at a time instead.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; return False at end of input."""
+        if self.eof:
+            return False
+        if self.pos >= _COMPACT_AFTER:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.eof = True
+            self.buf += self._utf8.decode(b"", final=True)
+            return False
+        self.buf += self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in " \t\n\r":
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError("Invalid JSON response: unexpected end of data")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Invalid JSON response: expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        while True:
+            first = self.peek()
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid JSON response: {str(e)}")
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and first not in '{["' and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_events(chunks: Iterable[Union[bytes, str]], stream_paths: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """Incrementally parse a JSON object, yielding values as soon as they are complete.
+
+    Arrays at ``stream_paths`` are yielded element by element, and objects on
+    the way to them are walked key by key; every other value is yielded whole
+    together with its dotted path. Only the element being decoded is ever
+    held in memory, never the full document tree.
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): Body chunks, e.g. ``iter_content()``
+        stream_paths (Iterable[str]): Dotted paths of arrays to stream,
+            e.g. ``["data.itineraries"]``
+
+    Returns:
+        Iterator[Tuple[str, Any]]: ``(path, value)`` pairs in document order;
+        streamed arrays yield one pair per element
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    streamed = set(stream_paths)
+    walked = {""}
+    for path in streamed:
+        parts = path.split(".")
+        walked.update(".".join(parts[:i]) for i in range(1, len(parts)))
+    return _walk(_Scanner(chunks), "", streamed, walked)
+
+
+def _walk(scanner: _Scanner, path: str, streamed: Set[str], walked: Set[str]) -> Iterator[Tuple[str, Any]]:
+    char = scanner.peek()
+    if path in streamed and char == "[":
+        scanner.pos += 1
+        if scanner.peek() == "]":
+            scanner.pos += 1
+            return
+        while True:
+            yield path, scanner.value()
+            if scanner.peek() == ",":
+                scanner.pos += 1
+                continue
+            scanner.expect("]")
+            return
+    if path in walked and char == "{":
+        scanner.pos += 1
+        if scanner.peek() == "}":
+            scanner.pos += 1
+            return
+        while True:
+            if scanner.peek() != '"':
+                raise ValueError(f"Invalid JSON response: expected a key at offset {scanner.pos}")
+            key = scanner.value()
+            scanner.expect(":")
+            yield from _walk(scanner, f"{path}.{key}" if path else key, streamed, walked)
+            if scanner.peek() == ",":
+                scanner.pos += 1
+                continue
+            scanner.expect("}")
+            return
+    yield path, scanner.value()
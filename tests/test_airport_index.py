@@ -0,0 +1,102 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from skyscanner_travel.models.location_response import LocationResponse
+from skyscanner_travel.services.airport_index import AirportIndex, LocationResolver, build_index, main
+from skyscanner_travel.services.location_search import LocationSearch, LocationSearchError
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from skyscanner_travel.services.sqlite_cache import SQLiteCache
+
+STUB = os.path.join(os.path.dirname(__file__), "stubs", "skyscanner_location_search.json")
+
+
+@pytest.fixture
+def recorded():
+    with open(STUB, "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def index_path(tmp_path, recorded):
+    path = str(tmp_path / "airports.idx")
+    build_index(LocationResponse.from_search_airport(recorded).locations, path)
+    return path
+
+
+def test_index_round_trips_locations(index_path, recorded):
+    expected = {location.code: location for location in LocationResponse.from_search_airport(recorded).locations}
+    with AirportIndex(index_path) as index:
+        assert len(index) == len(expected)
+        assert index.get("LAS") == expected["LAS"]
+        assert index.get(" las ") == expected["LAS"]
+        assert index.entity_id("LAS") == "95673753"
+        assert "LASA" in index and "XXX" not in index and "" not in index
+        assert index.get("LASVEGASX") is None
+        assert [location.code for location in index] == sorted(expected)
+        assert all(location == expected[location.code] for location in index)
+
+
+def test_first_location_wins_and_none_survives(tmp_path, recorded):
+    locations = LocationResponse.from_search_airport(recorded).locations
+    las = locations[1].model_copy(update={"name": "Replacement", "city_name": None})
+    path = str(tmp_path / "airports.idx")
+    assert build_index([las] + locations, path) == len(locations)
+    with AirportIndex(path) as index:
+        assert index.get("LAS").name == "Replacement"
+        assert index.get("LAS").city_name is None
+
+
+def test_empty_and_invalid_files(tmp_path):
+    path = str(tmp_path / "empty.idx")
+    assert build_index([], path) == 0
+    with AirportIndex(path) as index:
+        assert len(index) == 0
+        assert index.get("LAS") is None
+
+    bogus = tmp_path / "bogus.idx"
+    bogus.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        AirportIndex(str(bogus))
+
+
+def test_location_search_consults_the_resolver_first(index_path, recorded):
+    resolver = LocationResolver(index_path)
+    search = LocationSearch(api_key="test_api_key", resolver=resolver)
+    with patch.object(search.client, "_make_request", return_value=recorded) as mock_request:
+        response = search.search("las")
+        assert mock_request.call_count == 0
+        assert [location.entity_id for location in response.locations] == ["95673753"]
+        assert response.total_results == 1
+
+        search.search("Las Vegas")
+        assert mock_request.call_count == 1
+
+
+def test_resolver_failures_raise_location_search_error(index_path):
+    resolver = LocationResolver(index_path)
+    resolver.index.close()
+    search = LocationSearch(api_key="test_api_key", resolver=resolver)
+    with pytest.raises(LocationSearchError):
+        search.search("LAS")
+
+
+def test_cli_builds_from_recorded_responses_and_cache(tmp_path, recorded, capsys):
+    path = str(tmp_path / "airports.idx")
+    main(["build", path, "--from-json", STUB])
+    assert "Indexed 8 locations" in capsys.readouterr().out
+
+    cache_path = str(tmp_path / "locations.db")
+    client = SkyscannerClient("test_api_key", location_cache=SQLiteCache(cache_path))
+    extra = {"places": [{"entityId": "SDF.AIRPORT", "name": "Louisville", "type": "AIRPORT"}]}
+    with patch.object(client, "_make_request", return_value=extra):
+        client.search_locations("Louisville")
+    client.location_cache.close()
+
+    main(["build", path, "--from-cache", cache_path, "--merge"])
+    assert "Indexed 9 locations" in capsys.readouterr().out
+    main(["lookup", path, "SDF", "LAS", "ZZZ"])
+    out = capsys.readouterr().out
+    assert "SDF: SDF.AIRPORT Louisville (SDF)" in out
+    assert "LAS: 95673753" in out
+    assert "ZZZ: not found" in out
@@ -0,0 +1,340 @@
+import asyncio
+import time
+import json
+import pytest
+import requests
+from skyscanner_travel.services.flight_search import AsyncFlightSearch, FlightSearchError
+from skyscanner_travel.services.location_search import AsyncLocationSearch, LocationSearchError
+from skyscanner_travel.models.flight_response import FlightSearchResponse
+from skyscanner_travel.models.location_response import LocationResponse
+from skyscanner_travel.models.flight_query import FlightQuery
+from skyscanner_travel.services.retry import RetryPolicy
+
+httpx = pytest.importorskip("httpx")
+from skyscanner_travel.services.async_client import AsyncSkyscannerClient
+
+@pytest.fixture
+def flight_search_data():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        return json.load(f)
+
+@pytest.fixture
+def location_search_data():
+    with open('tests/stubs/skyscanner_location_search.json', 'r') as f:
+        return json.load(f)
+
+def make_client(handler, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=1))
+    return AsyncSkyscannerClient(api_key="test_api_key", transport=httpx.MockTransport(handler), **kwargs)
+
+def test_async_client_initialization():
+    """Test that the async client mirrors the sync client's attributes"""
+    client = make_client(lambda request: httpx.Response(200, json={}))
+    assert client.base_url == f"https://{client.api_host}/api"
+    assert client.headers == {
+        "x-rapidapi-key": "test_api_key",
+        "x-rapidapi-host": client.api_host
+    }
+    with pytest.raises(ValueError):
+        AsyncSkyscannerClient(api_key="")
+
+def test_async_flight_search(flight_search_data):
+    """Test that async searches return the same models as the sync service"""
+    def handler(request):
+        assert request.url.path == "/api/v2/flights/searchFlights"
+        assert request.headers["x-rapidapi-key"] == "test_api_key"
+        assert request.url.params["originSkyId"] == "SDF"
+        return httpx.Response(200, json=flight_search_data)
+
+    async def run():
+        async with make_client(handler) as client:
+            return await AsyncFlightSearch(client).search(
+                origin_sky_id="SDF",
+                destination_sky_id="LAS",
+                origin_entity_id="95673969",
+                destination_entity_id="95673753",
+                date="2025-03-30"
+            )
+
+    response = asyncio.run(run())
+    assert isinstance(response, FlightSearchResponse)
+    assert response.total_results == len(flight_search_data['data']['itineraries'])
+    assert response.flights[0].origin.code == "SDF"
+
+def test_async_flight_search_error():
+    """Test that upstream errors surface as FlightSearchError"""
+    async def run():
+        async with make_client(lambda request: httpx.Response(500)) as client:
+            await AsyncFlightSearch(client).search("SDF", "LAS", "1", "2", "2025-03-30")
+
+    with pytest.raises(FlightSearchError) as exc_info:
+        asyncio.run(run())
+    assert "Failed to search flights" in str(exc_info.value)
+
+def test_async_location_search(location_search_data):
+    """Test async location search normalization"""
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, json=location_search_data))
+        async with client:
+            return await AsyncLocationSearch(client=client).search("LAS")
+
+    response = asyncio.run(run())
+    assert isinstance(response, LocationResponse)
+    assert response.locations[1].code == "LAS"
+    assert response.locations[1].entity_id == "95673753"
+
+def test_async_location_models_match_sync(location_search_data):
+    from skyscanner_travel.services.skyscanner_client import normalize_locations
+    async def run():
+        client = make_client(lambda request: httpx.Response(200, json=location_search_data))
+        async with client:
+            return await client.search_location_models("LAS", trusted=True)
+
+    expected = LocationResponse.from_api_response(normalize_locations(location_search_data))
+    assert asyncio.run(run()) == expected
+
+def test_async_location_search_forbidden():
+    """Test that an invalid key raises LocationSearchError"""
+    async def run():
+        client = make_client(lambda request: httpx.Response(403))
+        async with client:
+            await AsyncLocationSearch(client=client).search("LAS")
+
+    with pytest.raises(LocationSearchError) as exc_info:
+        asyncio.run(run())
+    assert "API key is invalid or expired" in str(exc_info.value)
+
+def test_async_client_bounds_concurrency():
+    """Test that no more than max_concurrency requests are in flight"""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": []})
+
+    async def run():
+        async with make_client(handler, max_concurrency=3) as client:
+            await asyncio.gather(*(client.search_locations(str(i)) for i in range(20)))
+
+    asyncio.run(run())
+    assert peak == 3
+
+def test_async_client_cancellation_releases_slot():
+    """Test that cancelling a request frees its concurrency slot"""
+    async def handler(request):
+        if request.url.params["query"] == "slow":
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"data": []})
+
+    async def run():
+        async with make_client(handler, max_concurrency=1) as client:
+            task = asyncio.create_task(client.search_locations("slow"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await asyncio.wait_for(client.search_locations("fast"), timeout=1)
+
+    assert asyncio.run(run()) == {"data": []}
+
+def test_async_search_many(flight_search_data):
+    """Test that async batch searches report failures per query"""
+    def handler(request):
+        if request.url.params["date"] == "2025-03-31":
+            return httpx.Response(500)
+        return httpx.Response(200, json=flight_search_data)
+
+    async def run():
+        async with make_client(handler) as client:
+            queries = FlightQuery.date_range(
+                "2025-03-30", 3,
+                origin_sky_id="SDF",
+                destination_sky_id="LAS",
+                origin_entity_id="95673969",
+                destination_entity_id="95673753"
+            )
+            return [result async for result in AsyncFlightSearch(client).search_many(queries, ordered=True)]
+
+    results = asyncio.run(run())
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, FlightSearchError)
+
+def test_async_client_coalesces_identical_requests():
+    """Test that identical concurrent requests share one upstream call"""
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": []})
+
+    async def run():
+        async with make_client(handler) as client:
+            await asyncio.gather(*(client.search_locations("LAS") for _ in range(5)))
+            return client.coalesced_requests
+
+    assert asyncio.run(run()) == 4
+    assert calls == 1
+
+def test_async_client_retries_server_errors(flight_search_data):
+    """Test that transient 5xx responses are retried"""
+    responses = [httpx.Response(503), httpx.Response(200, json=flight_search_data)]
+
+    async def run():
+        policy = RetryPolicy(base_delay=0, uniform=lambda a, b: 0)
+        async with make_client(lambda request: responses.pop(0), retry_policy=policy) as client:
+            return await AsyncFlightSearch(client).search("SDF", "LAS", "1", "2", "2025-03-30")
+
+    assert asyncio.run(run()).total_results == len(flight_search_data['data']['itineraries'])
+
+def test_async_search_complete_polls_incomplete_endpoint(flight_search_data):
+    """Test that incomplete searches are polled through searchIncomplete"""
+    from skyscanner_travel.services.polling import PollPolicy
+    complete = json.loads(json.dumps(flight_search_data))
+    complete['data']['context']['status'] = 'complete'
+    complete['data']['itineraries'][0]['id'] = 'late-itinerary'
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("searchIncomplete"):
+            assert request.url.params["sessionId"] == flight_search_data['data']['context']['sessionId']
+            return httpx.Response(200, json=complete)
+        return httpx.Response(200, json=flight_search_data)
+
+    async def run():
+        updates = []
+        async with make_client(handler) as client:
+            service = AsyncFlightSearch(client, poll_policy=PollPolicy(initial_delay=0))
+            response = await service.search_complete("SDF", "LAS", "95673969", "95673753", "2025-03-30",
+                                                     on_update=updates.append)
+        return response, updates
+
+    response, updates = asyncio.run(run())
+    assert paths == ["/api/v2/flights/searchFlights", "/api/v2/flights/searchIncomplete"]
+    assert [f.id for f in updates[1].new] == ['late-itinerary'] and updates[1].complete
+    assert response.total_results == len(flight_search_data['data']['itineraries']) + 1
+
+def test_async_get_flight_details_many(flight_search_data):
+    """Test that concurrent detail lookups keep input order and mark failures"""
+    with open('tests/stubs/skyscanner_flight_details.json', 'r') as f:
+        details_data = json.load(f)
+
+    def handler(request):
+        if request.url.path.endswith("searchFlights"):
+            return httpx.Response(200, json=flight_search_data)
+        if request.url.params["itineraryId"] == flight_search_data['data']['itineraries'][1]['id']:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json=details_data)
+
+    async def run():
+        async with make_client(handler) as client:
+            service = AsyncFlightSearch(client)
+            response = await service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30")
+            return response.flights[:3], await service.get_flight_details_many(response.flights[:3], max_concurrency=2)
+
+    flights, results = asyncio.run(run())
+    assert [r.flight.id for r in results] == [f.id for f in flights]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.status_code == 404
+
+def test_async_search_prefetches_details_for_cheapest(flight_search_data):
+    """Test that async searches can start detail lookups for the cheapest flights"""
+    with open('tests/stubs/skyscanner_flight_details.json', 'r') as f:
+        details_data = json.load(f)
+
+    def handler(request):
+        if request.url.path.endswith("searchFlights"):
+            return httpx.Response(200, json=flight_search_data)
+        return httpx.Response(200, json=details_data)
+
+    async def run():
+        async with make_client(handler) as client:
+            service = AsyncFlightSearch(client)
+            response = await service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30", prefetch_details=3)
+            prefetch = response.prefetched_details
+            first = await prefetch.result(1)
+            return response, prefetch, first, await prefetch.results(timeout=5)
+
+    response, prefetch, first, results = asyncio.run(run())
+    cheapest = sorted(response.flights, key=lambda f: f.price.amount)[:3]
+    assert [f.id for f in prefetch.flights] == [f.id for f in cheapest]
+    assert first.ok and first.flight.id == cheapest[1].id
+    assert [r.ok for r in results] == [True, True, True]
+    assert prefetch.done()
+
+def test_async_client_reports_metrics(location_search_data):
+    """Test that async requests, retries and model building reach the hooks"""
+    from skyscanner_travel.services.instrumentation import MetricsCollector
+    statuses = iter([503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json=location_search_data if status == 200 else {})
+
+    metrics = MetricsCollector()
+    policy = RetryPolicy(max_attempts=2, sleep=lambda seconds: None, uniform=lambda a, b: 0.0)
+
+    async def run():
+        async with make_client(handler, hooks=[metrics], retry_policy=policy) as client:
+            return await AsyncLocationSearch(client=client).search("Las Vegas")
+
+    asyncio.run(run())
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["requests v1/flights/searchAirport 503"] == 1
+    assert snapshot["counters"]["requests v1/flights/searchAirport 200"] == 1
+    assert snapshot["counters"]["retries v1/flights/searchAirport ServerError"] == 1
+    assert snapshot["histograms"]["decode_seconds v1/flights/searchAirport"]["count"] == 1
+    assert snapshot["histograms"]["models_seconds v1/flights/searchAirport"]["count"] == 1
+
+def test_async_details_cache_hits_reach_the_hooks(flight_search_data):
+    """Test that detail views served from the details cache are counted as hits"""
+    from skyscanner_travel.services.details_cache import DetailsCache
+    from skyscanner_travel.services.instrumentation import MetricsCollector
+    with open('tests/stubs/skyscanner_flight_details.json', 'r') as f:
+        details_data = json.load(f)
+
+    def handler(request):
+        if request.url.path.endswith("searchFlights"):
+            return httpx.Response(200, json=flight_search_data)
+        return httpx.Response(200, json=details_data)
+
+    metrics = MetricsCollector()
+
+    async def run():
+        async with make_client(handler, hooks=[metrics], details_cache=DetailsCache()) as client:
+            service = AsyncFlightSearch(client)
+            flight = (await service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30")).flights[0]
+            await service.get_flight_details(flight)
+            await service.get_flight_details(flight)
+
+    asyncio.run(run())
+    counters = metrics.snapshot()["counters"]
+    assert counters["cache_hits v1/flights/getFlightDetails details"] == 1
+    assert counters["requests v1/flights/getFlightDetails 200"] == 1
+
+def test_async_deadline_bounds_a_hung_request():
+    """Test that a deadline cancels a request the server never answers"""
+    from skyscanner_travel.services.deadline import Deadline
+    from skyscanner_travel.services.exceptions import DeadlineExceededError
+
+    async def handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with make_client(handler) as client:
+            with pytest.raises(LocationSearchError) as excinfo:
+                await AsyncLocationSearch(client=client).search("Las Vegas", deadline=Deadline(0.1))
+            return excinfo.value
+
+    started = time.perf_counter()
+    error = asyncio.run(run())
+    assert time.perf_counter() - started < 2
+    assert isinstance(error.__cause__, DeadlineExceededError)
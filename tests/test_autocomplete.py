@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import pytest
+from unittest.mock import patch
+from skyscanner_travel.models.location import Location
+from skyscanner_travel.models.location_response import LocationResponse
+from skyscanner_travel.services.airport_index import LocationResolver, build_index
+from skyscanner_travel.services.autocomplete import LocationAutocomplete, fold
+from skyscanner_travel.services.location_search import AsyncLocationSearch, LocationSearch
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from skyscanner_travel.services.sqlite_cache import SQLiteCache
+
+STUB = os.path.join(os.path.dirname(__file__), "stubs", "skyscanner_location_search.json")
+
+ZURICH = Location(entityId="ZRH.AIRPORT", skyId="ZRH", name="Zürich", type="AIRPORT", city_name="Zürich")
+PARIS = {"places": [{"entityId": "PARI", "name": "Paris", "type": "CITY", "country": {"name": "France"}}]}
+
+
+@pytest.fixture
+def recorded():
+    with open(STUB, "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def locations(recorded):
+    return LocationResponse.from_search_airport(recorded).locations
+
+
+def codes(locations):
+    return [location.code for location in locations]
+
+
+def test_fold_ignores_case_accents_and_spacing():
+    assert fold("  ZÜRICH   Flughafen ") == "zurich flughafen"
+    assert fold("São Paulo") == "sao paulo"
+    assert fold("LAS") == "las"
+
+
+def test_ranks_exact_code_then_airports_then_cities(locations):
+    completer = LocationAutocomplete(locations)
+    # Name-start matches come before later-word matches (Santo Domingo Las Americas)
+    assert codes(completer.complete("las")) == ["LAS", "LRU", "LSP", "HSH", "VGT", "LKI", "SDQ", "LASA"]
+    assert codes(completer.complete("LASA")) == ["LASA"]
+    assert codes(completer.complete("veg")) == ["LAS", "VGT", "HSH", "LASA"]
+    assert codes(completer.complete("las vegas h")) == ["LAS", "HSH"]
+    assert codes(completer.complete("las", limit=2)) == ["LAS", "LRU"]
+    assert completer.complete("") == [] and completer.complete("xyz") == []
+
+
+def test_folds_queries_and_deduplicates(locations):
+    completer = LocationAutocomplete(locations)
+    assert completer.add([ZURICH, ZURICH]) == 1
+    assert completer.add(locations) == 0
+    assert len(completer) == len(locations) + 1
+    assert codes(completer.complete("zur")) == ["ZRH"]
+    assert codes(completer.complete("ZÜRI")) == ["ZRH"]
+
+
+def test_completions_run_safely_alongside_additions(locations):
+    from concurrent.futures import ThreadPoolExecutor
+    completer = LocationAutocomplete(locations)
+    extra = [Location(entityId=f"X{i}", skyId=f"X{i:03d}", name=f"Las Town {i}", type="CITY") for i in range(300)]
+
+    def work(i):
+        if i % 2:
+            assert completer.complete("las", limit=5)[0].code == "LAS"
+        else:
+            completer.add(extra[i // 2 * 5:i // 2 * 5 + 5])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(120)))
+    assert len(completer) == len(locations) + 300
+    assert len(completer.complete("las town", limit=500)) == 300
+
+
+def test_add_cached_reads_a_sqlite_location_cache(tmp_path, recorded):
+    client = SkyscannerClient("test_api_key", location_cache=SQLiteCache(str(tmp_path / "locations.db")))
+    with patch.object(client, "_make_request", return_value=recorded):
+        client.search_locations("Las Vegas")
+    completer = LocationAutocomplete()
+    assert completer.add_cached(client.location_cache) == 8
+    assert codes(completer.complete("las"))[0] == "LAS"
+
+
+def test_autocomplete_serves_keystrokes_locally_and_falls_back_to_the_api(tmp_path, locations):
+    path = str(tmp_path / "airports.idx")
+    build_index(locations, path)
+    search = LocationSearch(api_key="test_api_key", resolver=LocationResolver(path))
+    with patch.object(search.client, "_make_request", return_value=PARIS) as mock_request:
+        for typed in ("l", "la", "las", "las v"):
+            assert search.autocomplete(typed).locations[0].code == "LAS"
+        assert mock_request.call_count == 0
+
+        assert codes(search.autocomplete("Pari").locations) == ["PARI"]
+        assert mock_request.call_count == 1
+        assert codes(search.autocomplete("Paris").locations) == ["PARI"]
+        assert search.autocomplete("  ").total_results == 0
+        assert mock_request.call_count == 1
+
+
+def test_async_autocomplete_uses_the_given_completer(locations):
+    async def run():
+        search = AsyncLocationSearch(client=object(), completer=LocationAutocomplete(locations))
+        return await search.autocomplete("hend")
+
+    assert codes(asyncio.run(run()).locations) == ["HSH"]
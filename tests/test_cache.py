@@ -0,0 +1,97 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from skyscanner_travel.services.cache import MemoryCache, ResponseCache, make_cache_key
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_cache_key_normalizes_endpoint_and_params():
+    assert make_cache_key("/v1/flights/searchAirport/", {"query": "LAS", "locale": "en-US"}) == \
+        make_cache_key("v1/flights/searchAirport", {"locale": "en-US", "query": "LAS"})
+    assert make_cache_key("v1/a", {"query": "LAS"}) != make_cache_key("v1/a", {"query": "SDF"})
+
+def test_memory_cache_hit_and_miss(clock):
+    cache = MemoryCache(clock=clock)
+    assert cache.get("a") is None
+    cache.set("a", {"data": 1}, ttl=10)
+    assert cache.get("a") == {"data": 1}
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+def test_memory_cache_expires_entries(clock):
+    cache = MemoryCache(clock=clock)
+    cache.set("a", 1, ttl=10)
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+def test_memory_cache_evicts_least_recently_used(clock):
+    cache = MemoryCache(max_entries=2, clock=clock)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.get("a")
+    cache.set("c", 3, ttl=10)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+def test_memory_cache_byte_bound(clock):
+    cache = MemoryCache(max_bytes=100, clock=clock)
+    cache.set("a", 1, ttl=10, size=60)
+    cache.set("b", 2, ttl=10, size=60)
+    assert cache.get("a") is None
+    assert cache.stats.bytes == 60
+    cache.set("huge", 3, ttl=10, size=500)
+    assert cache.get("huge") is None
+
+def test_client_serves_repeat_location_searches_from_cache():
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": []}'
+    client = SkyscannerClient(api_key="test_api_key", cache=MemoryCache())
+
+    with patch('requests.Session.request') as mock_request:
+        mock_request.return_value = mock_response
+        client.search_locations("LAS")
+        client.search_locations("LAS")
+        client.search_locations("SDF")
+
+        assert mock_request.call_count == 2
+    assert client.cache.stats.hits == 1
+    assert client.cache.stats.bytes == 2 * len(mock_response.content)
+
+def test_client_per_endpoint_ttls():
+    client = SkyscannerClient(api_key="test_api_key", cache=MemoryCache(), cache_ttls={"/v2/flights/searchFlights/": 0})
+    assert client.cache_ttls["v2/flights/searchFlights"] == 0
+    assert client.cache_ttls["v1/flights/searchAirport"] > 0
+
+    mock_response = MagicMock()
+    mock_response.content = json.dumps({"data": {"itineraries": []}}).encode()
+    mock_response.status_code = 200
+    with patch('requests.Session.request') as mock_request:
+        mock_request.return_value = mock_response
+        client.search_flights("SDF", "LAS", "95673969", "95673753", "2025-03-30")
+        client.search_flights("SDF", "LAS", "95673969", "95673753", "2025-03-30")
+
+        assert mock_request.call_count == 2
+
+def test_incomplete_backend_fails_on_creation():
+    class GetOnly(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
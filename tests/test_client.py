@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from skyscanner_travel.services.skyscanner_client import SkyscannerClient
@@ -20,10 +21,10 @@ def test_client_initialization(client):
 def test_make_request_success(client):
     """Test successful API request"""
     mock_response = MagicMock()
-    mock_response.json.return_value = {"data": "success"}
+    mock_response.content = json.dumps({"data": "success"}).encode()
     mock_response.raise_for_status.return_value = None
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.return_value = mock_response
 
         response = client._make_request(
@@ -47,10 +48,10 @@ def test_make_request_success(client):
 def test_make_request_with_json_data(client):
     """Test API request with JSON data"""
     mock_response = MagicMock()
-    mock_response.json.return_value = {"data": "success"}
+    mock_response.content = json.dumps({"data": "success"}).encode()
     mock_response.raise_for_status.return_value = None
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.return_value = mock_response
 
         json_data = {"key": "value"}
@@ -77,7 +78,7 @@ def test_make_request_http_error(client):
     mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = requests.exceptions.RequestException("HTTP Error")
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.return_value = mock_response
 
         with pytest.raises(requests.exceptions.RequestException) as exc_info:
@@ -88,12 +89,77 @@ def test_make_request_http_error(client):
 def test_make_request_invalid_json(client):
     """Test API request with invalid JSON response"""
     mock_response = MagicMock()
-    mock_response.json.side_effect = ValueError("Invalid JSON")
+    mock_response.content = b"Invalid JSON"
 
-    with patch('requests.request') as mock_request:
+    with patch('requests.Session.request') as mock_request:
         mock_request.return_value = mock_response
 
         with pytest.raises(ValueError) as exc_info:
             client._make_request(endpoint="/test")
 
-        assert str(exc_info.value) == "Invalid JSON response: Invalid JSON"
\ No newline at end of file
+        assert str(exc_info.value).startswith("Invalid JSON response: ")
+
+def test_client_uses_pooled_session(client):
+    """Test that the client mounts a sized connection pool on its session"""
+    adapter = client.session.get_adapter(client.base_url)
+    assert adapter._pool_connections == client.pool_connections
+    assert adapter._pool_maxsize == client.pool_maxsize
+    assert client.session.headers["Connection"] == "keep-alive"
+
+def test_client_without_keep_alive():
+    """Test that disabling keep-alive closes connections after each request"""
+    client = SkyscannerClient(api_key="test_api_key", keep_alive=False)
+    assert client.session.headers["Connection"] == "close"
+
+def test_client_invalid_pool_size():
+    """Test that empty connection pools are rejected"""
+    with pytest.raises(ValueError):
+        SkyscannerClient(api_key="test_api_key", pool_maxsize=0)
+
+def test_client_context_manager_closes_session():
+    """Test that leaving the context manager closes the session"""
+    with patch('requests.Session.close') as mock_close:
+        with SkyscannerClient(api_key="test_api_key"):
+            pass
+    mock_close.assert_called_once()
+
+def test_requests_share_session(client):
+    """Test that every endpoint goes through the same session"""
+    mock_response = MagicMock()
+    mock_response.content = json.dumps({"data": []}).encode()
+    mock_response.status_code = 200
+
+    with patch('requests.Session.request') as mock_request:
+        mock_request.return_value = mock_response
+        client.search_locations("LAS")
+        client.search_flights("SDF", "LAS", "95673969", "95673753", "2025-03-30")
+
+        assert mock_request.call_count == 2
+
+def test_stream_search_flights_parses_incrementally(client):
+    """Streamed searches read the body in chunks and close the response"""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.iter_content.return_value = iter([b'{"sessionId": "s", "data": {"itin', b'eraries": [{"id": "a"}]}}'])
+
+    with patch('requests.Session.request', return_value=mock_response) as mock_request:
+        events = client.stream_search_flights(
+            origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="1",
+            destination_entity_id="2", date="2025-03-30")
+        mock_request.assert_not_called()
+        assert list(events) == [("sessionId", "s"), ("data.itineraries", {"id": "a"})]
+
+    assert mock_request.call_args[1]['stream'] is True
+    assert mock_request.call_args[1]['params']['originSkyId'] == "SDF"
+    mock_response.close.assert_called_once()
+
+def test_client_custom_base_url():
+    """Requests go to a configured base URL, e.g. a local fake server"""
+    client = SkyscannerClient(api_key="test_api_key", base_url="http://127.0.0.1:8080/api/")
+    assert client.base_url == "http://127.0.0.1:8080/api"
+    mock_response = MagicMock(status_code=200, headers={}, content=b"{}")
+    mock_response.content = json.dumps({"data": []}).encode()
+    with patch('requests.Session.request', return_value=mock_response) as mock_request:
+        client._make_request("v1/flights/searchAirport", params={"query": "LAS"})
+    assert mock_request.call_args[1]['url'] == "http://127.0.0.1:8080/api/v1/flights/searchAirport"
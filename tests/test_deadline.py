@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from skyscanner_travel.services.deadline import Deadline
+from skyscanner_travel.services.exceptions import DeadlineExceededError, ServerError
+from skyscanner_travel.services.ratelimit import RateLimiter
+from skyscanner_travel.services.retry import RetryPolicy
+from skyscanner_travel.services.singleflight import SingleFlight
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from skyscanner_travel.services.flight_search import FlightSearch
+from skyscanner_travel.services.location_search import LocationSearch, LocationSearchError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(status=200, payload=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload if payload is not None else {}).encode()
+    return response
+
+
+def load_stub(name):
+    with open(f"tests/stubs/{name}", "r") as f:
+        return json.load(f)
+
+
+def test_deadline_tracks_remaining_budget():
+    clock = FakeClock()
+    deadline = Deadline(2.0, clock=clock)
+    assert deadline.remaining() == 2.0
+    assert deadline.timeout(3.05, 30.0) == (2.0, 2.0)
+
+    clock.now = 1.5
+    assert deadline.timeout(0.2, 30.0) == (0.2, 0.5)
+    assert not deadline.expired
+
+    clock.now = 2.5
+    assert deadline.remaining() == 0.0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceededError):
+        deadline.check()
+    with pytest.raises(ValueError):
+        Deadline(-1)
+
+
+def test_deadline_exceeded_is_a_non_retryable_timeout():
+    from skyscanner_travel.services.exceptions import APITimeoutError
+    error = DeadlineExceededError("late")
+    assert isinstance(error, APITimeoutError)
+    assert not error.retryable
+
+
+def test_requests_get_default_timeouts():
+    client = SkyscannerClient("key")
+    with patch('requests.Session.request', return_value=make_response(payload={"data": []})) as mock_request:
+        client.search_locations("LAS")
+    assert mock_request.call_args[1]["timeout"] == (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+    with pytest.raises(ValueError):
+        SkyscannerClient("key", read_timeout=0)
+
+
+def test_chained_calls_share_the_remaining_budget():
+    clock = FakeClock()
+    deadline = Deadline(10.0, clock=clock)
+    client = SkyscannerClient("key", connect_timeout=2.0, read_timeout=8.0)
+    timeouts = []
+
+    def respond(method, url, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        clock.now += 4.0  # Each upstream call takes 4 seconds
+        if url.endswith("searchAirport"):
+            return make_response(payload=load_stub("skyscanner_location_search.json"))
+        return make_response(payload=load_stub("skyscanner_flight_search.json"))
+
+    with patch('requests.Session.request', side_effect=respond):
+        LocationSearch(client=client).search("Las Vegas", deadline=deadline)
+        FlightSearch(client).search("SDF", "LAS", "95673969", "95673753", "2025-03-30", deadline=deadline)
+
+    assert timeouts == [(2.0, 8.0), (2.0, 6.0)]
+
+
+def test_expired_deadline_fails_fast_without_a_request():
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+    clock.now = 1.0
+    client = SkyscannerClient("key")
+    with patch('requests.Session.request') as mock_request:
+        with pytest.raises(LocationSearchError) as excinfo:
+            LocationSearch(client=client).search("Las Vegas", deadline=deadline)
+    assert isinstance(excinfo.value.__cause__, DeadlineExceededError)
+    mock_request.assert_not_called()
+
+
+def test_retries_stop_when_the_deadline_cannot_be_met():
+    clock = FakeClock()
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, clock=clock, sleep=clock.sleep, uniform=lambda a, b: b)
+    deadline = Deadline(5.0, clock=clock)
+    client = SkyscannerClient("key", retry_policy=policy)
+    with patch('requests.Session.request', return_value=make_response(503)) as mock_request:
+        with pytest.raises(ServerError):
+            client.search_locations("LAS", deadline=deadline)
+    # Waits of 3s then 9s: the second retry would start after the deadline
+    assert mock_request.call_count == 2
+    assert clock.now == 3.0
+
+
+def test_timeout_after_deadline_is_reported_as_deadline_exceeded():
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+    client = SkyscannerClient("key")
+
+    def hang(method, url, **kwargs):
+        clock.now += kwargs["timeout"][1]
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    with patch('requests.Session.request', side_effect=hang) as mock_request:
+        with pytest.raises(DeadlineExceededError):
+            client.search_locations("LAS", deadline=deadline)
+    mock_request.assert_called_once()
+
+
+def test_rate_limit_wait_beyond_deadline_is_refused():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=0.1, burst=1, clock=clock, sleep=clock.sleep)
+    client = SkyscannerClient("key", rate_limiter=limiter)
+    with patch('requests.Session.request', return_value=make_response(payload={"data": []})) as mock_request:
+        client.search_locations("LAS", deadline=Deadline(5.0, clock=clock))
+        with pytest.raises(DeadlineExceededError):
+            client.search_locations("LV", deadline=Deadline(5.0, clock=clock))
+    assert mock_request.call_count == 1
+    assert clock.now == 0.0
+
+
+def test_singleflight_follower_stops_waiting_at_timeout():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do("key", lambda: release.wait(5)))
+    leader.start()
+    time.sleep(0.05)
+    try:
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            flight.do("key", lambda: None, timeout=0.05)
+        assert time.perf_counter() - start < 1.0
+    finally:
+        release.set()
+        leader.join()
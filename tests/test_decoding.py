@@ -0,0 +1,97 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from skyscanner_travel.services import decoding
+from skyscanner_travel.services.decoding import DECODERS, accept_encoding, get_decoder
+from skyscanner_travel.services.flight_search import FlightSearch
+from skyscanner_travel.services.ratelimit import RateLimiter
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from benchmarks.fake_server import FakeSkyScrapper
+
+ROUTE = dict(origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="95673969",
+             destination_entity_id="95673753", date="2025-03-30")
+
+
+def make_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def test_every_available_decoder_reads_bytes():
+    body = json.dumps({"data": [{"skyId": "LAS", "name": "Las Végas"}]}).encode()
+    for name, loads in DECODERS.items():
+        if loads is not None:
+            assert get_decoder(name)(body) == {"data": [{"skyId": "LAS", "name": "Las Végas"}]}
+
+
+def test_get_decoder_resolves_names_and_callables():
+    fastest = next(loads for loads in DECODERS.values() if loads is not None)
+    assert get_decoder() is fastest
+    assert get_decoder("json") is json.loads
+    custom = lambda body: {"custom": True}  # noqa: E731
+    assert get_decoder(custom) is custom
+    with pytest.raises(ValueError):
+        get_decoder("simdjson")
+
+
+def test_missing_backend_points_at_the_extra(monkeypatch):
+    monkeypatch.setitem(decoding.DECODERS, "orjson", None)
+    with pytest.raises(ImportError) as excinfo:
+        get_decoder("orjson")
+    assert "skyscanner-travel[fast]" in str(excinfo.value)
+    assert get_decoder() is not None
+
+
+def test_accept_encoding_offers_brotli_only_when_installed(monkeypatch):
+    assert accept_encoding(False) == "identity"
+    monkeypatch.setattr(decoding, "brotli", None)
+    assert accept_encoding() == "gzip, deflate"
+    monkeypatch.setattr(decoding, "brotli", object())
+    assert accept_encoding() == "gzip, deflate, br"
+
+
+def test_client_negotiates_compression():
+    assert SkyscannerClient("key").session.headers["Accept-Encoding"] == accept_encoding()
+    assert SkyscannerClient("key", compress=False).session.headers["Accept-Encoding"] == "identity"
+
+
+def test_client_decodes_with_the_configured_backend():
+    seen = []
+
+    def loads(body):
+        seen.append(body)
+        return json.loads(body)
+
+    client = SkyscannerClient("key", json_decoder=loads)
+    with patch('requests.Session.request', return_value=make_response(b'{"data": []}')):
+        assert client.search_locations("LAS") == {"data": []}
+    assert seen == [b'{"data": []}']
+
+
+def test_invalid_json_is_reported_for_every_backend():
+    for name, loads in DECODERS.items():
+        if loads is None:
+            continue
+        client = SkyscannerClient("key", json_decoder=name)
+        with patch('requests.Session.request', return_value=make_response(b"<html>")):
+            with pytest.raises(ValueError) as excinfo:
+                client.search_locations("LAS")
+        assert str(excinfo.value).startswith("Invalid JSON response: ")
+
+
+def test_gzip_responses_decode_end_to_end():
+    with FakeSkyScrapper(itineraries=20) as server:
+        limiter = RateLimiter(rate=1000, burst=100)
+        with SkyscannerClient("key", base_url=server.url, rate_limiter=limiter) as client:
+            raw = client.session.get(f"{server.url}/v2/flights/searchFlights", headers={"x-rapidapi-key": "key"}, stream=True)
+            assert raw.headers["Content-Encoding"] == "gzip"
+            assert int(raw.headers["Content-Length"]) == len(server.gzipped["/api/v2/flights/searchFlights"])
+            raw.close()
+            compressed = FlightSearch(client).search(**ROUTE)
+        with SkyscannerClient("key", base_url=server.url, rate_limiter=limiter, compress=False) as client:
+            plain = FlightSearch(client).search(**ROUTE)
+    assert compressed.total_results == plain.total_results == 20
+    assert [flight.id for flight in compressed.flights] == [flight.id for flight in plain.flights]
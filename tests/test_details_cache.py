@@ -0,0 +1,108 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from skyscanner_travel.models.flight import Flight
+from skyscanner_travel.services.details_cache import DetailsCache
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def details_params(itinerary_id="it-1", session_id="session-1", adults="1"):
+    return {"itineraryId": itinerary_id, "sessionId": session_id, "adults": adults, "cabinClass": "economy"}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    from skyscanner_travel.services.cache import MemoryCache
+    return DetailsCache(MemoryCache(clock=clock), session_ttl=600, clock=clock)
+
+
+def test_entries_are_keyed_by_itinerary_session_and_passengers(cache):
+    cache.set(details_params(), {"status": True})
+    assert cache.get(details_params()) == {"status": True}
+    assert cache.get(details_params(adults="2")) is None
+    assert cache.get(details_params(itinerary_id="it-2")) is None
+    assert cache.get(details_params(session_id="session-2")) is None
+
+
+def test_entries_expire_with_the_session(cache, clock):
+    cache.observe_search("search-a", "session-1")
+    clock.now = 500
+    cache.set(details_params(), {"status": True})
+    clock.now = 599
+    assert cache.get(details_params()) is not None
+    clock.now = 601
+    assert cache.get(details_params()) is None
+    cache.set(details_params(), {"status": True})
+    assert cache.get(details_params()) is None
+
+
+def test_new_session_for_same_search_invalidates_old_entries(cache):
+    cache.observe_search("search-a", "session-1")
+    cache.observe_search("search-b", "session-9")
+    cache.set(details_params(), {"status": True})
+    cache.set(details_params(session_id="session-9"), {"status": True})
+
+    cache.observe_search("search-a", "session-1")
+    assert cache.get(details_params()) is not None
+
+    cache.observe_search("search-a", "session-2")
+    assert cache.get(details_params()) is None
+    cache.set(details_params(), {"status": True})
+    assert cache.get(details_params()) is None
+    assert cache.get(details_params(session_id="session-9")) is not None
+
+
+def test_invalidate_session_reports_dropped_entries(cache):
+    cache.set(details_params(), {"status": True})
+    cache.set(details_params(itinerary_id="it-2"), {"status": True})
+    assert cache.invalidate_session("session-1") == 2
+    assert cache.get(details_params()) is None
+
+
+def test_stats_reports_backend_counters(cache):
+    cache.set(details_params(), {"status": True})
+    cache.get(details_params())
+    cache.get(details_params(itinerary_id="it-2"))
+    stats = DetailsCache().stats
+    assert (stats.hits, stats.misses) == (0, 0)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_client_serves_repeat_detail_views_from_cache():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        search_data = json.load(f)
+    with open('tests/stubs/skyscanner_flight_details.json', 'r') as f:
+        details_data = json.load(f)
+    client = SkyscannerClient(api_key="test_api_key", details_cache=DetailsCache())
+
+    def respond(method, url, **kwargs):
+        response = MagicMock(status_code=200, headers={}, content=b"{}")
+        response.content = json.dumps(details_data if "getFlightDetails" in url else dict(search_data, sessionId=sessions.pop(0))).encode()
+        return response
+
+    sessions = ["session-1", "session-2"]
+    route = dict(origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="95673969",
+                 destination_entity_id="95673753", date="2025-03-30")
+    with patch('requests.Session.request', side_effect=respond) as mock_request:
+        flight = Flight.parse_many(client.search_flights(**route))[0]
+        assert client.get_flight_details(flight) == details_data
+        assert client.get_flight_details(flight) == details_data
+        assert mock_request.call_count == 2
+
+        # A fresh search with a new session retires the old session's details
+        client.search_flights(**route)
+        client.get_flight_details(flight)
+        assert mock_request.call_count == 4
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from skyscanner_travel.models.flight_query import FlightQuery
+from skyscanner_travel.models.location import Location
+from skyscanner_travel.services.airport_index import AirportIndex, build_index
+from skyscanner_travel.services.exceptions import APITimeoutError
+from skyscanner_travel.services.entity_resolver import AsyncEntityResolver, EntityNotFoundError, EntityResolver
+from skyscanner_travel.services.flight_search import AsyncFlightSearch, FlightSearch, FlightSearchError
+from skyscanner_travel.services.skyscanner_client import (
+    SEARCH_AIRPORT_ENDPOINT,
+    SEARCH_FLIGHTS_ENDPOINT,
+    SkyscannerClient,
+)
+
+
+@pytest.fixture
+def location_data():
+    with open('tests/stubs/skyscanner_location_search.json', 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def flight_data():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        return json.load(f)
+
+
+class FakeAPI:
+    """Answers searchAirport with the stub, adding an airport for unknown codes."""
+
+    def __init__(self, location_data, flight_data, delay=0.0):
+        self.location_data = location_data
+        self.flight_data = flight_data
+        self.delay = delay
+        self.lookups = []
+        self.flights = []
+        self.lock = threading.Lock()
+
+    def airport(self, query):
+        data = [dict(item) for item in self.location_data["data"]]
+        if query == "XXX":
+            data = []
+        elif not any(item["skyId"] == query for item in data):
+            data.append(dict(data[1], skyId=query, entityId=f"id-{query}"))
+        return dict(self.location_data, data=data)
+
+    def __call__(self, endpoint, params=None, **kwargs):
+        with self.lock:
+            if endpoint == SEARCH_AIRPORT_ENDPOINT:
+                self.lookups.append(params["query"])
+            else:
+                self.flights.append(params)
+        time.sleep(self.delay)
+        if endpoint == SEARCH_AIRPORT_ENDPOINT:
+            if params["query"] == "TMO":
+                raise APITimeoutError("API request failed: read timed out")
+            return self.airport(params["query"])
+        assert endpoint == SEARCH_FLIGHTS_ENDPOINT
+        return self.flight_data
+
+
+@pytest.fixture
+def api(location_data, flight_data):
+    return FakeAPI(location_data, flight_data)
+
+
+@pytest.fixture
+def client(api):
+    client = SkyscannerClient("key")
+    with patch.object(client, "_make_request", side_effect=api):
+        yield client
+
+
+def test_resolve_picks_the_exact_code_and_remembers_it(client, api):
+    resolver = EntityResolver(client)
+    # LASA is listed before LAS in the response
+    assert resolver.resolve("las") == "95673753"
+    assert resolver.resolve("LAS ") == "95673753"
+    assert resolver.resolve("LASA") == "27542715"
+    assert api.lookups == ["LAS", "LASA"]
+    with pytest.raises(EntityNotFoundError):
+        resolver.resolve("XXX")
+
+
+def test_index_answers_without_a_request(client, api, tmp_path):
+    path = str(tmp_path / "airports.idx")
+    build_index([Location(entityId="95673969", skyId="SDF", name="Louisville", type="AIRPORT")], path)
+    with AirportIndex(path) as index:
+        resolver = EntityResolver(client, index=index)
+        assert resolver.cached("sdf") == "95673969"
+        assert resolver.resolve_many(["SDF", "LAS"]) == {"SDF": "95673969", "LAS": "95673753"}
+    assert api.lookups == ["LAS"]
+
+
+def test_resolve_many_dedupes_and_runs_concurrently(client, api):
+    api.delay = 0.05
+    resolver = EntityResolver(client)
+    started = time.perf_counter()
+    resolved = resolver.resolve_many(["JFK", "LAX", "jfk", "ORD", "LAX"])
+    elapsed = time.perf_counter() - started
+    assert resolved == {"JFK": "id-JFK", "LAX": "id-LAX", "jfk": "id-JFK", "ORD": "id-ORD"}
+    assert sorted(api.lookups) == ["JFK", "LAX", "ORD"]
+    assert elapsed < 3 * api.delay
+
+
+def test_resolve_many_reuses_one_pool(client, api):
+    with EntityResolver(client) as resolver:
+        resolver.resolve_many(["LAS"])
+        assert resolver._executor is None
+        resolver.resolve_many(["JFK", "LAX"])
+        pool = resolver._executor
+        resolver.resolve_many(["ORD", "SFO"])
+        assert resolver._executor is pool
+    assert resolver._executor is None
+    assert sorted(api.lookups) == ["JFK", "LAS", "LAX", "ORD", "SFO"]
+
+
+def test_resolve_many_return_exceptions(client):
+    resolver = EntityResolver(client)
+    with pytest.raises(EntityNotFoundError):
+        resolver.resolve_many(["LAS", "XXX"])
+    resolved = resolver.resolve_many(["LAS", "XXX"], return_exceptions=True)
+    assert resolved["LAS"] == "95673753"
+    assert isinstance(resolved["XXX"], EntityNotFoundError)
+
+
+def test_search_accepts_sky_ids_only(client, api):
+    response = FlightSearch(client).search("SDF", "LAS", date="2025-03-30")
+    assert len(response.flights) > 0
+    assert sorted(api.lookups) == ["LAS", "SDF"]
+    assert api.flights[0]["originEntityId"] == "id-SDF"
+    assert api.flights[0]["destinationEntityId"] == "95673753"
+
+    with pytest.raises(FlightSearchError):
+        FlightSearch(client).search("XXX", "LAS", date="2025-03-30")
+    with pytest.raises(TypeError):
+        FlightSearch(client).search("SDF", "LAS")
+
+
+def test_lookup_failures_are_wrapped_once(client):
+    service = FlightSearch(client)
+    with pytest.raises(FlightSearchError) as excinfo:
+        service.search("TMO", "LAS", date="2025-03-30")
+    assert str(excinfo.value) == "Failed to search flights: API request failed: read timed out"
+    assert isinstance(excinfo.value.__cause__, APITimeoutError)
+    assert excinfo.value.retryable
+
+    with pytest.raises(FlightSearchError) as excinfo:
+        list(service.iter_updates("TMO", "LAS", date="2025-03-30"))
+    assert isinstance(excinfo.value.__cause__, APITimeoutError)
+
+
+def test_search_many_resolves_a_route_matrix_once(client, api):
+    queries = FlightQuery.route_matrix(["SDF", "XXX"], ["LAS", "JFK", "SDF"], date="2025-03-30")
+    assert len(queries) == 5
+    results = list(FlightSearch(client).search_many(queries, ordered=True))
+    assert sorted(api.lookups) == ["JFK", "LAS", "SDF", "XXX"]
+    assert [result.ok for result in results] == [True, True, False, False, False]
+    assert results[0].query.origin_entity_id == "id-SDF"
+    assert results[1].query.destination_entity_id == "id-JFK"
+    assert isinstance(results[2].error, FlightSearchError)
+    assert isinstance(results[2].error.__cause__, EntityNotFoundError)
+    assert len(api.flights) == 2
+
+
+def test_async_search_many_resolves_sky_ids(location_data, flight_data):
+    httpx = pytest.importorskip("httpx")
+    from skyscanner_travel.services.async_client import AsyncSkyscannerClient
+    api = FakeAPI(location_data, flight_data)
+
+    def handler(request):
+        if request.url.path.endswith(SEARCH_AIRPORT_ENDPOINT):
+            api.lookups.append(request.url.params["query"])
+            return httpx.Response(200, json=api.airport(request.url.params["query"]))
+        api.flights.append(dict(request.url.params))
+        return httpx.Response(200, json=flight_data)
+
+    async def run():
+        async with AsyncSkyscannerClient(api_key="key", transport=httpx.MockTransport(handler)) as client:
+            service = AsyncFlightSearch(client, resolver=AsyncEntityResolver(client))
+            single = await service.search("SDF", "LAS", date="2025-03-30")
+            queries = FlightQuery.route_matrix(["SDF", "XXX"], ["LAS"], date="2025-03-30")
+            return single, [result async for result in service.search_many(queries, ordered=True)]
+
+    single, results = asyncio.run(run())
+    assert len(single.flights) > 0
+    assert [result.ok for result in results] == [True, False]
+    assert sorted(api.lookups) == ["LAS", "SDF", "XXX"]
+    assert all(flight["originEntityId"] == "id-SDF" for flight in api.flights)
+
+
+def test_search_many_reports_any_error_per_query(client, api, flight_data):
+    httpx = pytest.importorskip("httpx")
+    from skyscanner_travel.services.async_client import AsyncSkyscannerClient
+    # model_construct skips validation, so the search itself raises TypeError
+    queries = [
+        FlightQuery(origin_sky_id="SDF", destination_sky_id="LAS", date="2025-03-30"),
+        FlightQuery.model_construct(origin_sky_id="SDF", destination_sky_id="LAS", date=None),
+    ]
+
+    results = list(FlightSearch(client).search_many(queries, ordered=True))
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, TypeError)
+
+    def handler(request):
+        if request.url.path.endswith(SEARCH_AIRPORT_ENDPOINT):
+            return httpx.Response(200, json=api.airport(request.url.params["query"]))
+        return httpx.Response(200, json=flight_data)
+
+    async def run():
+        async with AsyncSkyscannerClient(api_key="key", transport=httpx.MockTransport(handler)) as client:
+            service = AsyncFlightSearch(client, resolver=AsyncEntityResolver(client))
+            return [result async for result in service.search_many(queries, ordered=True)]
+
+    results = asyncio.run(run())
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, TypeError)
@@ -0,0 +1,48 @@
+import pytest
+from skyscanner_travel.services.exceptions import RateLimitError, ServerError
+from skyscanner_travel.services.flight_search import FlightSearch
+from skyscanner_travel.services.ratelimit import RateLimiter
+from skyscanner_travel.services.retry import RetryPolicy
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from benchmarks.fake_server import FakeSkyScrapper, parse_latency
+
+ROUTE = dict(origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="95673969",
+             destination_entity_id="95673753", date="2025-03-30")
+
+
+def test_client_searches_against_fake_server():
+    with FakeSkyScrapper(itineraries=25, quota=100) as server:
+        limiter = RateLimiter(rate=1000, burst=100)
+        with SkyscannerClient("test_api_key", base_url=server.url, rate_limiter=limiter) as client:
+            response = FlightSearch(client).search(**ROUTE)
+            locations = client.search_locations("LAS")
+            assert FlightSearch(client).get_flight_details(response.flights[0]).booking_url
+    assert response.total_results == 25
+    assert len(locations["data"]) == 10
+    assert limiter.snapshot().limit == 100 and limiter.snapshot().remaining == 97
+
+
+def test_fake_server_injects_errors_and_quota_exhaustion():
+    with FakeSkyScrapper(error_rate=1.0) as server:
+        with SkyscannerClient("test_api_key", base_url=server.url, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            with pytest.raises(ServerError):
+                client.search_flights(**ROUTE)
+
+    with FakeSkyScrapper(quota=1, window=60) as server:
+        with SkyscannerClient("test_api_key", base_url=server.url, retry_policy=RetryPolicy(max_attempts=1)) as client:
+            client.search_locations("LAS")
+            with pytest.raises(RateLimitError) as error:
+                client.search_locations("SDF")
+    assert error.value.retry_after > 0
+    assert server.requests == {200: 1, 429: 1}
+
+
+def test_parse_latency():
+    import random
+    rng = random.Random(0)
+    assert parse_latency("none")(rng) == 0
+    assert parse_latency("fixed:0.25")(rng) == 0.25
+    assert 0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2
+    assert parse_latency("lognormal:0.05,0.5")(rng) > 0
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1")
@@ -1,4 +1,5 @@
 import pytest
+import json
 from datetime import datetime
 from skyscanner_travel.models.flight import Flight, Price, Stop
 from skyscanner_travel.models.location import Location
@@ -208,4 +209,51 @@ def test_flight_from_api_response():
     assert flight.stops == []
     assert flight.total_duration == '4h 10m'
     assert flight.itinerary_id == '16157-2503301340--31829-0-13411-2503301450'
-    assert flight.booking_url is None
\ No newline at end of file
+    assert flight.booking_url is None
+
+
+def test_parse_many_matches_per_itinerary_parsing():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        response = json.load(f)
+
+    flights = Flight.parse_many(response)
+
+    expected = [
+        Flight.from_api_response({"sessionId": response["sessionId"], "data": {"itineraries": [itinerary]}})
+        for itinerary in response["data"]["itineraries"]
+    ]
+    assert flights == expected
+    assert any(flight.stops for flight in flights)
+
+def test_parse_many_shares_locations():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        response = json.load(f)
+
+    flights = Flight.parse_many(response)
+
+    assert flights[0].origin is flights[1].origin
+    assert flights[0].session_id == response["sessionId"]
+
+def test_parse_many_empty_response():
+    assert Flight.parse_many({"sessionId": "abc", "data": {"itineraries": []}}) == []
+
+def test_parse_many_trusted_matches_validated():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        response = json.load(f)
+
+    trusted = Flight.parse_many(response, trusted=True)
+    validated = Flight.parse_many(response)
+
+    assert trusted == validated
+    assert [f.model_dump() for f in trusted] == [f.model_dump() for f in validated]
+    assert trusted[0].model_fields_set == validated[0].model_fields_set
+    assert trusted[0].origin.model_fields_set == validated[0].origin.model_fields_set
+    assert trusted[0].departure is not trusted[0].arrival
+
+def test_parse_many_trusted_rejects_unexpected_structure():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        response = json.load(f)
+    response["data"]["itineraries"][0]["legs"][0]["segments"][0]["flightNumber"] = 3109
+
+    with pytest.raises(ValueError):
+        Flight.parse_many(response, trusted=True)
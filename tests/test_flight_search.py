@@ -2,10 +2,12 @@ import pytest
 from unittest.mock import patch, MagicMock
 import json
 import os
+import time
 from datetime import datetime
 from skyscanner_travel.services.flight_search import FlightSearch, FlightSearchError
 from skyscanner_travel.models.flight import Flight
 from skyscanner_travel.models.flight_response import FlightSearchResponse
+from skyscanner_travel.models.flight_query import FlightQuery
 from skyscanner_travel.services.skyscanner_client import SkyscannerClient
 
 @pytest.fixture
@@ -107,4 +109,204 @@ def test_error_handling(flight_search):
             destination_entity_id="invalid",
             date="2025-03-30"
         )
-    assert "Failed to search flights" in str(exc_info.value)
\ No newline at end of file
+    assert "Failed to search flights" in str(exc_info.value)
+
+
+def test_search_many_yields_every_query(flight_search, mock_response_data):
+    queries = FlightQuery.date_range(
+        "2025-03-30", 5,
+        origin_sky_id="SDF",
+        destination_sky_id="LAS",
+        origin_entity_id="95673969",
+        destination_entity_id="95673753"
+    )
+    results = list(flight_search.search_many(queries, max_workers=3))
+    assert sorted(r.index for r in results) == [0, 1, 2, 3, 4]
+    assert all(r.ok for r in results)
+    assert results[0].response.total_results == len(mock_response_data['data']['itineraries'])
+    requested_dates = sorted(c.kwargs['date'] for c in flight_search.client.search_flights.call_args_list)
+    assert requested_dates == ["2025-03-30", "2025-03-31", "2025-04-01", "2025-04-02", "2025-04-03"]
+
+def test_search_many_reports_partial_failures(flight_search, mock_response_data):
+    def search_flights(**kwargs):
+        if kwargs['date'] == "2025-03-31":
+            raise Exception("API request failed: 500 Server Error")
+        return mock_response_data
+
+    flight_search.client.search_flights.side_effect = search_flights
+    queries = [
+        {"origin_sky_id": "SDF", "destination_sky_id": "LAS", "origin_entity_id": "1",
+         "destination_entity_id": "2", "date": d}
+        for d in ("2025-03-30", "2025-03-31", "2025-04-01")
+    ]
+    results = list(flight_search.search_many(queries, ordered=True))
+    assert [r.index for r in results] == [0, 1, 2]
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, FlightSearchError)
+    assert results[1].response is None
+
+def test_search_many_runs_concurrently(flight_search, mock_response_data):
+    def search_flights(**kwargs):
+        time.sleep(0.1)
+        return mock_response_data
+
+    flight_search.client.search_flights.side_effect = search_flights
+    queries = FlightQuery.date_range(
+        "2025-03-30", 8,
+        origin_sky_id="SDF",
+        destination_sky_id="LAS",
+        origin_entity_id="95673969",
+        destination_entity_id="95673753"
+    )
+    started = time.perf_counter()
+    results = list(flight_search.search_many(queries, max_workers=8))
+    assert len(results) == 8
+    assert time.perf_counter() - started < 0.5
+
+def test_trusted_search_matches_validated(mock_client):
+    kwargs = dict(
+        origin_sky_id="SDF",
+        destination_sky_id="LAS",
+        origin_entity_id="95673969",
+        destination_entity_id="95673753",
+        date="2025-03-30"
+    )
+    trusted = FlightSearch(mock_client, trusted=True).search(**kwargs)
+    validated = FlightSearch(mock_client).search(**kwargs)
+    assert trusted == validated
+
+def test_iter_search_matches_search(mock_client, mock_response_data):
+    from skyscanner_travel.services.streaming import iter_json_events
+    body = json.dumps(mock_response_data).encode("utf-8")
+    mock_client.stream_search_flights.side_effect = lambda **kwargs: iter_json_events(
+        (body[i:i + 256] for i in range(0, len(body), 256)), ["data.itineraries"])
+    route = dict(origin_sky_id="SDF", destination_sky_id="LAS", origin_entity_id="95673969",
+                 destination_entity_id="95673753", date="2025-03-30")
+
+    for trusted in (False, True):
+        service = FlightSearch(mock_client, trusted=trusted)
+        streamed = list(service.iter_search(**route))
+        assert [f.model_dump() for f in streamed] == [f.model_dump() for f in service.search(**route).flights]
+
+def test_iter_search_wraps_errors(mock_client):
+    from skyscanner_travel.services.streaming import iter_json_events
+    mock_client.stream_search_flights.side_effect = lambda **kwargs: iter_json_events(['{"status": false}'], ["data.itineraries"])
+    with pytest.raises(FlightSearchError):
+        list(FlightSearch(mock_client).iter_search("SDF", "LAS", "1", "2", "2025-03-30"))
+
+def incomplete_polls(mock_response_data):
+    """Two follow-up polls: one re-prices a flight, the next adds one and completes."""
+    import copy
+    first = copy.deepcopy(mock_response_data)
+    first['data']['itineraries'][0]['price']['raw'] += 10
+    second = copy.deepcopy(first)
+    extra = copy.deepcopy(second['data']['itineraries'][1])
+    extra['id'] = 'extra-itinerary'
+    second['data']['itineraries'].append(extra)
+    second['data']['context']['status'] = 'complete'
+    return [first, second]
+
+def test_iter_updates_polls_until_complete(mock_client, mock_response_data):
+    from skyscanner_travel.services.polling import PollPolicy
+    mock_client.search_incomplete.side_effect = incomplete_polls(mock_response_data)
+    sleeps = []
+    service = FlightSearch(mock_client, poll_policy=PollPolicy(initial_delay=0.5, sleep=sleeps.append))
+
+    updates = list(service.iter_updates("SDF", "LAS", "95673969", "95673753", "2025-03-30"))
+
+    itineraries = mock_response_data['data']['itineraries']
+    assert [u.poll for u in updates] == [0, 1, 2]
+    assert len(updates[0].new) == len(itineraries) and not updates[0].complete
+    assert updates[1].new == [] and [f.id for f in updates[1].repriced] == [itineraries[0]['id']]
+    assert [f.id for f in updates[2].new] == ['extra-itinerary'] and updates[2].repriced == []
+    assert updates[2].complete and updates[2].total_results == len(itineraries) + 1
+    assert sleeps == [0.5, 0.5]
+    session_id = mock_response_data['data']['context']['sessionId']
+    assert mock_client.search_incomplete.call_args.args == (session_id,)
+
+def test_search_complete_merges_polls(mock_client, mock_response_data):
+    from skyscanner_travel.services.polling import PollPolicy
+    mock_client.search_incomplete.side_effect = incomplete_polls(mock_response_data)
+    updates = []
+    service = FlightSearch(mock_client, poll_policy=PollPolicy(sleep=lambda delay: None))
+
+    response = service.search_complete("SDF", "LAS", "95673969", "95673753", "2025-03-30", on_update=updates.append)
+
+    itineraries = mock_response_data['data']['itineraries']
+    assert len(updates) == 3
+    assert [f.id for f in response.flights] == [i['id'] for i in itineraries] + ['extra-itinerary']
+    assert response.flights[0].price.amount == itineraries[0]['price']['raw'] + 10
+
+def test_iter_updates_respects_poll_budget(mock_client, mock_response_data):
+    from skyscanner_travel.services.polling import PollPolicy
+    mock_client.search_incomplete.return_value = mock_response_data
+    service = FlightSearch(mock_client, poll_policy=PollPolicy(max_polls=2, sleep=lambda delay: None))
+
+    updates = list(service.iter_updates("SDF", "LAS", "95673969", "95673753", "2025-03-30"))
+
+    assert len(updates) == 3
+    assert all(u.flights == [] for u in updates[1:])
+    assert not updates[-1].complete
+
+@pytest.fixture
+def details_client(mock_client):
+    with open('tests/stubs/skyscanner_flight_details.json', 'r') as f:
+        details_data = json.load(f)
+
+    def get_flight_details(flight, deadline=None):
+        time.sleep(0.05)
+        if flight.id.endswith("-fail"):
+            raise server_error()
+        return details_data
+
+    mock_client.get_flight_details.side_effect = get_flight_details
+    return mock_client
+
+def server_error():
+    from skyscanner_travel.services.exceptions import ServerError
+    return ServerError("API request failed: 503", status_code=503)
+
+def test_get_flight_details_many_keeps_order_and_marks_failures(details_client):
+    service = FlightSearch(details_client)
+    flights = service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30").flights[:6]
+    flights[2] = flights[2].model_copy(update={"id": flights[2].id + "-fail"})
+
+    start = time.perf_counter()
+    results = service.get_flight_details_many(flights, max_concurrency=6)
+    elapsed = time.perf_counter() - start
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.flight.id for r in results] == [f.id for f in flights]
+    assert [r.ok for r in results] == [True, True, False, True, True, True]
+    assert results[2].error.status_code == 503 and results[2].details is None
+    assert results[0].details.booking_url is not None
+    assert elapsed < 0.05 * 6
+
+def test_search_prefetches_details_for_cheapest(details_client):
+    service = FlightSearch(details_client)
+    response = service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30", prefetch_details=3)
+
+    prefetch = response.prefetched_details
+    cheapest = sorted(response.flights, key=lambda f: f.price.amount)[:3]
+    assert [f.id for f in prefetch.flights] == [f.id for f in cheapest]
+    assert prefetch.result(cheapest[1]).ok
+    assert all(r.ok for r in prefetch.results(timeout=5))
+    assert prefetch.done()
+    assert service.search("SDF", "LAS", "95673969", "95673753", "2025-03-30").prefetched_details is None
+
+def test_prefetch_result_timeouts(flight_search):
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+    from skyscanner_travel.services.details_prefetch import DetailsPrefetch
+
+    def fetch(flight):
+        if flight.id.endswith("-slow"):
+            time.sleep(0.2)
+        raise TimeoutError("read timed out")
+
+    flights = flight_search.search("SDF", "LAS", "95673969", "95673753", "2025-03-30").flights[:2]
+    flights[1] = flights[1].model_copy(update={"id": flights[1].id + "-slow"})
+    prefetch = DetailsPrefetch(fetch, flights, max_concurrency=2)
+    with pytest.raises(FutureTimeoutError):
+        prefetch.result(1, timeout=0.01)
+    assert isinstance(prefetch.result(0, timeout=1).error, TimeoutError)
+    assert isinstance(prefetch.result(1, timeout=1).error, TimeoutError)
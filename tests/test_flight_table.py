@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, time
+import pytest
+from skyscanner_travel.models.flight import Flight
+from skyscanner_travel.models.flight_response import FlightSearchResponse
+
+np = pytest.importorskip("numpy")
+from skyscanner_travel.models.flight_table import FlightTable
+
+@pytest.fixture
+def flights():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        return Flight.parse_many(json.load(f))
+
+@pytest.fixture
+def table(flights):
+    return FlightSearchResponse(
+        flights=flights,
+        total_results=len(flights),
+        currency="USD",
+        market="en-US",
+        locale="en-US",
+        country_code="US"
+    ).to_table()
+
+def test_table_columns(table, flights):
+    assert len(table) == len(flights)
+    assert table["price"].dtype == np.float64
+    assert table["stops"].tolist() == [len(f.stops) for f in flights]
+    assert table["airline"].tolist() == [f.airline for f in flights]
+    assert table["departure"][0] == np.datetime64(flights[0].departure["iso"])
+    assert table["duration"][0] == 250
+    assert table.codes("origin").dtype == np.int32
+    assert table.categories("origin") == ["SDF"]
+
+def test_table_materializes_original_flights(table, flights):
+    assert table.row(0) is flights[0]
+    assert table.to_flights() == flights
+    assert list(table) == flights
+
+def test_where(table, flights):
+    cheap_direct = table.where(max_price=600, max_stops=0)
+    expected = [f for f in flights if f.price.amount <= 600 and not f.stops]
+    assert cheap_direct.to_flights() == expected
+
+    morning = table.where(departs_after=time(6, 0), departs_before=time(11, 59))
+    assert all(6 <= datetime.fromisoformat(f.departure["iso"]).hour < 12 for f in morning)
+    assert len(table.where(airline="No Such Airline")) == 0
+
+def test_sort_and_top_k(table, flights):
+    by_price = sorted(flights, key=lambda f: f.price.amount)
+    assert table.sort("price").to_flights() == by_price
+    assert table.top_k(3).to_flights() == by_price[:3]
+    assert table.top_k(2, largest=True).to_flights() == by_price[::-1][:2]
+    assert table.sort("departure", descending=True).row(0).departure["iso"] == max(f.departure["iso"] for f in flights)
+
+def test_sort_is_stable_and_ranks_strings_by_value(table, flights):
+    by_stops = sorted(flights, key=lambda f: len(f.stops), reverse=True)
+    assert table.sort("stops", descending=True).to_flights() == by_stops
+    by_airline = sorted(flights, key=lambda f: f.airline)
+    assert table.sort("airline").to_flights() == by_airline
+    assert table.top_k(3, by="airline").to_flights() == by_airline[:3]
+    assert table.top_k(3, by="airline", largest=True).to_flights() == sorted(flights, key=lambda f: f.airline, reverse=True)[:3]
+
+def test_group_min(table, flights):
+    cheapest = {}
+    for flight in flights:
+        if flight.airline not in cheapest or flight.price.amount < cheapest[flight.airline].price.amount:
+            cheapest[flight.airline] = flight
+    result = table.group_min("airline", "price")
+    assert {f.airline: f for f in result} == cheapest
+    assert result["price"].tolist() == sorted(result["price"].tolist())
+
+def test_filter_mask(table):
+    mask = table["price"] > table["price"].mean()
+    assert len(table.filter(mask)) == int(mask.sum())
+    with pytest.raises(ValueError):
+        table.filter([True])
+
+def test_empty_table():
+    table = FlightTable.from_flights([])
+    assert len(table) == 0
+    assert len(table.group_min()) == 0
+    assert len(table.top_k(5)) == 0
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import pytest
+import skyscanner_travel
+from skyscanner_travel import models, services
+
+
+def loaded_after(statement, modules=("requests", "httpx", "numpy", "dotenv", "pydantic")):
+    """Run ``statement`` in a fresh interpreter and return which of ``modules`` it imported."""
+    code = f"import sys; {statement}; print(','.join(m for m in {modules!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(filter(None, completed.stdout.strip().split(",")))
+
+
+def test_package_import_loads_no_dependencies():
+    assert loaded_after("import skyscanner_travel") == set()
+
+
+def test_models_do_not_load_the_http_stack():
+    assert loaded_after("from skyscanner_travel import Location, Flight") == {"pydantic"}
+
+
+def test_sync_services_do_not_load_httpx_or_numpy():
+    loaded = loaded_after("from skyscanner_travel import FlightSearch, LocationSearch")
+    assert "requests" in loaded
+    assert not loaded & {"httpx", "numpy", "dotenv"}
+
+
+@pytest.mark.parametrize("package", [skyscanner_travel, models, services], ids=lambda p: p.__name__)
+def test_lazy_exports_resolve(package):
+    for name in package.__all__:
+        assert getattr(package, name).__name__ == name
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        skyscanner_travel.NotAThing
+    with pytest.raises(ImportError):
+        from skyscanner_travel import NotAThing  # noqa: F401
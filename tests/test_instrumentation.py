@@ -0,0 +1,174 @@
+import json
+import os
+import pytest
+import requests
+from unittest.mock import patch
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from skyscanner_travel.services.flight_search import FlightSearch
+from skyscanner_travel.services.location_search import LocationSearch, LocationSearchError
+from skyscanner_travel.services.cache import MemoryCache
+from skyscanner_travel.services.retry import RetryPolicy
+from skyscanner_travel.services.instrumentation import (
+    ClientHooks,
+    Histogram,
+    MetricsCollector,
+    OpenTelemetryHooks,
+    otel_metrics
+)
+
+STUBS = os.path.join(os.path.dirname(__file__), "stubs")
+
+
+def load_stub(name):
+    with open(os.path.join(STUBS, name), "rb") as f:
+        return f.read()
+
+
+def make_response(status=200, body=b"{}"):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+class Recorder(ClientHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, event):
+        self.events.append(event)
+
+    def on_request_end(self, event):
+        self.events.append(event)
+
+    def on_retry(self, event):
+        self.events.append(event)
+
+    def on_cache_hit(self, event):
+        self.events.append(event)
+
+    def on_parse(self, event):
+        self.events.append(event)
+
+
+def no_sleep_policy(**kwargs):
+    return RetryPolicy(sleep=lambda seconds: None, uniform=lambda a, b: 0.0, **kwargs)
+
+
+def test_search_emits_request_decode_and_model_events():
+    recorder = Recorder()
+    client = SkyscannerClient("key", hooks=[recorder])
+    with patch('requests.Session.request', return_value=make_response(body=load_stub("skyscanner_flight_search.json"))):
+        result = FlightSearch(client).search("SDF", "LAS", "95673969", "95673753", "2025-03-30")
+
+    kinds = [type(event).__name__ for event in recorder.events]
+    assert kinds == ["RequestStart", "RequestEnd", "ParseEvent", "ParseEvent"]
+    end = recorder.events[1]
+    assert end.endpoint == "v2/flights/searchFlights"
+    assert end.status == 200
+    assert end.bytes == len(load_stub("skyscanner_flight_search.json"))
+    assert end.error is None
+    decode, models = recorder.events[2:]
+    assert decode.stage == "decode"
+    assert models.stage == "models"
+    assert models.items == len(result.flights)
+
+
+def test_metrics_collector_counts_retries_and_errors():
+    metrics = MetricsCollector()
+    client = SkyscannerClient("key", hooks=[metrics], retry_policy=no_sleep_policy(max_attempts=3))
+    responses = [make_response(503, b"{}"), make_response(503, b"{}"),
+                 make_response(body=load_stub("skyscanner_location_search.json"))]
+    with patch('requests.Session.request', side_effect=responses):
+        LocationSearch(client=client).search("Las Vegas")
+
+    snapshot = metrics.snapshot()
+    counters = snapshot["counters"]
+    assert counters["requests v1/flights/searchAirport 503"] == 2
+    assert counters["requests v1/flights/searchAirport 200"] == 1
+    assert counters["errors v1/flights/searchAirport ServerError"] == 2
+    assert counters["retries v1/flights/searchAirport ServerError"] == 2
+    latency = snapshot["histograms"]["request_latency v1/flights/searchAirport"]
+    assert latency["count"] == 3
+    assert "models_seconds v1/flights/searchAirport" in snapshot["histograms"]
+
+
+def test_metrics_collector_counts_cache_hits():
+    metrics = MetricsCollector()
+    client = SkyscannerClient("key", hooks=[metrics], location_cache=MemoryCache())
+    with patch('requests.Session.request', return_value=make_response(body=load_stub("skyscanner_location_search.json"))) as mock_request:
+        client.search_locations("Las Vegas")
+        client.search_locations("Las Vegas")
+
+    assert mock_request.call_count == 1
+    counters = metrics.snapshot()["counters"]
+    assert counters["cache_hits v1/flights/searchAirport location"] == 1
+    assert counters["requests v1/flights/searchAirport 200"] == 1
+
+
+def test_authentication_failure_is_reported_without_printing(capsys):
+    metrics = MetricsCollector()
+    client = SkyscannerClient("key", hooks=[metrics])
+    with patch('requests.Session.request', return_value=make_response(403, b'{"message": "nope"}')):
+        with pytest.raises(LocationSearchError):
+            LocationSearch(client=client).search("Las Vegas")
+
+    assert capsys.readouterr().out == ""
+    assert metrics.snapshot()["counters"]["errors v1/flights/searchAirport AuthenticationError"] == 1
+
+
+def test_connection_errors_have_no_status():
+    recorder = Recorder()
+    client = SkyscannerClient("key", hooks=[recorder], retry_policy=no_sleep_policy(max_attempts=1))
+    with patch('requests.Session.request', side_effect=requests.exceptions.ConnectionError("refused")):
+        with pytest.raises(Exception):
+            client.search_locations("Las Vegas")
+
+    end = recorder.events[-1]
+    assert end.status is None
+    assert end.error == "APIConnectionError"
+
+
+def test_to_prometheus_renders_histograms_and_counters():
+    metrics = MetricsCollector()
+    client = SkyscannerClient("key", hooks=[metrics])
+    with patch('requests.Session.request', return_value=make_response(body=load_stub("skyscanner_location_search.json"))):
+        client.search_locations("Las Vegas")
+
+    text = metrics.to_prometheus()
+    assert "# TYPE skyscanner_request_latency histogram" in text
+    assert 'skyscanner_request_latency_bucket{endpoint="v1/flights/searchAirport",le="+Inf"} 1' in text
+    assert 'skyscanner_request_latency_count{endpoint="v1/flights/searchAirport"} 1' in text
+    assert "# TYPE skyscanner_requests_total counter" in text
+    assert 'skyscanner_requests_total{endpoint="v1/flights/searchAirport",status="200"} 1' in text
+
+    metrics.reset()
+    assert metrics.to_prometheus() == "\n"
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(1, 2, 4, 8))
+    for value in (0.5, 1.5, 1.5, 3, 7):
+        histogram.observe(value)
+
+    assert histogram.count == 5
+    assert histogram.min == 0.5
+    assert histogram.max == 7
+    assert histogram.quantile(0.0) == 0.5
+    assert 1 <= histogram.quantile(0.5) <= 2
+    assert histogram.quantile(1.0) == 7
+    assert Histogram().quantile(0.5) is None
+
+
+def test_clients_without_hooks_skip_instrumentation():
+    client = SkyscannerClient("key")
+    assert client.hooks == []
+    with patch('requests.Session.request', return_value=make_response(body=json.dumps({"data": []}).encode())):
+        assert client.search_locations("Las Vegas") is not None
+
+
+@pytest.mark.skipif(otel_metrics is not None, reason="opentelemetry-api is installed")
+def test_opentelemetry_hooks_require_the_extra():
+    with pytest.raises(ImportError):
+        OpenTelemetryHooks()
@@ -9,6 +9,27 @@ from skyscanner_travel.models.location import Location
 from skyscanner_travel.models.location_response import LocationResponse
 from skyscanner_travel.services.flight_search import FlightSearch
 
+with open(os.path.join(os.path.dirname(__file__), "stubs", "skyscanner_location_search.json")) as f:
+    V1_RESPONSE = json.load(f)
+
+SHAPES = {
+    "v1": V1_RESPONSE,
+    "v1_sparse": {"data": [{"entityId": "95673753.AIRPORT", "presentation": {"title": "Harry Reid"}}, {}]},
+    "places": {
+        "places": [
+            {"entityId": "DFW.CITY", "name": "Dallas", "type": "CITY", "city": {"name": "Dallas"},
+             "region": {"name": "Texas"}, "country": {"name": "United States"}, "distanceToCity": None},
+            {"entityId": "DAL.AIRPORT", "name": "Dallas Love Field", "type": "AIRPORT",
+             "distanceToCity": {"value": 9.5, "unit": "km"}},
+            {"entityId": "BAD", "name": None, "type": "AIRPORT"}
+        ]
+    },
+    "single": {"entityId": "LAS.AIRPORT", "name": "Las Vegas", "type": "AIRPORT", "country": {"name": "United States"}},
+    "empty_data": {"data": []},
+    "empty_object": {},
+}
+
+
 @pytest.fixture
 def mock_api_response():
     with patch('skyscanner_travel.services.skyscanner_client.SkyscannerClient._make_request') as mock_request:
@@ -156,4 +177,73 @@ def test_location_search_response_printing_airport_no_distance(mock_api_response
         mock_print.assert_any_call("Type: AIRPORT")
         mock_print.assert_any_call("Entity ID: DFW.AIRPORT")
         mock_print.assert_any_call("Country: United States")
-        mock_print.assert_any_call("Region: Texas")
\ No newline at end of file
+        mock_print.assert_any_call("Region: Texas")
+
+
+def test_construct_fills_every_pydantic_slot():
+    from pydantic import BaseModel
+    from skyscanner_travel.models.location import _construct
+    # _construct writes these slots directly; a pydantic upgrade that changes them must update it
+    assert BaseModel.__slots__ == ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+    values = dict(entity_id="95673753", code="LAS", name="Las Vegas", type="AIRPORT", city_name=None,
+                  region_name=None, country_name="United States", distance_to_city_value=None, distance_to_city_unit=None)
+    fast = _construct(Location, dict(values), {"entity_id", "code", "name", "type", "country_name"})
+    public = Location.model_construct(_fields_set={"entity_id", "code", "name", "type", "country_name"}, **values)
+    for slot in BaseModel.__slots__:
+        assert getattr(fast, slot) == getattr(public, slot)
+    assert fast == public == Location(entityId="95673753", skyId="LAS", name="Las Vegas", type="AIRPORT", country_name="United States")
+    assert fast.model_dump() == public.model_dump()
+    assert fast.model_copy(update={"name": "LAS"}).name == "LAS"
+
+
+def test_trusted_location_search_matches_validated(mock_api_response):
+    trusted = LocationSearch(api_key="test_api_key", trusted=True).search("Dallas")
+    validated = LocationSearch(api_key="test_api_key").search("Dallas")
+    assert trusted == validated
+    assert trusted.locations[0].model_dump() == validated.locations[0].model_dump()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize("shape", SHAPES)
+def test_single_pass_normalization_matches_two_pass(shape, trusted):
+    from skyscanner_travel.services.skyscanner_client import normalize_locations
+    raw = SHAPES[shape]
+    expected = LocationResponse.from_api_response(normalize_locations(raw), trusted=trusted)
+    result = LocationResponse.from_search_airport(raw, trusted=trusted)
+    assert result == expected
+    assert [l.model_fields_set for l in result.locations] == [l.model_fields_set for l in expected.locations]
+    assert result.total_results == expected.total_results
+
+
+def test_location_search_shares_the_location_cache():
+    from skyscanner_travel.services.cache import MemoryCache
+    from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+    client = SkyscannerClient("test_api_key", location_cache=MemoryCache())
+    with patch.object(client, "_make_request", return_value=SHAPES["v1"]) as mock_request:
+        fresh = LocationSearch(client=client).search("Las Vegas")
+        cached = LocationSearch(client=client).search("Las Vegas")
+        raw = client.search_locations("Las Vegas")
+    assert mock_request.call_count == 1
+    assert fresh == cached
+    assert len(raw["data"]) == len(fresh.locations)
+
+
+def test_location_models_build_once_from_the_raw_cached_response():
+    from skyscanner_travel.services.cache import MemoryCache
+    from skyscanner_travel.services.skyscanner_client import SkyscannerClient, location_cache_key
+    client = SkyscannerClient("test_api_key", location_cache=MemoryCache())
+    with patch.object(client, "_make_request", return_value=SHAPES["v1"]) as mock_request, \
+            patch('skyscanner_travel.services.skyscanner_client.normalize_locations', side_effect=AssertionError), \
+            patch.object(LocationResponse, "from_api_response", side_effect=AssertionError):
+        fresh = client.search_location_models("LAS")
+        cached = client.search_location_models("LAS")
+    assert mock_request.call_count == 1
+    assert fresh == cached == LocationResponse.from_search_airport(SHAPES["v1"])
+    assert client.location_cache.get(location_cache_key({"query": "LAS", "locale": "en-US"})) == SHAPES["v1"]
+
+
+def test_location_search_rejects_non_object_responses():
+    with patch('skyscanner_travel.services.skyscanner_client.SkyscannerClient._make_request', return_value=[]):
+        with pytest.raises(LocationSearchError) as exc_info:
+            LocationSearch(api_key="test_api_key").search("Dallas")
+    assert str(exc_info.value) == "Invalid API response format"
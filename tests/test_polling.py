@@ -0,0 +1,34 @@
+import pytest
+from skyscanner_travel.services.polling import PollPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_delay_backs_off_only_while_nothing_changes():
+    policy = PollPolicy(initial_delay=0.5, max_delay=3.0, backoff=2.0, clock=FakeClock())
+    assert policy.next_delay(0, None, False, 0.0) == 0.5
+    assert policy.next_delay(1, 0.5, False, 0.0) == 1.0
+    assert policy.next_delay(2, 1.0, False, 0.0) == 2.0
+    assert policy.next_delay(3, 2.0, False, 0.0) == 3.0
+    assert policy.next_delay(4, 3.0, True, 0.0) == 0.5
+
+
+def test_polling_stops_at_poll_and_time_budgets():
+    clock = FakeClock()
+    policy = PollPolicy(initial_delay=1.0, max_polls=3, max_elapsed=10.0, clock=clock)
+    assert policy.next_delay(3, 1.0, True, 0.0) is None
+    clock.now = 9.5
+    assert policy.next_delay(1, 1.0, True, 0.0) is None
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        PollPolicy(initial_delay=5.0, max_delay=1.0)
+    with pytest.raises(ValueError):
+        PollPolicy(backoff=0.5)
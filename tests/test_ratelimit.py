@@ -0,0 +1,118 @@
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from pydantic import ValidationError
+from skyscanner_travel.services.ratelimit import TokenBucket, RateLimiter
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_token_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+def test_rate_limiter_blocks_until_capacity(clock):
+    limiter = RateLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+    limiter.acquire("v2/flights/searchFlights")
+    limiter.acquire("v2/flights/searchFlights")
+    assert clock.slept == [pytest.approx(1.0)]
+
+def test_rate_limiter_per_endpoint_limits(clock):
+    limiter = RateLimiter(rate=100, burst=100, endpoint_limits={"/v2/flights/searchFlights": (1, 1)},
+                          clock=clock, sleep=clock.sleep)
+    limiter.acquire("v2/flights/searchFlights")
+    limiter.acquire("v1/flights/searchAirport")
+    assert clock.slept == []
+    limiter.acquire("v2/flights/searchFlights")
+    assert clock.slept == [pytest.approx(1.0)]
+
+def test_rate_limiter_waits_for_quota_reset(clock):
+    limiter = RateLimiter(rate=100, burst=100, clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({
+        "x-ratelimit-requests-limit": "100",
+        "x-ratelimit-requests-remaining": "1",
+        "x-ratelimit-requests-reset": "30"
+    })
+    limiter.acquire("v1/flights/searchAirport")
+    assert clock.slept == []
+    limiter.acquire("v1/flights/searchAirport")
+    assert clock.slept == [pytest.approx(30.0)]
+
+def test_rate_limiter_spreads_quota(clock):
+    limiter = RateLimiter(rate=10, burst=1, spread_quota=True, clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({
+        "x-ratelimit-requests-remaining": "60",
+        "x-ratelimit-requests-reset": "120"
+    })
+    assert limiter.snapshot().rate == pytest.approx(0.5)
+
+def test_rate_limiter_recovers_after_exhausted_quota(clock):
+    limiter = RateLimiter(rate=10, burst=1, spread_quota=True, clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({
+        "x-ratelimit-requests-remaining": "1",
+        "x-ratelimit-requests-reset": "20"
+    })
+    assert limiter.snapshot().rate == pytest.approx(0.05)
+    limiter.update_from_headers({
+        "x-ratelimit-requests-remaining": "0",
+        "x-ratelimit-requests-reset": "10"
+    })
+    assert limiter.snapshot().rate == pytest.approx(0.05)
+    limiter.acquire("v1/flights/searchAirport")
+    assert clock.slept == [pytest.approx(10.0)]
+    clock.now += 1
+    limiter.acquire("v1/flights/searchAirport")
+    assert limiter.snapshot().rate == 10
+    assert clock.slept[1:] == [pytest.approx(0.045)]
+
+def test_rate_limiter_snapshot_is_read_only(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({
+        "x-ratelimit-requests-limit": "500",
+        "x-ratelimit-requests-remaining": "42",
+        "x-ratelimit-requests-reset": "60"
+    })
+    snapshot = limiter.snapshot()
+    assert (snapshot.limit, snapshot.remaining, snapshot.reset_in) == (500, 42, 60)
+    with pytest.raises(ValidationError):
+        snapshot.remaining = 0
+
+def test_rate_limiter_ignores_missing_headers(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({})
+    assert limiter.snapshot().remaining is None
+
+def test_client_feeds_headers_to_limiter(clock):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": []}).encode()
+    mock_response.headers = {
+        "x-ratelimit-requests-limit": "100",
+        "x-ratelimit-requests-remaining": "99",
+        "x-ratelimit-requests-reset": "3600"
+    }
+    client = SkyscannerClient(api_key="test_api_key", rate_limiter=RateLimiter(clock=clock, sleep=clock.sleep))
+    assert client.quota.remaining is None
+
+    with patch('requests.Session.request', return_value=mock_response):
+        client.search_locations("LAS")
+
+    assert client.quota.remaining == 99
+    assert SkyscannerClient(api_key="test_api_key").quota is None
@@ -0,0 +1,118 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from skyscanner_travel.services.retry import RetryPolicy
+from skyscanner_travel.services.exceptions import (
+    SkyscannerAPIError,
+    AuthenticationError,
+    ClientError,
+    RateLimitError,
+    ServerError,
+    APITimeoutError,
+    error_for_status,
+    parse_retry_after
+)
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from skyscanner_travel.services.flight_search import FlightSearch, FlightSearchError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def make_policy(clock, **kwargs):
+    # Deterministic "jitter": always take the upper bound
+    return RetryPolicy(clock=clock, sleep=clock.sleep, uniform=lambda a, b: b, **kwargs)
+
+def flaky(errors, result="ok"):
+    errors = list(errors)
+
+    def fn():
+        if errors:
+            raise errors.pop(0)
+        return result
+    return fn
+
+def test_error_for_status_classification():
+    assert isinstance(error_for_status(403, "x"), AuthenticationError)
+    assert isinstance(error_for_status(404, "x"), ClientError)
+    assert isinstance(error_for_status(429, "x"), RateLimitError)
+    assert isinstance(error_for_status(502, "x"), ServerError)
+    assert error_for_status(503, "x").retryable
+    assert not error_for_status(400, "x").retryable
+    assert isinstance(error_for_status(500, "x"), requests.exceptions.RequestException)
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "7"}) == 7
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+def test_retry_policy_retries_transient_errors(clock):
+    policy = make_policy(clock, max_attempts=3, base_delay=0.1)
+    assert policy.call(flaky([ServerError("x"), APITimeoutError("x")])) == "ok"
+    assert clock.slept == [pytest.approx(0.3), pytest.approx(0.9)]
+
+def test_retry_policy_gives_up_after_max_attempts(clock):
+    policy = make_policy(clock, max_attempts=2)
+    with pytest.raises(ServerError):
+        policy.call(flaky([ServerError("x")] * 5))
+    assert len(clock.slept) == 1
+
+def test_retry_policy_does_not_retry_permanent_errors(clock):
+    policy = make_policy(clock)
+    with pytest.raises(ClientError):
+        policy.call(flaky([ClientError("x")]))
+    assert clock.slept == []
+
+def test_retry_policy_only_retries_idempotent_methods(clock):
+    policy = make_policy(clock)
+    with pytest.raises(ServerError):
+        policy.call(flaky([ServerError("x")]), method="POST")
+
+def test_retry_policy_honors_retry_after(clock):
+    policy = make_policy(clock, base_delay=0.1)
+    assert policy.call(flaky([RateLimitError("x", status_code=429, retry_after=5)])) == "ok"
+    assert clock.slept == [5]
+
+def test_retry_policy_respects_elapsed_budget(clock):
+    policy = make_policy(clock, max_attempts=10, max_elapsed=4)
+    with pytest.raises(RateLimitError):
+        policy.call(flaky([RateLimitError("x", retry_after=5)]))
+    assert clock.slept == []
+
+def test_client_raises_typed_errors_and_retries(clock):
+    failure = requests.Response()
+    failure.status_code = 503
+    failure.headers["Retry-After"] = "1"
+    success = MagicMock()
+    success.status_code = 200
+    success.content = json.dumps({"data": []}).encode()
+
+    client = SkyscannerClient(api_key="test_api_key", retry_policy=make_policy(clock))
+    with patch('requests.Session.request', side_effect=[failure, success]) as mock_request:
+        assert client.search_locations("LAS") == {"data": []}
+        assert mock_request.call_count == 2
+    assert clock.slept == [1]
+
+def test_flight_search_error_exposes_cause(clock):
+    failure = requests.Response()
+    failure.status_code = 500
+    client = SkyscannerClient(api_key="test_api_key", retry_policy=make_policy(clock, max_attempts=1))
+    with patch('requests.Session.request', return_value=failure):
+        with pytest.raises(FlightSearchError) as exc_info:
+            FlightSearch(client).search("SDF", "LAS", "1", "2", "2025-03-30")
+    assert isinstance(exc_info.value.__cause__, ServerError)
+    assert exc_info.value.retryable
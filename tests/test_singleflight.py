@@ -0,0 +1,104 @@
+import json
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from skyscanner_travel.services.singleflight import SingleFlight, AsyncSingleFlight
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+def test_singleflight_coalesces_threads():
+    group = SingleFlight()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"data": "shared"}
+
+    run_threads(10, lambda: results.append(group.do("key", fn)))
+    assert len(calls) == 1
+    assert group.coalesced == 9
+    assert all(r is results[0] for r in results)
+
+def test_singleflight_shares_errors():
+    group = SingleFlight()
+    errors = []
+
+    def fn():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            group.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    run_threads(5, call)
+    assert len(errors) == 5
+
+def test_singleflight_forgets_finished_calls():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == 1
+    assert group.do("key", lambda: 2) == 2
+    assert group.coalesced == 0
+
+def test_async_singleflight_coalesces_tasks():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    async def run():
+        return await asyncio.gather(*(group.do("key", fn) for _ in range(10)))
+
+    assert asyncio.run(run()) == ["shared"] * 10
+    assert len(calls) == 1
+    assert group.coalesced == 9
+
+def test_async_singleflight_survives_single_cancellation():
+    group = AsyncSingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    async def run():
+        first = asyncio.ensure_future(group.do("key", fn))
+        second = asyncio.ensure_future(group.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "shared"
+
+def test_client_coalesces_identical_requests():
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"data": {"itineraries": []}}).encode()
+
+    def slow_request(**kwargs):
+        time.sleep(0.1)
+        return mock_response
+
+    client = SkyscannerClient(api_key="test_api_key")
+    with patch('requests.Session.request', side_effect=slow_request) as mock_request:
+        run_threads(8, lambda: client.search_flights("SDF", "LAS", "95673969", "95673753", "2025-03-30"))
+        assert mock_request.call_count == 1
+    assert client.coalesced_requests == 7
+
+def test_client_coalescing_can_be_disabled():
+    client = SkyscannerClient(api_key="test_api_key", coalesce=False)
+    assert client.coalesced_requests == 0
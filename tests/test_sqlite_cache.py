@@ -0,0 +1,105 @@
+import threading
+import pytest
+from unittest.mock import patch
+from skyscanner_travel.services.sqlite_cache import SQLiteCache, main
+from skyscanner_travel.services.skyscanner_client import SkyscannerClient
+from skyscanner_travel.services.location_search import LocationSearch
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "locations.db")
+
+def test_sqlite_cache_round_trip(cache_path, clock):
+    cache = SQLiteCache(cache_path, clock=clock)
+    assert cache.get("LAS") is None
+    cache.set("LAS", {"data": [{"id": "95673753", "code": "LAS"}]}, ttl=60)
+    assert cache.get("LAS") == {"data": [{"id": "95673753", "code": "LAS"}]}
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.bytes > 0
+
+def test_sqlite_cache_uses_wal(cache_path):
+    cache = SQLiteCache(cache_path)
+    assert cache._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_sqlite_cache_shared_between_instances(cache_path, clock):
+    SQLiteCache(cache_path, clock=clock).set("LAS", {"data": []}, ttl=60)
+    assert SQLiteCache(cache_path, clock=clock).get("LAS") == {"data": []}
+
+def test_sqlite_cache_expiry_and_compaction(cache_path, clock):
+    cache = SQLiteCache(cache_path, clock=clock)
+    cache.set("old", 1, ttl=10)
+    cache.set("new", 2, ttl=100)
+    clock.now += 50
+    assert cache.get("old") is None
+    assert cache.stats.expirations == 1
+    assert cache.compact() == 1
+    assert cache.get("new") == 2
+    assert cache.stats.entries == 1
+
+def test_sqlite_cache_concurrent_writers(cache_path):
+    cache = SQLiteCache(cache_path)
+
+    def write(worker):
+        for i in range(20):
+            cache.set(f"{worker}-{i}", {"i": i}, ttl=60)
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.stats.entries == 80
+
+def test_sqlite_cache_compact_command(cache_path, capsys):
+    SQLiteCache(cache_path).set("LAS", 1, ttl=60)
+    main(["stats", cache_path])
+    assert "Entries: 1" in capsys.readouterr().out
+    main(["compact", cache_path])
+    assert "Removed 0 expired entries" in capsys.readouterr().out
+
+def test_location_search_uses_location_cache(cache_path):
+    places = {'places': [{'entityId': 'DFW.CITY', 'name': 'Dallas', 'type': 'CITY',
+                          'city': {'name': 'Dallas'}, 'region': {'name': 'Texas'},
+                          'country': {'name': 'United States'}, 'distanceToCity': None}]}
+    with patch('skyscanner_travel.services.skyscanner_client.SkyscannerClient._make_request') as mock_request:
+        mock_request.return_value = places
+        client = SkyscannerClient(api_key="test_api_key", location_cache=SQLiteCache(cache_path))
+        LocationSearch(client=client).search("Dallas")
+
+        # A fresh worker process opening the same database skips the API
+        restarted = SkyscannerClient(api_key="test_api_key", location_cache=SQLiteCache(cache_path))
+        response = LocationSearch(client=restarted).search("Dallas")
+
+        assert mock_request.call_count == 1
+    assert response.locations[0].entity_id == "DFW.CITY"
+    assert response.locations[0].region_name == "Texas"
+
+def test_location_cache_ignores_entries_in_the_old_normalized_format(cache_path):
+    from skyscanner_travel.services.autocomplete import LocationAutocomplete
+    from skyscanner_travel.services.cache import make_cache_key
+    from skyscanner_travel.services.skyscanner_client import SEARCH_AIRPORT_ENDPOINT, normalize_locations
+    places = {'places': [{'entityId': 'DFW.CITY', 'name': 'Dallas', 'type': 'CITY', 'country': {'name': 'United States'}}]}
+    cache = SQLiteCache(cache_path)
+    # Earlier versions stored normalized records under the bare endpoint key
+    cache.set(make_cache_key(SEARCH_AIRPORT_ENDPOINT, {"query": "Dallas", "locale": "en-US"}), normalize_locations(places), ttl=60)
+    assert LocationAutocomplete().add_cached(cache) == 0
+
+    client = SkyscannerClient(api_key="test_api_key", location_cache=cache)
+    with patch.object(client, "_make_request", return_value=places) as mock_request:
+        response = client.search_location_models("Dallas")
+        assert client.search_location_models("Dallas") == response
+    assert mock_request.call_count == 1
+    assert response.locations[0].entity_id == "DFW.CITY"
+    assert LocationAutocomplete().add_cached(cache) == 1
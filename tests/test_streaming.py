@@ -0,0 +1,58 @@
+import json
+import pytest
+from skyscanner_travel.services.streaming import iter_json_events
+
+
+def chunked(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def payload():
+    with open('tests/stubs/skyscanner_flight_search.json', 'r') as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096, 1 << 20])
+def test_streamed_itineraries_match_full_parse(payload, size):
+    events = list(iter_json_events(chunked(json.dumps(payload), size), ["data.itineraries"]))
+    itineraries = [value for path, value in events if path == "data.itineraries"]
+    assert itineraries == payload["data"]["itineraries"]
+    values = dict((path, value) for path, value in events if path != "data.itineraries")
+    assert values["sessionId"] == payload["sessionId"]
+    assert values["data.context"] == payload["data"]["context"]
+
+
+def test_events_arrive_before_the_body_ends():
+    chunks = iter(chunked('{"sessionId": "s", "data": {"itineraries": [{"id": "a"}, {"id": "b"}', 5))
+
+    def body():
+        yield from chunks
+        raise AssertionError("Read past the second itinerary")
+
+    events = iter_json_events(body(), ["data.itineraries"])
+    assert next(events) == ("sessionId", "s")
+    assert next(events) == ("data.itineraries", {"id": "a"})
+
+
+def test_numbers_split_across_chunks():
+    events = list(iter_json_events(["{\"a\": 12", "34, \"b\": [1", "0, 2]}"], ["b"]))
+    assert events == [("a", 1234), ("b", 10), ("b", 2)]
+
+
+def test_multibyte_characters_split_across_chunks():
+    events = list(iter_json_events(chunked('{"city": "Zürich"}', 1), []))
+    assert events == [("city", "Zürich")]
+
+
+def test_empty_containers_and_non_object_values():
+    assert list(iter_json_events(['{"data": {}, "x": []}'], ["data.itineraries", "x"])) == []
+    assert list(iter_json_events(['{"data": null}'], ["data.itineraries"])) == [("data", None)]
+    assert list(iter_json_events(['[1, 2]'], ["data.itineraries"])) == [("", [1, 2])]
+
+
+@pytest.mark.parametrize("body", ['{"data": {"itineraries": [{"id": 1}', '{"a" 1}', '{"a": tru}', ''])
+def test_invalid_json_raises_value_error(body):
+    with pytest.raises(ValueError, match="Invalid JSON response"):
+        list(iter_json_events([body], ["data.itineraries"]))